@@ -4,7 +4,9 @@ Konfigurasi lanjutan untuk multi-pair trading dengan Telegram news
 """
 
 import os
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
+
+from pair_index import PairOrientationIndex
 
 # ============================================================
 # CONTOH 1: CONSERVATIVE TRADING (Low Risk)
@@ -68,6 +70,9 @@ pair_groups = {
     ]
 }
 
+# Orientation index semua pairs di pair_groups (dibangun sekali saat import)
+PAIR_INDEX = PairOrientationIndex(pair for group in pair_groups.values() for pair in group)
+
 # ============================================================
 # SENTIMENT STRENGTH THRESHOLDS
 # ============================================================
@@ -310,38 +315,51 @@ def calculate_lot_size_from_risk(
     return lot_size
 
 
-def get_optimal_pairs_for_currency(currency: str, signal: str) -> List[str]:
+def get_optimal_pairs_for_currency(
+    currency: str,
+    signal: str,
+    index: Optional[PairOrientationIndex] = None
+) -> List[str]:
     """
     Get optimal pairs to trade based on currency and signal
     
     Args:
         currency: Currency code (e.g. 'EUR', 'USD')
         signal: 'LONG' or 'SHORT'
+        index: PairOrientationIndex dari broker symbols (default: PAIR_INDEX)
     
     Returns:
-        List of recommended pairs
+        List of recommended pairs (arah order: get_optimal_legs_for_currency)
     
     Example:
-        >>> get_optimal_pairs_for_currency('EUR', 'LONG')
-        ['EURUSD', 'EURJPY', 'EURGBP']  # Buy EUR against others
+        >>> get_optimal_pairs_for_currency('EUR', 'LONG')[:3]
+        ['EURGBP', 'EURUSD', 'EURJPY']  # Buy EUR against others
+    """
+    return [pair for pair, _ in get_optimal_legs_for_currency(currency, signal, index)]
+
+
+def get_optimal_legs_for_currency(
+    currency: str,
+    signal: str,
+    index: Optional[PairOrientationIndex] = None
+) -> List[Tuple[str, str]]:
     """
-    major_currencies = ['USD', 'EUR', 'GBP', 'JPY', 'AUD', 'CAD', 'CHF', 'NZD']
-    pairs = []
+    Get pairs + arah order untuk currency dan signal
     
-    if signal == 'LONG':
-        # Buy the currency - so it should be base currency
-        for other in major_currencies:
-            if currency != other:
-                pair = f"{currency}{other}"
-                pairs.append(pair)
-    else:  # SHORT
-        # Sell the currency - so it should be quote currency
-        for other in major_currencies:
-            if currency != other:
-                pair = f"{other}{currency}"
-                pairs.append(pair)
+    Args:
+        currency: Currency code (e.g. 'EUR', 'USD')
+        signal: 'LONG' (bullish currency) or 'SHORT' (bearish currency)
+        index: PairOrientationIndex dari broker symbols, dibangun sekali oleh
+            caller (default: PAIR_INDEX)
+    
+    Returns:
+        List of (pair, side) - side 'LONG' = BUY, 'SHORT' = SELL
     
-    return pairs
+    Example:
+        >>> get_optimal_legs_for_currency('USD', 'LONG')[:2]
+        [('EURUSD', 'SHORT'), ('GBPUSD', 'SHORT')]  # Sell EUR/GBP against USD
+    """
+    return list((index if index is not None else PAIR_INDEX).lookup(currency, signal))
 
 
 def filter_by_correlation(pairs: List[str], max_correlated: int = 3) -> List[str]:
@@ -460,8 +478,8 @@ if __name__ == "__main__":
     
     # Example 2: Get optimal pairs
     print("2. Optimal pairs for EUR bullish:")
-    pairs = get_optimal_pairs_for_currency('EUR', 'LONG')
-    print(f"   {', '.join(pairs[:5])}\n")
+    legs = get_optimal_legs_for_currency('EUR', 'LONG')
+    print(f"   {', '.join(f'{pair} {side}' for pair, side in legs[:5])}\n")
     
     # Example 3: Filter by correlation
     print("3. Filter correlated pairs:")
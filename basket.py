@@ -0,0 +1,247 @@
+"""
+Basket Execution
+Multi-pair order baskets: prepare semua legs, validasi (order_check + margin), submit back to back
+"""
+
+import asyncio
+import time
+from typing import Dict, List, Optional
+
+from mt5_gateway import PRIORITY_ORDER
+
+
+class BasketLeg:
+    """Satu order di basket, plus hasil validasi & fill"""
+
+    __slots__ = ('symbol', 'signal', 'request', 'point', 'decision_price', 'reference_price',
+                 'check_retcode', 'check_comment', 'margin', 'rejected',
+                 'sent_at', 'done_at', 'retcode', 'comment', 'order', 'fill_price')
+
+    def __init__(self, symbol: str, signal: str, request: Dict, point: float):
+        """
+        Args:
+            symbol: Broker symbol
+            signal: 'LONG' atau 'SHORT'
+            request: Order request (dari SymbolSpec.order_request)
+            point: Symbol point (untuk slippage dalam points)
+        """
+        self.symbol = symbol
+        self.signal = signal
+        self.request = request
+        self.point = point
+        self.decision_price = request['price']
+        # Harga leg ini saat leg pertama basket dikirim (basis slippage)
+        self.reference_price: Optional[float] = None
+
+        self.check_retcode: Optional[int] = None
+        self.check_comment = ''
+        self.margin: Optional[float] = None
+        self.rejected: Optional[str] = None
+
+        self.sent_at: Optional[float] = None
+        self.done_at: Optional[float] = None
+        self.retcode: Optional[int] = None
+        self.comment = ''
+        self.order: Optional[int] = None
+        self.fill_price: Optional[float] = None
+
+    @property
+    def latency_ms(self) -> Optional[float]:
+        """order_send round-trip"""
+        if self.sent_at is None or self.done_at is None:
+            return None
+        return (self.done_at - self.sent_at) * 1000
+
+    @property
+    def slippage_points(self) -> Optional[float]:
+        """
+        Fill vs harga leg ini saat leg pertama dikirim (positif = lebih buruk)
+
+        Semua legs diukur terhadap momen yang sama (first leg), jadi slippage
+        mencakup drift selama legs sebelumnya dikirim. Fallback ke harga saat
+        basket disiapkan jika snapshot tidak tersedia.
+        """
+        if self.fill_price is None or not self.point:
+            return None
+        reference = self.reference_price if self.reference_price is not None else self.decision_price
+        move = self.fill_price - reference
+        return (move if self.signal == 'LONG' else -move) / self.point
+
+
+class BasketReport:
+    """Ringkasan satu basket"""
+
+    def __init__(self, legs: List[BasketLeg], done_retcodes):
+        self.legs = legs
+        self._done = done_retcodes
+
+    @property
+    def filled(self) -> List[BasketLeg]:
+        return [leg for leg in self.legs if leg.retcode in self._done]
+
+    @property
+    def rejected(self) -> List[BasketLeg]:
+        return [leg for leg in self.legs if leg.rejected]
+
+    @property
+    def first_sent(self) -> Optional[float]:
+        sent = [leg.sent_at for leg in self.legs if leg.sent_at is not None]
+        return min(sent) if sent else None
+
+    def offset_ms(self, leg: BasketLeg) -> Optional[float]:
+        """Fill time relatif terhadap order pertama di basket"""
+        first = self.first_sent
+        if first is None or leg.done_at is None:
+            return None
+        return (leg.done_at - first) * 1000
+
+    def lines(self) -> List[str]:
+        """Per-leg report untuk log"""
+        lines = []
+        for leg in self.legs:
+            if leg.rejected:
+                lines.append(f"⛔ {leg.symbol} {leg.signal}: {leg.rejected}")
+            elif leg.retcode not in self._done:
+                lines.append(f"❌ {leg.symbol} {leg.signal}: {leg.comment or leg.retcode}")
+            else:
+                slippage = leg.slippage_points
+                line = (f"✅ {leg.symbol} {leg.signal} #{leg.order} @ {leg.fill_price:.5f} | "
+                        f"+{self.offset_ms(leg):.1f} ms from first leg, send {leg.latency_ms:.1f} ms")
+                if slippage is not None:
+                    line += f" | slippage {slippage:+.1f} pts vs first leg"
+                lines.append(line)
+        return lines
+
+    def stats(self) -> Dict:
+        filled = self.filled
+        slippage = [leg.slippage_points for leg in filled if leg.slippage_points is not None]
+        offsets = [self.offset_ms(leg) for leg in filled]
+        return {
+            'legs': len(self.legs),
+            'rejected': len(self.rejected),
+            'filled': len(filled),
+            'spread_ms': round(max(offsets), 3) if offsets else None,
+            'avg_slippage_points': round(sum(slippage) / len(slippage), 2) if slippage else None
+        }
+
+
+class BasketExecutor:
+    """
+    Validasi & submit basket lewat MT5Gateway.
+
+    Validasi (account_info, order_check dan order_calc_margin per leg)
+    jalan sebagai satu gateway queue item. Leg yang gagal order_check, atau
+    yang membuat total margin melewati max_margin_usage x free margin,
+    di-drop sebelum order pertama dikirim. Sisanya dikirim back to back:
+    leg_delay=0 berarti semua order_send dalam satu queue item (tidak
+    diselingi tick collector), leg_delay>0 memberi jeda antar leg tanpa
+    memblokir event loop.
+    """
+
+    def __init__(self, gateway, leg_delay: float = 0.0, max_margin_usage: float = 0.9):
+        """
+        Initialize executor
+
+        Args:
+            gateway: MT5Gateway
+            leg_delay: Jeda antar leg (detik)
+            max_margin_usage: Maksimal fraksi free margin yang dipakai satu basket
+        """
+        self.gateway = gateway
+        self.leg_delay = leg_delay
+        self.max_margin_usage = max_margin_usage
+
+        module = gateway.module
+        self.done_retcodes = frozenset({
+            module.TRADE_RETCODE_DONE,
+            getattr(module, 'TRADE_RETCODE_PLACED', module.TRADE_RETCODE_DONE),
+            getattr(module, 'TRADE_RETCODE_DONE_PARTIAL', module.TRADE_RETCODE_DONE)
+        })
+
+        # Stats
+        self.baskets = 0
+        self.legs_sent = 0
+        self.legs_rejected = 0
+
+    def check_legs(self, module, legs: List[BasketLeg]) -> Optional[float]:
+        """Jalan di gateway thread: order_check + margin per leg, return free margin"""
+        account = module.account_info()
+        for leg in legs:
+            check = module.order_check(leg.request)
+            if check is None:
+                leg.check_comment = str(module.last_error())
+            else:
+                leg.check_retcode = check.retcode
+                leg.check_comment = check.comment
+            leg.margin = module.order_calc_margin(
+                leg.request['type'], leg.symbol, leg.request['volume'], leg.request['price']
+            )
+        return account.margin_free if account is not None else None
+
+    def snapshot_reference(self, module, legs: List[BasketLeg]):
+        """Harga semua legs tepat sebelum leg pertama dikirim (ask untuk LONG, bid untuk SHORT)"""
+        for leg in legs:
+            tick = module.symbol_info_tick(leg.symbol)
+            if tick is not None:
+                leg.reference_price = tick.ask if leg.signal == 'LONG' else tick.bid
+
+    def send_legs(self, module, legs: List[BasketLeg], reference: Optional[List[BasketLeg]] = None):
+        """Jalan di gateway thread: (snapshot reference prices lalu) order_send back to back"""
+        if reference:
+            self.snapshot_reference(module, reference)
+        for leg in legs:
+            leg.sent_at = time.perf_counter()
+            result = module.order_send(leg.request)
+            leg.done_at = time.perf_counter()
+
+            if result is None:
+                leg.comment = str(module.last_error())
+                continue
+            leg.retcode = result.retcode
+            leg.comment = result.comment
+            leg.order = result.order
+            leg.fill_price = result.price or leg.request['price']
+
+    async def validate(self, legs: List[BasketLeg]) -> List[BasketLeg]:
+        """Tandai legs yang tidak lolos order_check / margin, return legs yang valid"""
+        margin_free = await self.gateway.run(self.check_legs, legs, priority=PRIORITY_ORDER)
+        budget = margin_free * self.max_margin_usage if margin_free is not None else None
+
+        valid = []
+        used = 0.0
+        for leg in legs:
+            if leg.check_retcode is None:
+                leg.rejected = f"order_check failed: {leg.check_comment}"
+            # order_check sukses: retcode 0
+            elif leg.check_retcode != 0 and leg.check_retcode not in self.done_retcodes:
+                leg.rejected = f"order_check {leg.check_retcode}: {leg.check_comment}"
+            elif budget is not None and leg.margin is not None and used + leg.margin > budget:
+                leg.rejected = f"margin {leg.margin:.2f} exceeds basket budget ({budget - used:.2f} left)"
+            else:
+                used += leg.margin or 0.0
+                valid.append(leg)
+        return valid
+
+    async def execute(self, legs: List[BasketLeg]) -> BasketReport:
+        """Validate lalu submit semua legs yang valid"""
+        self.baskets += 1
+        valid = await self.validate(legs)
+        self.legs_rejected += len(legs) - len(valid)
+
+        if self.leg_delay <= 0:
+            await self.gateway.run(self.send_legs, valid, valid, priority=PRIORITY_ORDER)
+        else:
+            for i, leg in enumerate(valid):
+                if i:
+                    await asyncio.sleep(self.leg_delay)
+                await self.gateway.run(self.send_legs, [leg], None if i else valid, priority=PRIORITY_ORDER)
+        self.legs_sent += len(valid)
+
+        return BasketReport(legs, self.done_retcodes)
+
+    def stats(self) -> Dict:
+        return {
+            'baskets': self.baskets,
+            'legs_sent': self.legs_sent,
+            'legs_rejected': self.legs_rejected
+        }
@@ -0,0 +1,174 @@
+"""
+Calendar Parser Benchmark
+Bandingkan BeautifulSoup (html.parser) vs lxml fast path di Forex Factory calendar HTML,
+plus weekly feed (JSON / XML) ingestion path
+"""
+
+import argparse
+import json
+import random
+import time
+from datetime import datetime, timedelta
+from typing import Callable, List
+from xml.sax.saxutils import escape
+from zoneinfo import ZoneInfo
+
+from bs4 import BeautifulSoup
+
+from forex_factory_scraper import LXML_AVAILABLE, ForexFactoryNewsScraper
+
+
+CURRENCIES = ['USD', 'EUR', 'GBP', 'JPY', 'AUD', 'CAD', 'CHF', 'NZD', 'CNY']
+EVENTS = ['CPI m/m', 'Core CPI m/m', 'Non-Farm Employment Change', 'Unemployment Rate',
+          'Retail Sales m/m', 'GDP q/q', 'Manufacturing PMI', 'Services PMI',
+          'Trade Balance', 'Official Bank Rate', 'Crude Oil Inventories', 'Bank Holiday']
+IMPACTS = ['icon--ff-impact-red', 'icon--ff-impact-ora', 'icon--ff-impact-yel', 'icon--ff-impact-gra']
+
+
+def build_fixture(days: int = 7, rows_per_day: int = 18, seed: int = 3) -> bytes:
+    """Synthetic week view dengan markup mirip forexfactory.com/calendar"""
+    rng = random.Random(seed)
+    parts = ['<!DOCTYPE html><html><head><meta charset="utf-8"><title>Forex Factory</title>',
+             '<script>var x = "<tr class=\'calendar__row\'>";</script></head><body>',
+             '<div class="calendar"><table class="calendar__table">']
+
+    for day in range(days):
+        parts.append(f'<tr class="calendar__row calendar__row--day-breaker"><td colspan="10">'
+                     f'<span>Mon Jan {day + 1}</span></td></tr>')
+        hour = 0
+        for i in range(rows_per_day):
+            new_time = rng.random() < 0.6
+            if new_time:
+                hour = min(hour + rng.randint(0, 2), 11)
+            time_text = f'{hour + 1}:{rng.choice(["00", "15", "30", "45"])}{rng.choice(["am", "pm"])}'
+            actual = rng.choice(['', '0.3%', '-12K', '1.25B', '4.1%'])
+            parts.append(
+                f'<tr class="calendar__row calendar_row" data-event-id="{day * 100 + i}">'
+                f'<td class="calendar__cell calendar__date"></td>'
+                f'<td class="calendar__cell calendar__time">{"<span>" + time_text + "</span>" if new_time else ""}</td>'
+                f'<td class="calendar__cell calendar__currency"> {rng.choice(CURRENCIES)} </td>'
+                f'<td class="calendar__cell calendar__impact"><span class="icon {rng.choice(IMPACTS)}" '
+                f'title="Impact"></span></td>'
+                f'<td class="calendar__cell calendar__event"><div><span class="calendar__event-title">'
+                f'{rng.choice(EVENTS)}</span></div></td>'
+                f'<td class="calendar__cell calendar__detail"><a class="calendar__detail-link"></a></td>'
+                f'<td class="calendar__cell calendar__actual"><span class="better">{actual}</span></td>'
+                f'<td class="calendar__cell calendar__forecast"><span>{rng.choice(["", "0.2%", "-5K"])}</span></td>'
+                f'<td class="calendar__cell calendar__previous"><span class="revised">'
+                f'{rng.choice(["0.1%", "3.9%", "&nbsp;"])}</span></td>'
+                f'<td class="calendar__cell calendar__graph"><a class="calendar__graph-link"></a></td>'
+                f'</tr>'
+            )
+
+    parts.append('</table></div></body></html>')
+    return ''.join(parts).encode('utf-8')
+
+
+def build_feed_fixture(fmt: str = 'json', days: int = 7, rows_per_day: int = 18, seed: int = 3) -> bytes:
+    """Synthetic weekly export dengan format nfs.faireconomy.media (JSON atau XML)"""
+    rng = random.Random(seed)
+    tz = ZoneInfo('America/New_York')
+    start = datetime(2024, 1, 7, tzinfo=tz)
+    items = []
+
+    for day in range(days):
+        for i in range(rows_per_day):
+            when = start + timedelta(days=day, hours=rng.randint(0, 23), minutes=rng.choice([0, 15, 30, 45]))
+            items.append({
+                'title': rng.choice(EVENTS),
+                'country': rng.choice(CURRENCIES),
+                'date': when,
+                'impact': rng.choice(['High', 'Medium', 'Low', 'Holiday']),
+                'forecast': rng.choice(['', '0.2%', '-5K']),
+                'previous': rng.choice(['0.1%', '3.9%', ''])
+            })
+
+    if fmt == 'json':
+        return json.dumps([{**item, 'date': item['date'].isoformat()} for item in items]).encode('utf-8')
+
+    parts = ['<?xml version="1.0" encoding="utf-8"?>\n<weeklyevents>']
+    for item in items:
+        when = item['date'].astimezone(ZoneInfo('UTC'))
+        parts.append(
+            f'<event><title>{escape(item["title"])}</title><country>{item["country"]}</country>'
+            f'<date><![CDATA[{when.strftime("%m-%d-%Y")}]]></date>'
+            f'<time><![CDATA[{when.strftime("%I:%M%p").lstrip("0").lower()}]]></time>'
+            f'<impact><![CDATA[{item["impact"]}]]></impact>'
+            f'<forecast><![CDATA[{item["forecast"]}]]></forecast>'
+            f'<previous><![CDATA[{item["previous"]}]]></previous><url /></event>'
+        )
+    parts.append('</weeklyevents>')
+    return ''.join(parts).encode('utf-8')
+
+
+def measure(label: str, parse: Callable[[], List], rows: int, repeat: int) -> float:
+    """Run parser, return best rows/sec"""
+    best = 0.0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parse()
+        best = max(best, rows / (time.perf_counter() - start))
+    print(f"   {label:<28} {best:>12,.0f} rows/s")
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Forex Factory calendar parsers")
+    parser.add_argument('fixtures', nargs='*', help='Saved calendar HTML pages (default: synthetic week)')
+    parser.add_argument('--feed', action='append', default=[],
+                        help='Saved weekly feed (JSON / XML), bisa berulang (default: synthetic JSON + XML)')
+    parser.add_argument('--repeat', type=int, default=5, help='Jumlah run (ambil yang terbaik)')
+    args = parser.parse_args()
+
+    if not LXML_AVAILABLE:
+        print("❌ lxml not installed. Install with: pip install lxml")
+        return
+
+    fixtures = []
+    for path in args.fixtures:
+        with open(path, 'rb') as f:
+            fixtures.append((path, f.read()))
+    if not fixtures:
+        fixtures.append(('synthetic week', build_fixture()))
+
+    scraper = ForexFactoryNewsScraper()
+    date = datetime(2024, 1, 1)
+
+    for name, content in fixtures:
+        legacy = scraper._parse_calendar_table(BeautifulSoup(content, 'html.parser'), date)
+        fast = scraper._parse_calendar_rows_lxml(content, date)
+        rows = len(legacy)
+
+        print(f"\n📊 {name} - {len(content) / 1024:.0f} KB, {rows} rows, best of {args.repeat}\n")
+        if fast != legacy:
+            print("   ❌ Output mismatch between parsers")
+            continue
+
+        before = measure('BeautifulSoup html.parser',
+                         lambda: scraper._parse_calendar_table(BeautifulSoup(content, 'html.parser'), date),
+                         rows, args.repeat)
+        after = measure('lxml + XPath',
+                        lambda: scraper._parse_calendar_rows_lxml(content, date),
+                        rows, args.repeat)
+        print(f"\n   Speedup: {after / before:.2f}x (identical output)")
+
+    feeds = []
+    for path in args.feed:
+        with open(path, 'rb') as f:
+            feeds.append((path, f.read()))
+    if not feeds:
+        feeds = [('synthetic JSON week', build_feed_fixture('json')),
+                 ('synthetic XML week', build_feed_fixture('xml'))]
+
+    html_week = sum(len(content) for _, content in fixtures)
+    for name, content in feeds:
+        rows = len(scraper.parse_calendar_feed(content))
+        print(f"\n📊 Feed {name} - {len(content) / 1024:.0f} KB, {rows} rows, best of {args.repeat}\n")
+        measure('feed -> CalendarEvent', lambda: scraper.parse_calendar_feed(content), rows, args.repeat)
+        if not args.fixtures:
+            print(f"   Download per week: {len(content) / 1024:.0f} KB feed vs "
+                  f"{html_week / 1024:.0f} KB HTML per full-week refresh")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""
+Sentiment Benchmark
+Ukur throughput (messages/sec) sentiment engine di corpus channel posts
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+from typing import Callable, Dict, List
+
+from forex_ai_bot import EnhancedNewsAnalyzer
+from sentiment_model import LinearSentimentModel, ModelNewsAnalyzer
+
+
+# Template mirip posting @marketfeed / @wfwitness
+HEADLINE_TEMPLATES = [
+    "{cb} officials {verb} as {econ} data {move} {adv}",
+    "BREAKING: {ccy} {move} after {econ} print, traders {mood}",
+    "{cb} update: policy statement signals {mood} outlook for {ccy}",
+    "{econ} {move} to {level}; {ccy} {verb} against the dollar",
+    "Market wrap - equities {move}, {ccy} {verb}, bond yields {move}",
+    "Analysts say {econ} report shows {mood} momentum, {ccy} under {pressure}",
+]
+
+VOCAB = {
+    'cb': ['Fed', 'ECB', 'BOE', 'BOJ', 'RBA', 'Bank of England', 'Federal Reserve'],
+    'verb': ['surges', 'drops', 'rallies', 'tumbles', 'holds steady', 'jumps', 'slumps'],
+    'econ': ['CPI', 'GDP', 'retail sales', 'payrolls', 'PMI', 'unemployment'],
+    'move': ['rise', 'fall', 'plunge', 'soar', 'decline', 'improve', 'edge up'],
+    'adv': ['sharply', 'slightly', 'unexpectedly', 'again', 'for a third month'],
+    'ccy': ['euro', 'sterling', 'yen', 'aussie', 'loonie', 'kiwi', 'Swiss franc', 'USD'],
+    'mood': ['optimistic', 'pessimistic', 'uncertain', 'upbeat', 'worried', 'confident'],
+    'level': ['record high', 'record low', 'all-time high', '2.4%', 'a 6-month low'],
+    'pressure': ['pressure', 'support', 'scrutiny'],
+}
+
+
+def build_corpus(size: int, seed: int = 7) -> List[str]:
+    """Generate corpus deterministik dari template"""
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(size):
+        template = rng.choice(HEADLINE_TEMPLATES)
+        fields = {key: rng.choice(words) for key, words in VOCAB.items()}
+        corpus.append(template.format(**fields))
+    return corpus
+
+
+def legacy_analyze(analyzer: EnhancedNewsAnalyzer, news_text: str) -> Dict:
+    """Substring scan per keyword (implementasi sebelum KeywordMatcher)"""
+    news_lower = news_text.lower()
+    sentiment_score = 0
+    bullish_matches = []
+    bearish_matches = []
+    for keyword, score in analyzer.bullish_keywords.items():
+        if keyword in news_lower:
+            sentiment_score += score
+            bullish_matches.append((keyword, score))
+    for keyword, score in analyzer.bearish_keywords.items():
+        if keyword in news_lower:
+            sentiment_score += score
+            bearish_matches.append((keyword, score))
+
+    detected = []
+    for currency, keywords in analyzer.currency_impact.items():
+        for keyword in keywords:
+            if keyword in news_lower:
+                if currency not in detected:
+                    detected.append(currency)
+                break
+
+    normalized_score = max(min(sentiment_score / 15, 1.0), -1.0)
+    return {
+        'sentiment_score': round(normalized_score, 3),
+        'raw_score': sentiment_score,
+        'bullish_keywords': bullish_matches,
+        'bearish_keywords': bearish_matches,
+        'affected_currencies': detected,
+        'news_preview': news_text[:200]
+    }
+
+
+def measure(label: str, func: Callable[[str], Dict], corpus: List[str], repeat: int) -> float:
+    """Run func di seluruh corpus, return best messages/sec"""
+    best = 0.0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for text in corpus:
+            func(text)
+        elapsed = time.perf_counter() - start
+        best = max(best, len(corpus) / elapsed)
+    print(f"   {label:<28} {best:>12,.0f} msg/s")
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark sentiment engines")
+    parser.add_argument('--size', type=int, default=3000, help='Jumlah messages di corpus')
+    parser.add_argument('--repeat', type=int, default=5, help='Jumlah run (ambil yang terbaik)')
+    args = parser.parse_args()
+
+    analyzer = EnhancedNewsAnalyzer()
+    corpus = build_corpus(args.size)
+
+    print(f"\n📊 Sentiment benchmark - {len(corpus)} messages, best of {args.repeat}\n")
+    before = measure('legacy substring scan', lambda t: legacy_analyze(analyzer, t), corpus, args.repeat)
+    after = measure('KeywordMatcher single pass', analyzer.analyze_sentiment, corpus, args.repeat)
+    print(f"\n   Speedup: {after / before:.2f}x")
+
+    # Batch API: satu call untuk seluruh corpus
+    best = 0.0
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        analyzer.analyze_batch(corpus)
+        best = max(best, len(corpus) / (time.perf_counter() - start))
+    print(f"   {'analyze_batch':<28} {best:>12,.0f} msg/s ({best / before:.2f}x vs legacy, "
+          f"{best / after:.2f}x vs single pass)")
+
+    # Model engine vs keyword engine: per-message latency
+    print(f"\n⏱️  Per-message latency (keyword vs trained model)\n")
+    labels = analyzer.analyze_batch(corpus)['sentiment_score']
+    with tempfile.TemporaryDirectory() as tmp:
+        model_path = os.path.join(tmp, 'model.npz')
+        LinearSentimentModel.train(corpus, labels, n_features=2 ** 16).save(model_path)
+        model_analyzer = ModelNewsAnalyzer(model_path, keyword_analyzer=analyzer)
+
+        for label, engine in [('keyword engine', analyzer), ('model engine', model_analyzer)]:
+            rate = measure(f'{label} (single)', engine.analyze_sentiment, corpus, args.repeat)
+            print(f"   {'':<28} {1e6 / rate:>12.1f} us/msg")
+        start = time.perf_counter()
+        model_analyzer.analyze_batch(corpus)
+        elapsed = time.perf_counter() - start
+        print(f"   {'model engine (batch)':<28} {1e6 * elapsed / len(corpus):>12.1f} us/msg")
+
+
+if __name__ == "__main__":
+    main()
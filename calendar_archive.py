@@ -0,0 +1,330 @@
+"""
+Calendar Archive
+Historical Forex Factory calendar di Parquet (partisi per bulan) + bulk backfill
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pandas as pd
+
+from calendar_cache import CalendarCache
+from calendar_event import CalendarEvent
+from forex_factory_scraper import ForexFactoryNewsScraper, parse_event_time
+from news_dedup import TTLDedupSet
+
+try:
+    import pyarrow  # noqa: F401 (engine untuk pandas.to_parquet / read_parquet)
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+
+# Kolom di setiap partisi (strings mentah + parsed values)
+ARCHIVE_COLUMNS = [
+    'id', 'date', 'time', 'release_time', 'currency', 'impact', 'impact_score', 'event',
+    'actual', 'forecast', 'previous', 'actual_value', 'forecast_value', 'previous_value',
+    'unit', 'is_percent', 'fetched_at'
+]
+
+
+class CalendarArchive:
+    """
+    Columnar archive untuk economic calendar events.
+
+    Layout: <root>/month=YYYY-MM/events.parquet, satu file per bulan
+    (di-rewrite atomically saat top-up, dedupe per event id dengan versi
+    terbaru). <root>/manifest.json mencatat tanggal yang sudah di-fetch,
+    termasuk hari tanpa event, supaya backfill berikutnya incremental.
+    """
+
+    def __init__(self, root: str = 'calendar_archive', timezone: str = 'America/New_York'):
+        """
+        Initialize archive
+
+        Args:
+            root: Directory archive
+            timezone: Timezone jam di calendar (untuk kolom release_time UTC)
+        """
+        if not PARQUET_AVAILABLE:
+            raise ImportError("pyarrow not installed. Install with: pip install pyarrow")
+
+        self.root = root
+        self.timezone = timezone
+        os.makedirs(root, exist_ok=True)
+        self._manifest_path = os.path.join(root, 'manifest.json')
+        self._manifest: Dict[str, float] = {}
+        if os.path.exists(self._manifest_path):
+            with open(self._manifest_path, 'r') as f:
+                self._manifest = json.load(f)
+
+    def _partition_path(self, month: str) -> str:
+        return os.path.join(self.root, f'month={month}', 'events.parquet')
+
+    def months(self) -> List[str]:
+        """Semua partisi yang ada ('YYYY-MM'), urut"""
+        months = []
+        for name in os.listdir(self.root):
+            if name.startswith('month=') and os.path.exists(os.path.join(self.root, name, 'events.parquet')):
+                months.append(name[len('month='):])
+        return sorted(months)
+
+    def fetched_dates(self) -> Dict[str, float]:
+        """Tanggal yang sudah di-archive -> fetch timestamp"""
+        return dict(self._manifest)
+
+    def to_frame(self, events: Iterable, fetched_at: Optional[float] = None) -> pd.DataFrame:
+        """Convert events (CalendarEvent / dict) ke DataFrame dengan schema archive"""
+        tz = ZoneInfo(self.timezone)
+        fetched_at = time.time() if fetched_at is None else fetched_at
+
+        rows = []
+        for event in events:
+            event = CalendarEvent.coerce(event)
+            release = parse_event_time(event.date, event.time, tz)
+            values = [event.actual_value, event.forecast_value, event.previous_value]
+            reference = next((v for v in values if v is not None), None)
+            rows.append({
+                **event.to_dict(),
+                'release_time': release,
+                'actual_value': values[0].value if values[0] is not None else np.nan,
+                'forecast_value': values[1].value if values[1] is not None else np.nan,
+                'previous_value': values[2].value if values[2] is not None else np.nan,
+                'unit': reference.unit if reference is not None else '',
+                'is_percent': reference.is_percent if reference is not None else False,
+                'fetched_at': fetched_at
+            })
+
+        frame = pd.DataFrame(rows, columns=ARCHIVE_COLUMNS)
+        frame['release_time'] = pd.to_datetime(frame['release_time'], utc=True)
+        frame['fetched_at'] = pd.to_datetime(frame['fetched_at'], unit='s', utc=True)
+        frame['impact_score'] = frame['impact_score'].astype('int8')
+        frame['is_percent'] = frame['is_percent'].astype(bool)
+        return frame
+
+    def write(self, events: Iterable, dates: Iterable[str] = ()) -> int:
+        """
+        Merge events ke partisi bulanan (versi terbaru per id menang)
+
+        Args:
+            events: CalendarEvent / dict
+            dates: Tanggal yang di-fetch (dicatat di manifest, termasuk yang kosong)
+
+        Returns:
+            Jumlah rows yang ditulis
+        """
+        frame = self.to_frame(events)
+        written = 0
+
+        if len(frame):
+            frame['month'] = frame['date'].str.slice(0, 7)
+            for month, part in frame.groupby('month', sort=True):
+                part = part.drop(columns=['month'])
+                path = self._partition_path(month)
+                if os.path.exists(path):
+                    part = pd.concat([pd.read_parquet(path), part], ignore_index=True)
+                part = part.drop_duplicates('id', keep='last').sort_values(['date', 'release_time', 'id'])
+
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                tmp_path = path + '.tmp'
+                part.to_parquet(tmp_path, index=False)
+                os.replace(tmp_path, path)
+                written += len(part)
+
+        now = time.time()
+        for date in dates:
+            self._manifest[date] = now
+        tmp_path = self._manifest_path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(self._manifest, f, indent=0, sort_keys=True)
+        os.replace(tmp_path, self._manifest_path)
+
+        return written
+
+    def load(self, start: Optional[str] = None, end: Optional[str] = None,
+             currencies: Optional[List[str]] = None, impact: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Load events sebagai satu DataFrame (hanya partisi di dalam range yang dibaca)
+
+        Args:
+            start: 'YYYY-MM-DD' inclusive
+            end: 'YYYY-MM-DD' inclusive
+            currencies: Filter currency codes
+            impact: Filter impact levels (e.g. ['high'])
+        """
+        months = [m for m in self.months()
+                  if (start is None or m >= start[:7]) and (end is None or m <= end[:7])]
+        if not months:
+            return self.to_frame([])
+
+        filters = []
+        if currencies:
+            filters.append(('currency', 'in', list(currencies)))
+        if impact:
+            filters.append(('impact', 'in', list(impact)))
+
+        frame = pd.concat(
+            [pd.read_parquet(self._partition_path(m), filters=filters or None) for m in months],
+            ignore_index=True
+        )
+        if start is not None:
+            frame = frame[frame['date'] >= start]
+        if end is not None:
+            frame = frame[frame['date'] <= end]
+        return frame.reset_index(drop=True)
+
+    def stats(self) -> Dict:
+        """Ukuran archive"""
+        months = self.months()
+        rows = sum(pd.read_parquet(self._partition_path(m), columns=['id']).shape[0] for m in months)
+        size = sum(os.path.getsize(self._partition_path(m)) for m in months)
+        return {
+            'months': len(months),
+            'dates': len(self._manifest),
+            'rows': rows,
+            'bytes': size,
+            'first': months[0] if months else None,
+            'last': months[-1] if months else None
+        }
+
+
+class RateLimiter:
+    """Minimal jarak antar request start (polite crawling)"""
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._lock = asyncio.Lock()
+        self._next = 0.0
+
+    async def wait(self):
+        async with self._lock:
+            now = time.monotonic()
+            if self._next > now:
+                await asyncio.sleep(self._next - now)
+            self._next = max(now, self._next) + self.interval
+
+
+async def backfill(archive: CalendarArchive, start: str, end: str, concurrency: int = 3,
+                   rate: float = 1.0, refresh_days: int = 3, batch_days: int = 31,
+                   scraper: Optional[ForexFactoryNewsScraper] = None) -> Dict:
+    """
+    Fetch range tanggal ke archive
+
+    Tanggal yang sudah ada di manifest di-skip, kecuali refresh_days terakhir
+    (actual/revisi bisa masih berubah).
+
+    Args:
+        archive: Target archive
+        start, end: 'YYYY-MM-DD' inclusive
+        concurrency: Maksimal request bersamaan
+        rate: Maksimal request start per detik
+        refresh_days: Selalu fetch ulang N hari terakhir sebelum hari ini
+        batch_days: Flush ke Parquet setiap N tanggal
+
+    Returns:
+        Backfill stats
+    """
+    own_scraper = scraper is None
+    if own_scraper:
+        # Scraper terpisah: tidak berbagi dedup state dengan bot, page cache tanpa TTL
+        scraper = ForexFactoryNewsScraper(
+            processed_events=TTLDedupSet(),
+            calendar_cache=CalendarCache(ttl=0, max_entries=concurrency * 2),
+            timezone=archive.timezone
+        )
+
+    first = datetime.strptime(start, '%Y-%m-%d')
+    last = datetime.strptime(end, '%Y-%m-%d')
+    refresh_from = (datetime.now() - timedelta(days=refresh_days)).strftime('%Y-%m-%d')
+    fetched = archive.fetched_dates()
+
+    dates = []
+    day = first
+    while day <= last:
+        date = day.strftime('%Y-%m-%d')
+        if date not in fetched or date >= refresh_from:
+            dates.append(date)
+        day += timedelta(days=1)
+
+    semaphore = asyncio.Semaphore(concurrency)
+    limiter = RateLimiter(rate)
+    stats = {'dates': len(dates), 'skipped': 0, 'failed': [], 'rows': 0}
+    started = time.perf_counter()
+
+    async def fetch(date: str):
+        async with semaphore:
+            await limiter.wait()
+            try:
+                return date, await scraper.get_calendar_snapshot(date, revalidate=True, verbose=False)
+            except Exception as e:
+                print(f"❌ {date}: {e}")
+                return date, None
+
+    try:
+        for offset in range(0, len(dates), batch_days):
+            batch = dates[offset:offset + batch_days]
+            results = await asyncio.gather(*[fetch(date) for date in batch])
+
+            events = []
+            done = []
+            for date, day_events in results:
+                if day_events is None:
+                    stats['failed'].append(date)
+                    continue
+                events.extend(day_events)
+                done.append(date)
+
+            archive.write(events, dates=done)
+            stats['rows'] += len(events)
+            print(f"🗄️ Archived {batch[0]} .. {batch[-1]}: {len(events)} events "
+                  f"({offset + len(batch)}/{len(dates)} dates)")
+    finally:
+        if own_scraper:
+            await scraper.close()
+
+    stats['skipped'] = (last - first).days + 1 - len(dates)
+    stats['seconds'] = round(time.perf_counter() - started, 2)
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Forex Factory calendar archive")
+    parser.add_argument('--root', default='calendar_archive', help='Archive directory')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    fill = sub.add_parser('backfill', help='Fetch range tanggal ke archive (incremental)')
+    fill.add_argument('--start', required=True, help='YYYY-MM-DD')
+    fill.add_argument('--end', default=datetime.now().strftime('%Y-%m-%d'), help='YYYY-MM-DD (default: today)')
+    fill.add_argument('--concurrency', type=int, default=3)
+    fill.add_argument('--rate', type=float, default=1.0, help='Max requests per second')
+    fill.add_argument('--refresh-days', type=int, default=3)
+
+    sub.add_parser('stats', help='Ringkasan archive')
+
+    args = parser.parse_args()
+    archive = CalendarArchive(args.root)
+
+    if args.command == 'backfill':
+        result = asyncio.run(backfill(archive, args.start, args.end, concurrency=args.concurrency,
+                                      rate=args.rate, refresh_days=args.refresh_days))
+        print(f"\n✅ Backfill done: {result['rows']} events from {result['dates']} dates "
+              f"({result['skipped']} already archived, {len(result['failed'])} failed) "
+              f"in {result['seconds']}s")
+        if result['failed']:
+            print(f"   Failed dates (re-run to retry): {', '.join(result['failed'][:10])}")
+
+    stats = archive.stats()
+    print(f"🗄️ Archive {args.root}: {stats['rows']} events, {stats['dates']} dates, "
+          f"{stats['months']} months ({stats['first']} .. {stats['last']}), "
+          f"{stats['bytes'] / 1024:.0f} KB")
+
+
+if __name__ == "__main__":
+    main()
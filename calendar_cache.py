@@ -0,0 +1,148 @@
+"""
+Calendar Cache
+Per-date cache untuk Forex Factory calendar pages (TTL + ETag/Last-Modified revalidation)
+"""
+
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+
+class CalendarEntry:
+    """Parsed events + validators untuk satu calendar page"""
+
+    __slots__ = ('events', 'etag', 'last_modified', 'body_hash', 'fetched_at', 'parse_seconds')
+
+    def __init__(self, events: List[Dict], etag: Optional[str], last_modified: Optional[str],
+                 body_hash: str, parse_seconds: float):
+        self.events = events
+        self.etag = etag
+        self.last_modified = last_modified
+        self.body_hash = body_hash
+        self.fetched_at = time.monotonic()
+        self.parse_seconds = parse_seconds
+
+
+class CalendarCache:
+    """
+    Cache calendar page per tanggal.
+
+    Entry yang masih fresh (umur < ttl) dipakai langsung tanpa request.
+    Entry yang stale di-revalidate dengan If-None-Match / If-Modified-Since;
+    304 atau body yang sama persis (server tanpa validators) memakai parsed
+    events yang sudah ada, jadi HTML tidak di-parse ulang.
+    """
+
+    def __init__(self, ttl: float = 120.0, max_entries: int = 32):
+        """
+        Initialize cache
+
+        Args:
+            ttl: Berapa detik page dianggap fresh tanpa revalidation
+            max_entries: Maksimal jumlah tanggal yang disimpan (LRU)
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[str, CalendarEntry]' = OrderedDict()
+
+        # Counters
+        self.hits = 0
+        self.revalidated = 0
+        self.unchanged = 0
+        self.misses = 0
+        self.requests = 0
+        self.bytes_downloaded = 0
+        self.parse_seconds = 0.0
+        self.parse_seconds_saved = 0.0
+
+    @staticmethod
+    def body_hash(body: bytes) -> str:
+        return hashlib.blake2b(body, digest_size=16).hexdigest()
+
+    def get_fresh(self, date: str) -> Optional[List[Dict]]:
+        """Parsed events jika entry masih dalam TTL (tanpa network)"""
+        entry = self._entries.get(date)
+        if entry is None or time.monotonic() - entry.fetched_at >= self.ttl:
+            return None
+        self._entries.move_to_end(date)
+        self.hits += 1
+        self.parse_seconds_saved += entry.parse_seconds
+        return entry.events
+
+    def conditional_headers(self, date: str) -> Dict[str, str]:
+        """Validators untuk conditional GET"""
+        entry = self._entries.get(date)
+        headers = {}
+        if entry is not None:
+            if entry.etag:
+                headers['If-None-Match'] = entry.etag
+            if entry.last_modified:
+                headers['If-Modified-Since'] = entry.last_modified
+        return headers
+
+    def record_download(self, nbytes: int):
+        self.requests += 1
+        self.bytes_downloaded += nbytes
+
+    def not_modified(self, date: str) -> Optional[List[Dict]]:
+        """Handle 304: refresh umur entry dan return cached events"""
+        entry = self._entries.get(date)
+        if entry is None:
+            return None
+        entry.fetched_at = time.monotonic()
+        self._entries.move_to_end(date)
+        self.revalidated += 1
+        self.parse_seconds_saved += entry.parse_seconds
+        return entry.events
+
+    def lookup_body(self, date: str, body_hash: str, etag: Optional[str] = None,
+                    last_modified: Optional[str] = None) -> Optional[List[Dict]]:
+        """Handle 200: reuse parsed events jika body identik dengan cached page"""
+        entry = self._entries.get(date)
+        if entry is None or entry.body_hash != body_hash:
+            return None
+        entry.fetched_at = time.monotonic()
+        entry.etag = etag or entry.etag
+        entry.last_modified = last_modified or entry.last_modified
+        self._entries.move_to_end(date)
+        self.unchanged += 1
+        self.parse_seconds_saved += entry.parse_seconds
+        return entry.events
+
+    def store(self, date: str, events: List[Dict], body_hash: str, etag: Optional[str],
+              last_modified: Optional[str], parse_seconds: float):
+        """Simpan hasil parse baru"""
+        self.misses += 1
+        self.parse_seconds += parse_seconds
+        self._entries[date] = CalendarEntry(events, etag, last_modified, body_hash, parse_seconds)
+        self._entries.move_to_end(date)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, date: Optional[str] = None):
+        """Buang satu tanggal (atau semua)"""
+        if date is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(date, None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict:
+        """Hit rate, bytes downloaded dan parse time yang dihemat"""
+        lookups = self.hits + self.revalidated + self.unchanged + self.misses
+        served = lookups - self.misses
+        return {
+            'entries': len(self._entries),
+            'hits': self.hits,
+            'revalidated': self.revalidated,
+            'unchanged': self.unchanged,
+            'misses': self.misses,
+            'requests': self.requests,
+            'bytes_downloaded': self.bytes_downloaded,
+            'parse_seconds': round(self.parse_seconds, 4),
+            'parse_seconds_saved': round(self.parse_seconds_saved, 4),
+            'hit_rate': round(served / lookups, 3) if lookups else 0.0
+        }
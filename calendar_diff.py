@@ -0,0 +1,159 @@
+"""
+Calendar Diff
+Snapshot-diff engine untuk Forex Factory calendar (emit hanya rows yang baru / berubah)
+"""
+
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+# Fields yang bisa berubah untuk event ID yang sama
+TRACKED_FIELDS = ('impact', 'actual', 'forecast', 'previous')
+
+# Fields hasil rilis data (dipakai untuk release / revision detection)
+VALUE_FIELDS = ('actual', 'forecast', 'previous')
+
+
+class CalendarChange:
+    """Satu perubahan di calendar: row baru ('insert') atau field berubah ('update')"""
+
+    __slots__ = ('kind', 'event', 'changes')
+
+    INSERT = 'insert'
+    UPDATE = 'update'
+
+    def __init__(self, kind: str, event: Dict, changes: Dict[str, Tuple[Optional[str], Optional[str]]]):
+        """
+        Args:
+            kind: CalendarChange.INSERT atau CalendarChange.UPDATE
+            event: Event dict terbaru
+            changes: field -> (old value, new value); untuk insert old selalu None
+        """
+        self.kind = kind
+        self.event = event
+        self.changes = changes
+
+    @property
+    def event_id(self) -> str:
+        return self.event['id']
+
+    @property
+    def is_release(self) -> bool:
+        """Actual muncul untuk pertama kali"""
+        old, new = self.changes.get('actual', (None, None))
+        return bool(new) and not old
+
+    @property
+    def revised_fields(self) -> List[str]:
+        """Value fields yang berubah dari satu nilai ke nilai lain (revisi)"""
+        return [field for field in VALUE_FIELDS
+                if field in self.changes and self.changes[field][0] and self.changes[field][1]]
+
+    def __repr__(self) -> str:
+        return f"CalendarChange({self.kind}, {self.event_id!r}, {self.changes!r})"
+
+
+class CalendarDiffer:
+    """
+    Simpan state terakhir per event ID dan emit hanya delta.
+
+    Snapshot disimpan per tanggal (maksimal max_dates tanggal, LRU). Optional
+    `seen` set (e.g. TTLDedupSet yang di-warm-start dari checkpoint store)
+    menyimpan fingerprint dari state yang sudah pernah di-emit, jadi setelah
+    restart row yang tidak berubah tidak di-emit ulang, sedangkan row yang
+    dapat actual baru tetap muncul.
+    """
+
+    def __init__(self, seen=None, max_dates: int = 14):
+        """
+        Initialize differ
+
+        Args:
+            seen: Optional set-like (`in` & `add`) untuk state fingerprints
+            max_dates: Berapa tanggal snapshot yang disimpan
+        """
+        self.seen = seen
+        self.max_dates = max_dates
+        self._snapshots: 'OrderedDict[str, Dict[str, Dict]]' = OrderedDict()
+
+        # Stats
+        self.rows_seen = 0
+        self.inserts = 0
+        self.updates = 0
+
+    @staticmethod
+    def fingerprint(event: Dict) -> str:
+        """Key untuk (event ID, state)"""
+        return '|'.join([event['id']] + [str(event.get(field) or '') for field in TRACKED_FIELDS])
+
+    def diff(self, date: str, events: List[Dict],
+             select: Optional[Callable[[Dict], bool]] = None) -> List[CalendarChange]:
+        """
+        Bandingkan full calendar page dengan snapshot terakhir
+
+        Args:
+            date: Tanggal page ('YYYY-MM-DD')
+            events: Semua rows hasil parse
+            select: Optional filter; rows yang tidak lolos tidak dibandingkan,
+                tidak masuk snapshot dan tidak ditandai seen (di-emit nanti
+                sebagai insert begitu lolos filter)
+
+        Returns:
+            List of CalendarChange (urut seperti di page)
+        """
+        snapshot = self._snapshots.get(date)
+        if snapshot is None:
+            snapshot = self._snapshots[date] = {}
+        self._snapshots.move_to_end(date)
+        while len(self._snapshots) > self.max_dates:
+            self._snapshots.popitem(last=False)
+
+        changes = []
+        for event in events:
+            if select is not None and not select(event):
+                continue
+            self.rows_seen += 1
+            event_id = event['id']
+            previous = snapshot.get(event_id)
+            snapshot[event_id] = event
+
+            if previous is None:
+                key = self.fingerprint(event)
+                if self.seen is not None:
+                    if key in self.seen:
+                        continue
+                    self.seen.add(key)
+                changes.append(CalendarChange(
+                    CalendarChange.INSERT, event,
+                    {field: (None, event.get(field)) for field in TRACKED_FIELDS if event.get(field)}
+                ))
+                self.inserts += 1
+                continue
+
+            delta = {
+                field: (previous.get(field), event.get(field))
+                for field in TRACKED_FIELDS
+                if (previous.get(field) or None) != (event.get(field) or None)
+            }
+            if not delta:
+                continue
+
+            if self.seen is not None:
+                self.seen.add(self.fingerprint(event))
+            changes.append(CalendarChange(CalendarChange.UPDATE, event, delta))
+            self.updates += 1
+
+        return changes
+
+    def snapshot(self, date: str) -> List[Dict]:
+        """State terakhir semua events untuk tanggal tertentu"""
+        return list(self._snapshots.get(date, {}).values())
+
+    def stats(self) -> Dict:
+        """Rows compared vs changes emitted"""
+        return {
+            'dates': len(self._snapshots),
+            'rows_seen': self.rows_seen,
+            'inserts': self.inserts,
+            'updates': self.updates
+        }
@@ -0,0 +1,127 @@
+"""
+Calendar Event
+Typed Forex Factory event record dengan actual/forecast/previous yang sudah di-parse
+"""
+
+import re
+from collections.abc import Mapping
+from typing import Dict, Optional
+
+
+# Contoh format: '0.3%', '-12K', '1.25B', '<0.10%', '52.3', '1,234', '$1.2B', '−0.2%' (Unicode minus)
+VALUE_PATTERN = re.compile(
+    r'^\s*(?P<cmp>[<>])?\s*(?P<sign>[-+])?\s*'
+    r'(?P<number>\d[\d,]*(?:\.\d*)?|\.\d+)\s*'
+    r'(?P<suffix>%|[KMBT])?\s*$',
+    re.IGNORECASE
+)
+
+UNIT_MULTIPLIERS = {'': 1.0, 'K': 1e3, 'M': 1e6, 'B': 1e9, 'T': 1e12}
+
+# Sebelum match: currency prefix dibuang ('$1.2B', '-£3.1B'), Unicode minus -> '-'
+VALUE_NORMALIZE = str.maketrans({'\u2212': '-', '$': None, '€': None, '£': None, '¥': None})
+
+
+class CalendarValue:
+    """
+    Satu nilai numerik dari calendar.
+
+    value sudah dikali unit (K/M/B/T), percent tetap dalam percentage points
+    ('0.3%' -> 0.3 dengan is_percent=True).
+    """
+
+    __slots__ = ('raw', 'value', 'unit', 'is_percent', 'comparator')
+
+    def __init__(self, raw: str, value: float, unit: str = '', is_percent: bool = False,
+                 comparator: str = ''):
+        self.raw = raw
+        self.value = value
+        self.unit = unit
+        self.is_percent = is_percent
+        self.comparator = comparator
+
+    def __repr__(self) -> str:
+        return f"CalendarValue({self.raw!r}, {self.value!r})"
+
+
+def parse_value(raw: Optional[str]) -> Optional[CalendarValue]:
+    """
+    Parse calendar value string
+
+    Returns:
+        CalendarValue, atau None jika kosong / bukan angka
+    """
+    if not raw:
+        return None
+    match = VALUE_PATTERN.match(raw.translate(VALUE_NORMALIZE))
+    if match is None:
+        return None
+
+    suffix = (match.group('suffix') or '').upper()
+    is_percent = suffix == '%'
+    unit = '' if is_percent else suffix
+
+    number = float(match.group('number').replace(',', ''))
+    if match.group('sign') == '-':
+        number = -number
+
+    return CalendarValue(raw, number * UNIT_MULTIPLIERS[unit], unit, is_percent,
+                         match.group('cmp') or '')
+
+
+class CalendarEvent(Mapping):
+    """
+    Slotted calendar event.
+
+    Tetap bisa dibaca seperti dict lama (event['currency'], event.get('actual'),
+    to_dict() untuk JSON), sedangkan actual/forecast/previous juga tersedia
+    sebagai CalendarValue yang di-parse sekali saat scrape.
+    """
+
+    FIELDS = ('id', 'date', 'time', 'currency', 'impact', 'impact_score', 'event',
+              'actual', 'forecast', 'previous', 'source')
+
+    __slots__ = FIELDS + ('actual_value', 'forecast_value', 'previous_value')
+
+    def __init__(self, id: str, date: str, time: Optional[str], currency: str, impact: str,
+                 impact_score: int, event: str, actual: Optional[str], forecast: Optional[str],
+                 previous: Optional[str], source: str = 'ForexFactory'):
+        self.id = id
+        self.date = date
+        self.time = time
+        self.currency = currency
+        self.impact = impact
+        self.impact_score = impact_score
+        self.event = event
+        self.actual = actual
+        self.forecast = forecast
+        self.previous = previous
+        self.source = source
+
+        self.actual_value = parse_value(actual)
+        self.forecast_value = parse_value(forecast)
+        self.previous_value = parse_value(previous)
+
+    @classmethod
+    def coerce(cls, event) -> 'CalendarEvent':
+        """CalendarEvent dari dict (e.g. recording / replay), atau as-is"""
+        if isinstance(event, cls):
+            return event
+        return cls(**{field: event.get(field) for field in cls.FIELDS})
+
+    def to_dict(self) -> Dict:
+        return {field: getattr(self, field) for field in self.FIELDS}
+
+    def __getitem__(self, key: str):
+        if key not in self.FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self):
+        return iter(self.FIELDS)
+
+    def __len__(self) -> int:
+        return len(self.FIELDS)
+
+    def __repr__(self) -> str:
+        return f"CalendarEvent({self.to_dict()!r})"
@@ -0,0 +1,189 @@
+"""
+Checkpoint Store
+Durable ingestion state (cursors & processed IDs) di SQLite WAL
+"""
+
+import sqlite3
+import threading
+import time
+from typing import Dict, Set
+
+
+class CheckpointStore:
+    """
+    Embedded checkpoint store untuk warm-start tanpa replay news lama.
+
+    Semua state di-load sekali ke memory saat init. Writes hanya masuk ke
+    buffer in-memory; background thread yang flush ke SQLite (WAL mode)
+    dalam satu transaction per batch, jadi trading loop tidak pernah
+    menunggu disk. Processed IDs di-key per (source, id) dan yang lebih
+    lama dari retention dibuang saat startup dan setiap prune_interval.
+    """
+
+    def __init__(self, path: str = 'forex_bot_state.db', flush_interval: float = 1.0,
+                 retention_days: float = 7.0, prune_interval: float = 3600.0):
+        """
+        Initialize checkpoint store
+
+        Args:
+            path: Path ke SQLite database
+            flush_interval: Interval flush ke disk (detik)
+            retention_days: Processed IDs lebih lama dari ini dibuang
+            prune_interval: Interval prune processed IDs oleh writer thread (detik)
+        """
+        self.path = path
+        self.flush_interval = flush_interval
+        self.retention_days = retention_days
+        self.prune_interval = prune_interval
+        self._last_prune = time.monotonic()
+
+        # Warm-start state (source -> {key: value} / set of ids)
+        self._cursors: Dict[str, Dict[str, int]] = {}
+        self._processed: Dict[str, Set[str]] = {}
+
+        # Write buffer
+        self._lock = threading.Lock()
+        self._pending_cursors: Dict[tuple, int] = {}
+        self._pending_processed: Dict[tuple, float] = {}
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+
+        self.flushes = 0
+        self.rows_written = 0
+        self.rows_pruned = 0
+
+        self._load()
+
+        self._writer = threading.Thread(target=self._run_writer, name='checkpoint-writer', daemon=True)
+        self._writer.start()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute(
+            'CREATE TABLE IF NOT EXISTS cursors ('
+            ' source TEXT NOT NULL, key TEXT NOT NULL, value INTEGER NOT NULL,'
+            ' PRIMARY KEY (source, key))'
+        )
+        # Schema lama (id TEXT PRIMARY KEY): id yang sama dari source berbeda saling overwrite
+        columns = conn.execute('PRAGMA table_info(processed)').fetchall()
+        if columns and sum(1 for column in columns if column[5]) == 1:
+            with conn:
+                conn.execute('ALTER TABLE processed RENAME TO processed_v1')
+                self._create_processed(conn)
+                conn.execute('INSERT OR IGNORE INTO processed (source, id, seen_at) '
+                             'SELECT source, id, seen_at FROM processed_v1')
+                conn.execute('DROP TABLE processed_v1')
+        else:
+            self._create_processed(conn)
+        return conn
+
+    @staticmethod
+    def _create_processed(conn: sqlite3.Connection):
+        conn.execute(
+            'CREATE TABLE IF NOT EXISTS processed ('
+            ' source TEXT NOT NULL, id TEXT NOT NULL, seen_at REAL NOT NULL,'
+            ' PRIMARY KEY (source, id))'
+        )
+
+    def prune(self, conn: sqlite3.Connection) -> int:
+        """Hapus processed IDs di luar retention, return jumlah rows"""
+        cutoff = time.time() - self.retention_days * 86400
+        with conn:
+            deleted = conn.execute('DELETE FROM processed WHERE seen_at < ?', (cutoff,)).rowcount
+        self.rows_pruned += deleted
+        self._last_prune = time.monotonic()
+        return deleted
+
+    def _load(self):
+        """Load semua cursors & processed IDs (dalam retention) ke memory"""
+        conn = self._connect()
+        try:
+            self.prune(conn)
+
+            for source, key, value in conn.execute('SELECT source, key, value FROM cursors'):
+                self._cursors.setdefault(source, {})[key] = value
+            for item_id, source in conn.execute('SELECT id, source FROM processed'):
+                self._processed.setdefault(source, set()).add(item_id)
+        finally:
+            conn.close()
+
+    def cursors(self, source: str) -> Dict[str, int]:
+        """Saved cursors untuk source (e.g. 'telegram' -> {channel: last id})"""
+        return dict(self._cursors.get(source, {}))
+
+    def processed_ids(self, source: str) -> Set[str]:
+        """Saved processed IDs untuk source"""
+        return set(self._processed.get(source, ()))
+
+    def set_cursor(self, source: str, key: str, value: int):
+        """Queue cursor update (non-blocking)"""
+        current = self._cursors.setdefault(source, {})
+        if current.get(key) == value:
+            return
+        current[key] = value
+        with self._lock:
+            self._pending_cursors[(source, key)] = value
+
+    def mark_processed(self, source: str, item_id: str):
+        """Queue processed ID (non-blocking)"""
+        with self._lock:
+            self._pending_processed[(source, item_id)] = time.time()
+
+    def flush(self, conn: sqlite3.Connection):
+        """Tulis semua pending writes dalam satu transaction"""
+        with self._lock:
+            cursors = self._pending_cursors
+            processed = self._pending_processed
+            self._pending_cursors = {}
+            self._pending_processed = {}
+
+        if not cursors and not processed:
+            return
+
+        with conn:
+            conn.executemany(
+                'INSERT OR REPLACE INTO cursors (source, key, value) VALUES (?, ?, ?)',
+                [(source, key, value) for (source, key), value in cursors.items()]
+            )
+            conn.executemany(
+                'INSERT OR REPLACE INTO processed (source, id, seen_at) VALUES (?, ?, ?)',
+                [(source, item_id, seen_at) for (source, item_id), seen_at in processed.items()]
+            )
+
+        self.flushes += 1
+        self.rows_written += len(cursors) + len(processed)
+
+    def _run_writer(self):
+        conn = self._connect()
+        try:
+            while not self._stop.is_set():
+                self._wake.wait(self.flush_interval)
+                self._wake.clear()
+                try:
+                    self.flush(conn)
+                    if time.monotonic() - self._last_prune >= self.prune_interval:
+                        self.prune(conn)
+                except sqlite3.Error as e:
+                    print(f"❌ Checkpoint flush failed: {e}")
+            self.flush(conn)
+        finally:
+            conn.close()
+
+    def close(self):
+        """Flush pending writes lalu stop writer thread"""
+        self._stop.set()
+        self._wake.set()
+        self._writer.join(timeout=5)
+
+    def stats(self) -> Dict:
+        """Flush counters"""
+        with self._lock:
+            pending = len(self._pending_cursors) + len(self._pending_processed)
+        return {
+            'flushes': self.flushes,
+            'rows_written': self.rows_written,
+            'rows_pruned': self.rows_pruned,
+            'pending': pending
+        }
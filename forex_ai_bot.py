@@ -10,7 +10,6 @@ Fitur:
 - Full MT5 integration dengan .env configuration
 """
 
-import MetaTrader5 as mt5
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
@@ -21,10 +20,39 @@ import json
 import os
 from dotenv import load_dotenv
 
+from keyword_matcher import KeywordMatcher
+from mt5_gateway import PRIORITY_ORDER, MT5Gateway
+from news_cache import SentimentCache
+from news_dedup import NearDuplicateDetector, TTLDedupSet
+from basket import BasketExecutor, BasketLeg
+from calendar_cache import CalendarCache
+from calendar_diff import CalendarChange
+from checkpoint_store import CheckpointStore
+from http_client import AsyncHTTPClient
+from news_replay import NewsRecorder
+from pair_index import PairOrientationIndex
+from pipeline import Pipeline
+from position_book import PositionBook
+from sentiment_model import ModelNewsAnalyzer
+from symbol_cache import SPEC_CHANGED_RETCODES, SymbolCache
+from tick_cache import TickCache
+
+# MetaTrader 5 (Windows only - tanpa MT5, news pipeline tetap bisa di-replay/benchmark)
+try:
+    import MetaTrader5 as mt5
+    MT5_AVAILABLE = True
+except ImportError:
+    mt5 = None
+    MT5_AVAILABLE = False
+    print("⚠️ MetaTrader5 not installed. Install with: pip install MetaTrader5 (Windows only)")
+
 # Telegram scraping (NO BOT NEEDED)
 try:
-    from telethon import TelegramClient
-    from telethon.tl.functions.messages import GetHistoryRequest
+    from telethon import TelegramClient, events
+    from telethon.errors import FloodWaitError
+    from telethon.tl.functions.messages import GetHistoryRequest, GetPeerDialogsRequest
+    from telethon.tl.types import InputDialogPeer
+    from telethon.utils import get_peer_id
     TELETHON_AVAILABLE = True
 except ImportError:
     TELETHON_AVAILABLE = False
@@ -32,7 +60,8 @@ except ImportError:
 
 # Forex Factory scraping
 try:
-    from forex_factory_scraper import ForexFactoryNewsScraper, ForexFactoryNewsAnalyzer
+    from forex_factory_scraper import DEFAULT_FEED_URL, ForexFactoryNewsScraper, ForexFactoryNewsAnalyzer
+    from release_poller import ReleasePoller
     FOREX_FACTORY_AVAILABLE = True
 except ImportError:
     FOREX_FACTORY_AVAILABLE = False
@@ -45,8 +74,16 @@ load_dotenv()
 class TelegramNewsScaper:
     """Scrape news dari Telegram channels TANPA perlu bot"""
     
-    def __init__(self):
-        """Initialize Telegram scraper"""
+    def __init__(self, checkpoint_store=None, recorder=None):
+        """
+        Initialize Telegram scraper
+        
+        Args:
+            checkpoint_store: Optional CheckpointStore untuk persist per-channel cursors
+            recorder: Optional NewsRecorder untuk capture messages (replay/benchmark)
+        """
+        self.checkpoint_store = checkpoint_store
+        self.recorder = recorder
         self.api_id = os.getenv('TELEGRAM_API_ID')
         self.api_hash = os.getenv('TELEGRAM_API_HASH')
         self.phone = os.getenv('TELEGRAM_PHONE')
@@ -57,13 +94,38 @@ class TelegramNewsScaper:
         else:
             self.client = TelegramClient('forex_bot_session', self.api_id, self.api_hash)
         
-        # Channels to monitor
+        # Channels to monitor (override dengan TELEGRAM_CHANNELS=a,b,c)
         self.channels = [
             'marketfeed',  # @marketfeed
             'wfwitness'    # @wfwitness
         ]
+        extra_channels = os.getenv('TELEGRAM_CHANNELS', '')
+        if extra_channels.strip():
+            self.channels = [c.strip().lstrip('@') for c in extra_channels.split(',') if c.strip()]
+        
+        # Concurrent fetch: maksimal N request bersamaan, satu per channel
+        self.fetch_semaphore = asyncio.Semaphore(int(os.getenv('TELEGRAM_FETCH_CONCURRENCY', '8')))
+        self._channel_locks = {}
+        self.max_flood_wait = float(os.getenv('TELEGRAM_MAX_FLOOD_WAIT', '30'))
+        self._flood_until = 0.0
         
         self.last_message_ids = {}
+        
+        # Streaming mode (push via NewMessage handler)
+        self.streaming_enabled = os.getenv('TELEGRAM_STREAMING', 'true').lower() == 'true'
+        self.catch_up_interval = float(os.getenv('TELEGRAM_CATCHUP_INTERVAL', '300'))
+        self.catch_up_limit = int(os.getenv('TELEGRAM_CATCHUP_LIMIT', '100'))
+        self.catch_up_max_pages = int(os.getenv('TELEGRAM_CATCHUP_MAX_PAGES', '10'))
+        self.gap_batch_size = int(os.getenv('TELEGRAM_GAP_BATCH', '100'))
+        self._input_peers = {}
+        self.queue = None
+        self.streaming = False
+        
+        # Catch-up cursor per channel (hanya maju lewat catch-up fetch)
+        self.catch_up_ids = checkpoint_store.cursors('telegram') if checkpoint_store else {}
+        self.last_message_ids.update(self.catch_up_ids)
+        self._streamed_ids = {}
+        self._last_catch_up = 0.0
     
     async def connect(self):
         """Connect to Telegram"""
@@ -74,23 +136,103 @@ class TelegramNewsScaper:
         print("✅ Connected to Telegram")
         return True
     
-    async def get_latest_messages(self, channel: str, limit: int = 10) -> List[Dict]:
+    async def start_streaming(self) -> bool:
+        """
+        Register NewMessage handler, setiap post baru langsung masuk ke self.queue
+        
+        Returns:
+            True jika streaming aktif
+        """
+        if not self.client or not self.streaming_enabled or self.streaming:
+            return self.streaming
+        
+        self.queue = asyncio.Queue()
+        self.client.add_event_handler(self._on_new_message, events.NewMessage(chats=self.channels))
+        self.streaming = True
+        print(f"📡 Streaming {len(self.channels)} Telegram channel(s)")
+        return True
+    
+    def _channel_name(self, chat) -> Optional[str]:
+        """Map chat entity ke nama channel di self.channels"""
+        username = (getattr(chat, 'username', None) or '').lower()
+        for channel in self.channels:
+            if channel.lower() == username:
+                return channel
+        return username or None
+    
+    async def _on_new_message(self, event):
+        """Telethon handler: push message baru ke queue"""
+        message = event.message
+        channel = self._channel_name(await event.get_chat())
+        if channel is None:
+            return
+        
+        # Semua pushed ids (termasuk non-text) dihitung untuk gap detection
+        if message.id > self.last_message_ids.get(channel, 0):
+            self.last_message_ids[channel] = message.id
+        if not message.text:
+            return
+        
+        self._streamed_ids.setdefault(channel, set()).add(message.id)
+        
+        msg = {
+            'id': message.id,
+            'text': message.text,
+            'date': message.date,
+            'channel': channel,
+            'views': message.views or 0
+        }
+        if self.recorder:
+            self.recorder.record('telegram', msg)
+        self.queue.put_nowait(msg)
+    
+    def _drain_queue(self) -> List[Dict]:
+        messages = []
+        while self.queue is not None and not self.queue.empty():
+            messages.append(self.queue.get_nowait())
+        return messages
+    
+    async def next_messages(self) -> List[Dict]:
+        """Tunggu sampai ada minimal satu pushed message, return semua yang ada di queue"""
+        first = await self.queue.get()
+        return [first] + self._drain_queue()
+    
+    async def get_latest_messages(self, channel: str, limit: int = 10, min_id: int = 0,
+                                  reverse: bool = False) -> List[Dict]:
         """
         Get latest messages from a channel
         
         Args:
             channel: Channel username (without @)
             limit: Number of messages to fetch
+            min_id: Hanya ambil messages dengan id > min_id
+            reverse: True = N messages tertua setelah min_id (oldest first),
+                False = N messages terbaru
             
         Returns:
             List of message dictionaries
         """
+        messages, _, _ = await self._fetch_page(channel, limit, min_id, reverse)
+        return messages
+    
+    async def _fetch_page(self, channel: str, limit: int, min_id: int,
+                          reverse: bool) -> Tuple[List[Dict], int, int]:
+        """
+        Satu iter_messages page
+        
+        Returns:
+            (text messages, id tertinggi yang dilihat termasuk non-text, jumlah raw messages)
+        """
         if not self.client or not self.client.is_connected():
-            return []
+            return [], min_id, 0
         
         try:
             messages = []
-            async for message in self.client.iter_messages(channel, limit=limit):
+            last_id = min_id
+            count = 0
+            async for message in self.client.iter_messages(channel, limit=limit, min_id=min_id, reverse=reverse):
+                count += 1
+                last_id = max(last_id, message.id)
                 if message.text:
                     messages.append({
                         'id': message.id,
@@ -100,41 +242,196 @@ class TelegramNewsScaper:
                         'views': message.views or 0
                     })
             
-            return messages
+            if self.recorder and messages:
+                self.recorder.record_many('telegram', messages)
+            
+            return messages, last_id, count
         
+        except FloodWaitError:
+            raise
         except Exception as e:
             print(f"❌ Error fetching from {channel}: {e}")
+            return [], min_id, 0
+    
+    async def _fetch_page_with_backoff(self, channel: str, limit: int, min_id: int,
+                                       reverse: bool) -> Optional[Tuple[List[Dict], int, int]]:
+        """_fetch_page dengan FloodWait backoff (None = skip, FloodWait terlalu lama)"""
+        for attempt in range(2):
+            # Global pause selama FloodWait masih berlaku
+            wait = self._flood_until - time.monotonic()
+            if wait > 0:
+                if wait > self.max_flood_wait:
+                    return None
+                await asyncio.sleep(wait)
+            
+            try:
+                return await self._fetch_page(channel, limit, min_id, reverse)
+            except FloodWaitError as e:
+                self._flood_until = max(self._flood_until, time.monotonic() + e.seconds)
+                print(f"⏳ Telegram FloodWait {e.seconds}s on @{channel}")
+        return None
+    
+    async def _fetch_channel(self, channel: str) -> List[Dict]:
+        """
+        Fetch messages baru (id > cursor) dari satu channel
+        
+        Dengan cursor: page maju dari cursor (oldest first, TELEGRAM_CATCHUP_LIMIT
+        per page) sampai habis atau TELEGRAM_CATCHUP_MAX_PAGES; cursor hanya maju
+        sampai id terakhir yang benar-benar diterima, sisa backlog diambil di
+        catch-up berikutnya. Tanpa cursor (first run): cukup 5 messages terakhir.
+        """
+        lock = self._channel_locks.setdefault(channel, asyncio.Lock())
+        
+        async with lock, self.fetch_semaphore:
+            start = cursor = self.catch_up_ids.get(channel, 0)
+            messages = []
+            
+            if not cursor:
+                page = await self._fetch_page_with_backoff(channel, 5, 0, False)
+                if page is not None:
+                    messages, cursor, _ = page
+            else:
+                for _ in range(self.catch_up_max_pages):
+                    page = await self._fetch_page_with_backoff(channel, self.catch_up_limit, cursor, True)
+                    if page is None:
+                        break
+                    batch, cursor, count = page
+                    messages.extend(batch)
+                    if count < self.catch_up_limit:
+                        break
+                else:
+                    # Backlog lebih panjang dari max pages: sisanya di catch-up berikutnya
+                    print(f"⚠️ @{channel} backlog exceeds {self.catch_up_max_pages * self.catch_up_limit} "
+                          f"messages, fetched up to id {cursor}; continuing next catch-up")
+                    self._last_catch_up = 0.0
+        
+        if cursor <= start:
             return []
+        
+        self.catch_up_ids[channel] = cursor
+        if self.checkpoint_store:
+            self.checkpoint_store.set_cursor('telegram', channel, cursor)
+        self.last_message_ids[channel] = max(self.last_message_ids.get(channel, 0), cursor)
+        
+        streamed = self._streamed_ids.get(channel, set())
+        
+        # Streamed ids di bawah cursor tidak perlu diingat lagi
+        self._streamed_ids[channel] = {i for i in streamed if i > cursor}
+        return [msg for msg in messages if msg['id'] not in streamed]
     
-    async def get_new_messages_from_all_channels(self) -> List[Dict]:
-        """Get new messages from all monitored channels"""
-        all_messages = []
+    async def catch_up(self, channels: Optional[List[str]] = None) -> List[Dict]:
+        """
+        Isi gap dengan min_id fetch (startup, setelah gap terdeteksi, atau periodik)
         
+        Channels (default semua) di-fetch concurrently. Messages yang sudah
+        diterima lewat streaming di-skip.
+        """
+        if channels is None:
+            self._last_catch_up = time.monotonic()
+        results = await asyncio.gather(*[self._fetch_channel(channel) for channel in channels or self.channels])
+        return [msg for messages in results for msg in messages]
+    
+    async def _head_ids(self) -> Dict[str, int]:
+        """
+        Top message id per channel dari dialogs (GetPeerDialogs)
+        
+        Satu request per TELEGRAM_GAP_BATCH channels, bukan satu per channel.
+        Input peers di-resolve sekali lalu di-cache. Channels yang gagal
+        di-resolve / tidak ada di dialogs tidak masuk hasil (tertutup full
+        catch-up periodik).
+        """
+        peers = []
         for channel in self.channels:
-            messages = await self.get_latest_messages(channel, limit=5)
-            
-            # Filter only new messages
-            last_id = self.last_message_ids.get(channel, 0)
-            new_messages = [msg for msg in messages if msg['id'] > last_id]
-            
-            if new_messages:
-                # Update last message ID
-                self.last_message_ids[channel] = max(msg['id'] for msg in new_messages)
-                all_messages.extend(new_messages)
+            peer = self._input_peers.get(channel)
+            if peer is None:
+                try:
+                    peer = self._input_peers[channel] = await self.client.get_input_entity(channel)
+                except Exception as e:
+                    print(f"❌ Error resolving @{channel}: {e}")
+                    continue
+            peers.append((channel, peer))
+        
+        tops = {}
+        for start in range(0, len(peers), self.gap_batch_size):
+            batch = peers[start:start + self.gap_batch_size]
+            try:
+                result = await self.client(GetPeerDialogsRequest(
+                    peers=[InputDialogPeer(peer) for _, peer in batch]
+                ))
+            except FloodWaitError as e:
+                self._flood_until = max(self._flood_until, time.monotonic() + e.seconds)
+                print(f"⏳ Telegram FloodWait {e.seconds}s on gap check")
+                break
+            except Exception as e:
+                print(f"❌ Error checking Telegram dialogs: {e}")
+                continue
+            tops.update((get_peer_id(dialog.peer), dialog.top_message) for dialog in result.dialogs)
+        
+        return {channel: tops[get_peer_id(peer)] for channel, peer in peers if get_peer_id(peer) in tops}
+    
+    async def detect_gaps(self) -> List[str]:
+        """
+        Channels yang punya message lebih baru dari yang pernah diterima
+        
+        Bandingkan top message id per channel (batched GetPeerDialogs,
+        ceil(channels / TELEGRAM_GAP_BATCH) requests per poll) dengan id
+        terakhir yang masuk lewat push / catch-up, jadi disconnect singkat
+        di antara dua poll (atau update yang di-drop Telethon) tetap
+        terdeteksi tanpa bergantung pada sampling is_connected().
+        """
+        if self._flood_until > time.monotonic():
+            return []
+        heads = await self._head_ids()
+        return [channel for channel, head in heads.items()
+                if head > self.last_message_ids.get(channel, 0)]
+    
+    async def get_new_messages_from_all_channels(self) -> List[Dict]:
+        """
+        Get new messages from all monitored channels
+        
+        Streaming mode: drain pushed messages, plus catch-up untuk channels
+        dengan gap (head id > id terakhir yang diterima) dan full catch-up
+        setiap TELEGRAM_CATCHUP_INTERVAL. Polling mode: catch-up setiap call.
+        """
+        if not self.streaming:
+            return await self.catch_up()
+        
+        all_messages = self._drain_queue()
         
-        return all_messages
+        if self.client.is_connected():
+            if time.monotonic() - self._last_catch_up >= self.catch_up_interval:
+                all_messages.extend(await self.catch_up())
+            else:
+                gaps = await self.detect_gaps()
+                if gaps:
+                    print(f"🔄 Telegram missed updates on {', '.join('@' + c for c in gaps)}, catching up")
+                    all_messages.extend(await self.catch_up(gaps))
+        
+        # Dedupe (message bisa datang dari push & catch-up sekaligus) dan urutkan
+        unique = {(msg['channel'], msg['id']): msg for msg in all_messages}
+        return sorted(unique.values(), key=lambda msg: (msg['date'], msg['id']))
     
     async def disconnect(self):
         """Disconnect from Telegram"""
         if self.client:
+            if self.streaming:
+                self.client.remove_event_handler(self._on_new_message)
+                self.streaming = False
             await self.client.disconnect()
 
 
 class EnhancedNewsAnalyzer:
     """Enhanced AI analyzer dengan sentiment analysis yang lebih canggih"""
     
-    def __init__(self):
-        """Initialize Enhanced News Analyzer"""
+    def __init__(self, cache: Optional[SentimentCache] = None):
+        """
+        Initialize Enhanced News Analyzer
+        
+        Args:
+            cache: Optional SentimentCache untuk skip text yang sudah pernah dianalisis
+        """
+        self.cache = cache
+        
         # Expanded sentiment keywords dengan scoring
         self.bullish_keywords = {
             # Very strong bullish (3 points)
@@ -177,6 +474,42 @@ class EnhancedNewsAnalyzer:
             'CHF': ['franc', 'chf', 'swiss', 'switzerland'],
             'NZD': ['kiwi', 'nzd', 'new zealand']
         }
+        
+        # Arbitrary max untuk normalization score ke -1..1
+        self.max_possible_score = 15
+        
+        self.compile_keywords()
+    
+    def compile_keywords(self):
+        """Compile semua lexicon ke satu KeywordMatcher (panggil ulang jika dict diubah)"""
+        self.matcher = KeywordMatcher()
+        self.matcher.add_lexicon('bullish', self.bullish_keywords)
+        self.matcher.add_lexicon('bearish', self.bearish_keywords)
+        for currency, keywords in self.currency_impact.items():
+            self.matcher.add_lexicon('currency', {keyword: currency for keyword in keywords})
+        
+        # Weight vector per matcher entry (currency entries = 0) untuk analyze_batch
+        entries = self.matcher.entries
+        self._entry_weights = np.array([
+            payload if group in ('bullish', 'bearish') else 0
+            for group, keyword, payload in entries
+        ])
+        
+        # Per entry untuk analyze_batch: group, (keyword, score) tuple, currency index
+        self._batch_currencies = list(dict.fromkeys(
+            payload for group, keyword, payload in entries if group == 'currency'
+        ))
+        currency_index = {currency: i for i, currency in enumerate(self._batch_currencies)}
+        self._entry_groups = np.array([group for group, keyword, payload in entries])
+        self._entry_items = [(keyword, payload) for group, keyword, payload in entries]
+        self._entry_currency = np.array([
+            currency_index.get(payload, -1) if group == 'currency' else -1
+            for group, keyword, payload in entries
+        ], dtype=np.intp)
+        
+        # Lexicon berubah -> cached results tidak valid lagi
+        if self.cache is not None:
+            self.cache.clear()
     
     def analyze_sentiment(self, news_text: str) -> Dict:
         """
@@ -188,28 +521,33 @@ class EnhancedNewsAnalyzer:
         Returns:
             Dict dengan detailed sentiment analysis
         """
-        news_lower = news_text.lower()
+        if self.cache is not None:
+            key = self.cache.text_key(news_text)
+            cached = self.cache.get(key)
+            if cached is not None:
+                return {**cached, 'news_preview': news_text[:200]}
+        
+        # Single pass: sentiment keywords + currencies sekaligus
+        matches = self.matcher.match(news_text)
         
         # Calculate sentiment score
         sentiment_score = 0
         bullish_matches = []
         bearish_matches = []
-        
-        # Check bullish keywords
-        for keyword, score in self.bullish_keywords.items():
-            if keyword in news_lower:
-                sentiment_score += score
-                bullish_matches.append((keyword, score))
-        
-        # Check bearish keywords
-        for keyword, score in self.bearish_keywords.items():
-            if keyword in news_lower:
-                sentiment_score += score  # score is negative
-                bearish_matches.append((keyword, score))
+        affected_currencies = []
+        
+        for group, keyword, payload in matches:
+            if group == 'bullish':
+                sentiment_score += payload
+                bullish_matches.append((keyword, payload))
+            elif group == 'bearish':
+                sentiment_score += payload  # score is negative
+                bearish_matches.append((keyword, payload))
+            elif payload not in affected_currencies:
+                affected_currencies.append(payload)
         
         # Normalize score (-1 to 1)
-        max_possible_score = 15  # Arbitrary max for normalization
-        normalized_score = max(min(sentiment_score / max_possible_score, 1.0), -1.0)
+        normalized_score = max(min(sentiment_score / self.max_possible_score, 1.0), -1.0)
         
         # Determine signal and strength
         if normalized_score >= 0.3:
@@ -232,10 +570,7 @@ class EnhancedNewsAnalyzer:
             signal = 'NEUTRAL'
             strength = 'weak'
         
-        # Detect affected currencies
-        affected_currencies = self.detect_currencies(news_lower)
-        
-        return {
+        result = {
             'sentiment_score': round(normalized_score, 3),
             'raw_score': sentiment_score,
             'signal': signal,
@@ -245,16 +580,133 @@ class EnhancedNewsAnalyzer:
             'affected_currencies': affected_currencies,
             'news_preview': news_text[:200]
         }
+        
+        if self.cache is not None:
+            self.cache.put(key, result)
+        
+        return result
+    
+    def analyze_batch(self, texts: List[str]) -> Dict:
+        """
+        Score banyak messages sekaligus (backlog setelah reconnect, backtest)
+        
+        Semua messages di-match sekaligus (KeywordMatcher.match_batch: satu
+        token stream, token id lookup, tanpa set per message) ke sparse term
+        matrix (COO: row = message, col = keyword), lalu score dihitung dengan
+        satu bincount terhadap keyword weights. Hasil per message identik
+        dengan analyze_sentiment.
+        
+        Args:
+            texts: List of news texts
+            
+        Returns:
+            Dict of arrays: sentiment_score, raw_score, signal, strength,
+            plus bullish_keywords, bearish_keywords dan affected_currencies
+            (list per message)
+        """
+        if self.cache is None:
+            return self._score_batch(texts)
+        
+        # Cache lookup dulu, hanya text unik yang miss yang di-score
+        keys = [self.cache.text_key(text) for text in texts]
+        results = [self.cache.get(key) for key in keys]
+        
+        miss_rows = {}
+        for row, (key, cached) in enumerate(zip(keys, results)):
+            if cached is None and key not in miss_rows:
+                miss_rows[key] = row
+        
+        if miss_rows:
+            scored = self._score_batch([texts[row] for row in miss_rows.values()])
+            fresh = {}
+            for i, key in enumerate(miss_rows):
+                fresh[key] = {
+                    'sentiment_score': float(scored['sentiment_score'][i]),
+                    'raw_score': scored['raw_score'][i].item(),
+                    'signal': str(scored['signal'][i]),
+                    'strength': str(scored['strength'][i]),
+                    'bullish_keywords': scored['bullish_keywords'][i],
+                    'bearish_keywords': scored['bearish_keywords'][i],
+                    'affected_currencies': scored['affected_currencies'][i],
+                    'news_preview': texts[miss_rows[key]][:200]
+                }
+                self.cache.put(key, fresh[key])
+            results = [cached if cached is not None else fresh[key]
+                       for key, cached in zip(keys, results)]
+        
+        return {
+            'sentiment_score': np.array([r['sentiment_score'] for r in results], dtype=np.float64),
+            'raw_score': np.array([r['raw_score'] for r in results], dtype=self._entry_weights.dtype),
+            'signal': np.array([r['signal'] for r in results], dtype='<U7'),
+            'strength': np.array([r['strength'] for r in results], dtype='<U11'),
+            'bullish_keywords': [r['bullish_keywords'] for r in results],
+            'bearish_keywords': [r['bearish_keywords'] for r in results],
+            'affected_currencies': [r['affected_currencies'] for r in results]
+        }
+    
+    def _score_batch(self, texts: List[str]) -> Dict:
+        """Vectorized scoring tanpa cache (lihat analyze_batch)"""
+        n = len(texts)
+        
+        # Semua messages sekaligus: (row, entry id) pairs urut, dari satu token stream
+        rows, cols = self.matcher.match_batch(texts)
+        groups = self._entry_groups[cols]
+        bounds = np.arange(n + 1)
+        
+        def per_message(selected: np.ndarray, values: list) -> List[list]:
+            """Values (urut row) -> satu list per message, slicing tanpa loop per match"""
+            starts = np.searchsorted(rows[selected], bounds).tolist()
+            return list(map(values.__getitem__, map(slice, starts[:-1], starts[1:])))
+        
+        keyword_lists = {}
+        for group in ('bullish', 'bearish'):
+            selected = np.flatnonzero(groups == group)
+            keyword_lists[group] = per_message(
+                selected, list(map(self._entry_items.__getitem__, cols[selected].tolist()))
+            )
+        
+        # Currencies: unik per message, urut kemunculan pertama (sama dengan analyze_sentiment)
+        selected = np.flatnonzero(groups == 'currency')
+        currency = self._entry_currency[cols[selected]]
+        _, first = np.unique(rows[selected] * len(self._batch_currencies) + currency, return_index=True)
+        selected = selected[np.sort(first)]
+        affected_currencies = per_message(
+            selected, list(map(self._batch_currencies.__getitem__, self._entry_currency[cols[selected]].tolist()))
+        )
+        
+        # Sparse matrix (presence = 1) x weight vector
+        raw_score = np.bincount(rows, weights=self._entry_weights[cols], minlength=n)
+        normalized = np.clip(raw_score / self.max_possible_score, -1.0, 1.0)
+        
+        signal = np.select(
+            [normalized >= 0.3, normalized <= -0.3],
+            ['LONG', 'SHORT'],
+            default='NEUTRAL'
+        )
+        
+        magnitude = np.abs(normalized)
+        strength = np.select(
+            [magnitude >= 0.7, magnitude >= 0.5, magnitude >= 0.3],
+            ['very_strong', 'strong', 'moderate'],
+            default='weak'
+        )
+        
+        return {
+            'sentiment_score': np.round(normalized, 3),
+            'raw_score': raw_score.astype(self._entry_weights.dtype),
+            'signal': signal,
+            'strength': strength,
+            'bullish_keywords': keyword_lists['bullish'],
+            'bearish_keywords': keyword_lists['bearish'],
+            'affected_currencies': affected_currencies
+        }
     
     def detect_currencies(self, text: str) -> List[str]:
         """Detect which currencies are mentioned in the news"""
         detected = []
-        for currency, keywords in self.currency_impact.items():
-            for keyword in keywords:
-                if keyword in text:
-                    if currency not in detected:
-                        detected.append(currency)
-                    break
+        for group, keyword, currency in self.matcher.match(text):
+            if group == 'currency' and currency not in detected:
+                detected.append(currency)
         return detected
     
     def get_tradable_pairs(self, affected_currencies: List[str]) -> List[str]:
@@ -300,6 +752,41 @@ class MultiPairForexBot:
         self.stop_loss_percent = float(os.getenv('STOP_LOSS_PERCENT', '1.0'))
         self.take_profit_percent = float(os.getenv('TAKE_PROFIT_PERCENT', '10.0'))
         self.check_interval = int(os.getenv('CHECK_INTERVAL', '60'))
+        self.order_delay = float(os.getenv('ORDER_DELAY', '1'))
+        
+        # Semua terminal calls lewat satu worker thread (event loop tidak pernah blocked)
+        self.terminal = MT5Gateway(mt5) if MT5_AVAILABLE else None
+        
+        # Digits, volume limits, stops level, filling mode + order template per symbol
+        self.order_magic = int(os.getenv('ORDER_MAGIC', '234000'))
+        self.symbols = SymbolCache(
+            self.terminal,
+            ttl=float(os.getenv('SYMBOL_CACHE_TTL', '3600')),
+            deviation=int(os.getenv('ORDER_DEVIATION', '20')),
+            magic=self.order_magic
+        ) if self.terminal else None
+        
+        # Open positions + realized deals (magic ORDER_MAGIC), sync incremental tiap monitor cycle
+        self.position_book = PositionBook(self.terminal, self.order_magic) if self.terminal else None
+        self.position_report_interval = float(os.getenv('POSITION_REPORT_INTERVAL', '300'))
+        self._last_position_report = 0.0
+        
+        # Background tick collector: latest quote & tick windows tanpa terminal round-trip
+        self.ticks = TickCache(
+            self.terminal,
+            capacity=int(os.getenv('TICK_BUFFER_SIZE', '4096')),
+            poll_interval=float(os.getenv('TICK_POLL_INTERVAL', '0.25')),
+            batch_size=int(os.getenv('TICK_BATCH_SIZE', '8'))
+        ) if self.terminal and os.getenv('TICK_CACHE', 'true').lower() == 'true' else None
+        self.tick_max_age = float(os.getenv('TICK_MAX_AGE', '5'))
+        
+        # Multi-pair baskets: order_check + margin dulu, lalu legs dikirim back to back
+        self.basket_executor = BasketExecutor(
+            self.terminal,
+            leg_delay=float(os.getenv('BASKET_LEG_DELAY', '0')),
+            max_margin_usage=float(os.getenv('BASKET_MAX_MARGIN_USAGE', '0.9'))
+        ) if self.terminal else None
+        self.max_spread_points = float(os.getenv('MAX_SPREAD_POINTS', '0'))
         
         # Risk management
         self.max_daily_loss = float(os.getenv('MAX_DAILY_LOSS', '50.0'))
@@ -307,44 +794,145 @@ class MultiPairForexBot:
         self.max_trades_per_day = int(os.getenv('MAX_TRADES_PER_DAY', '20'))
         self.max_consecutive_losses = int(os.getenv('MAX_CONSECUTIVE_LOSSES', '3'))
         
+        # Sentiment cache (shared oleh Telegram & Forex Factory analyzers)
+        cache_ttl = float(os.getenv('SENTIMENT_CACHE_TTL', '0'))
+        self.sentiment_cache = SentimentCache(
+            max_entries=int(os.getenv('SENTIMENT_CACHE_SIZE', '4096')),
+            max_bytes=int(float(os.getenv('SENTIMENT_CACHE_MAX_MB', '16')) * 1024 * 1024),
+            ttl=cache_ttl if cache_ttl > 0 else None
+        )
+        
         # Initialize components
-        self.news_analyzer = EnhancedNewsAnalyzer()
-        self.telegram_scraper = TelegramNewsScaper() if TELETHON_AVAILABLE else None
-        self.forex_factory_scraper = ForexFactoryNewsScraper() if FOREX_FACTORY_AVAILABLE else None
-        self.forex_factory_analyzer = ForexFactoryNewsAnalyzer() if FOREX_FACTORY_AVAILABLE else None
+        self.news_analyzer = EnhancedNewsAnalyzer(cache=self.sentiment_cache)
+        
+        # Optional trained model (SENTIMENT_ENGINE=model)
+        if os.getenv('SENTIMENT_ENGINE', 'keyword').lower() == 'model':
+            model_path = os.getenv('SENTIMENT_MODEL_PATH', 'sentiment_model.npz')
+            if os.path.exists(model_path):
+                self.news_analyzer = ModelNewsAnalyzer(
+                    model_path,
+                    keyword_analyzer=self.news_analyzer,
+                    workers=int(os.getenv('SENTIMENT_MODEL_WORKERS', '0'))
+                )
+                print(f"🧠 Using trained sentiment model: {model_path}")
+            else:
+                print(f"⚠️ Sentiment model {model_path} not found, using keyword engine")
+        
+        # Durable cursors & processed IDs (warm-start setelah restart)
+        self.checkpoints = CheckpointStore(
+            os.getenv('CHECKPOINT_DB', 'forex_bot_state.db'),
+            retention_days=float(os.getenv('CHECKPOINT_RETENTION_DAYS', '7'))
+        )
+        
+        # Optional capture semua news ke file (NEWS_RECORD_PATH) untuk replay
+        record_path = os.getenv('NEWS_RECORD_PATH', '')
+        self.recorder = NewsRecorder(record_path) if record_path else None
+        
+        self.telegram_scraper = TelegramNewsScaper(
+            checkpoint_store=self.checkpoints,
+            recorder=self.recorder
+        ) if TELETHON_AVAILABLE else None
+        self.forex_factory_scraper = ForexFactoryNewsScraper(
+            checkpoint_store=self.checkpoints,
+            processed_events=self.create_dedup_set(),
+            recorder=self.recorder,
+            calendar_cache=CalendarCache(ttl=float(os.getenv('FF_CALENDAR_TTL', '120'))),
+            http_client=AsyncHTTPClient(
+                timeout=float(os.getenv('FF_HTTP_TIMEOUT', '10')),
+                per_host_limit=int(os.getenv('FF_HTTP_PER_HOST', '4')),
+                max_retries=int(os.getenv('FF_HTTP_RETRIES', '3'))
+            ),
+            timezone=os.getenv('FF_TIMEZONE', 'America/New_York'),
+            calendar_source=os.getenv('FF_CALENDAR_SOURCE', 'auto').lower(),
+            feed_source=os.getenv('FF_FEED_SOURCE', DEFAULT_FEED_URL),
+            feed_ttl=float(os.getenv('FF_FEED_TTL', '3600'))
+        ) if FOREX_FACTORY_AVAILABLE else None
+        self.forex_factory_analyzer = ForexFactoryNewsAnalyzer(cache=self.sentiment_cache) if FOREX_FACTORY_AVAILABLE else None
+        
+        # Burst polling di sekitar jam rilis high-impact events (ganti fixed check_interval)
+        self.release_poller = None
+        if self.forex_factory_scraper and self.forex_factory_scraper.calendar_source == 'feed':
+            # Weekly feed tanpa actual: calendar events tidak pernah bisa ditrade
+            print("⚠️ FF_CALENDAR_SOURCE=feed has no actual values: release poller and "
+                  "Forex Factory news trading are disabled (use auto for trading)")
+        elif FOREX_FACTORY_AVAILABLE and os.getenv('FF_RELEASE_POLLER', 'true').lower() == 'true':
+            self.release_poller = ReleasePoller(
+                self.forex_factory_scraper,
+                on_changes=self.dispatch_calendar_changes,
+                idle_interval=self.check_interval,
+                lead_seconds=float(os.getenv('FF_BURST_LEAD', '5')),
+                burst_interval=float(os.getenv('FF_BURST_INTERVAL', '1')),
+                burst_timeout=float(os.getenv('FF_BURST_TIMEOUT', '120'))
+            )
         
         # Tracking
         self.is_running = False
         self.daily_trades = 0
         self.daily_profit = 0.0
         self.consecutive_losses = 0
-        self.processed_news_ids = set()
-        
-        # Available pairs
+        self.processed_news_ids = self.create_dedup_set()
+        self.processed_news_ids.update(self.checkpoints.processed_ids('news'))
+        self._telegram_lock = asyncio.Lock()
+        
+        # Event-driven stages (dibuat di run_async); None = proses langsung (replay/benchmark)
+        self.pipeline = None
+        self.news_queue = None
+        self.calendar_queue = None
+        self.order_queue = None
+        self.monitor_interval = float(os.getenv('MONITOR_INTERVAL', str(self.check_interval)))
+        self.news_queue_size = int(os.getenv('NEWS_QUEUE_SIZE', '100'))
+        self.order_queue_size = int(os.getenv('ORDER_QUEUE_SIZE', '50'))
+        
+        # Near-duplicate filter untuk story yang di-repost dengan wording lain
+        self.near_duplicates = NearDuplicateDetector(
+            similarity=float(os.getenv('NEWS_DUP_SIMILARITY', '0.6')),
+            window_seconds=float(os.getenv('NEWS_DUP_WINDOW', '3600'))
+        )
+        
+        # Available pairs + currency -> (symbol, side) index
         self.available_pairs = []
+        self.pair_index = PairOrientationIndex([])
+    
+    @staticmethod
+    def create_dedup_set() -> TTLDedupSet:
+        """Bounded TTL dedup set untuk processed IDs (config dari .env)"""
+        return TTLDedupSet(
+            ttl_seconds=float(os.getenv('NEWS_DEDUP_TTL_HOURS', '168')) * 3600,
+            capacity=int(os.getenv('NEWS_DEDUP_CAPACITY', '200000')),
+            fp_rate=float(os.getenv('NEWS_DEDUP_FP_RATE', '0.001'))
+        )
     
-    def connect_mt5(self) -> bool:
+    def mark_processed(self, news_id: str):
+        """Mark news/event sebagai processed (memory + checkpoint store)"""
+        self.processed_news_ids.add(news_id)
+        self.checkpoints.mark_processed('news', news_id)
+    
+    async def connect_mt5(self) -> bool:
         """Connect to MetaTrader 5 with credentials from .env"""
+        if not MT5_AVAILABLE:
+            print("❌ MetaTrader5 package not available")
+            return False
+        
         # Initialize with path if provided
         if self.mt5_path:
-            if not mt5.initialize(path=self.mt5_path):
+            if not await self.terminal.initialize(path=self.mt5_path):
                 print("❌ MT5 initialization failed with provided path")
-                print(f"Error: {mt5.last_error()}")
+                print(f"Error: {await self.terminal.last_error()}")
                 # Try without path
-                if not mt5.initialize():
+                if not await self.terminal.initialize():
                     print("❌ MT5 initialization failed")
                     return False
         else:
-            if not mt5.initialize():
+            if not await self.terminal.initialize():
                 print("❌ MT5 initialization failed")
-                print(f"Error: {mt5.last_error()}")
+                print(f"Error: {await self.terminal.last_error()}")
                 return False
         
         print("✅ MT5 initialized")
         
         # Login to account
         if self.mt5_login and self.mt5_password and self.mt5_server:
-            authorized = mt5.login(
+            authorized = await self.terminal.login(
                 login=self.mt5_login,
                 password=self.mt5_password,
                 server=self.mt5_server
@@ -352,14 +940,14 @@ class MultiPairForexBot:
             
             if not authorized:
                 print(f"❌ MT5 login failed for account {self.mt5_login}")
-                print(f"Error: {mt5.last_error()}")
+                print(f"Error: {await self.terminal.last_error()}")
                 return False
             
             print(f"✅ Logged in to MT5 account: {self.mt5_login}")
             print(f"   Server: {self.mt5_server}")
             
             # Get account info
-            account_info = mt5.account_info()
+            account_info = await self.terminal.account_info()
             if account_info:
                 print(f"   Balance: ${account_info.balance:.2f}")
                 print(f"   Equity: ${account_info.equity:.2f}")
@@ -375,14 +963,18 @@ class MultiPairForexBot:
             print("⚠️ No MT5 credentials in .env, using already logged-in account")
         
         # Get available pairs
-        self.available_pairs = self.get_all_forex_pairs()
+        self.available_pairs = await self.get_all_forex_pairs()
+        self.pair_index = PairOrientationIndex(self.available_pairs)
         print(f"\n✅ Found {len(self.available_pairs)} tradable forex pairs")
         
+        await self.symbols.load(self.available_pairs)
+        print(f"✅ Cached symbol specs & order templates for {len(self.symbols)} pairs")
+        
         return True
     
-    def get_all_forex_pairs(self) -> List[str]:
+    async def get_all_forex_pairs(self) -> List[str]:
         """Get all available forex pairs from broker"""
-        symbols = mt5.symbols_get()
+        symbols = await self.terminal.symbols_get()
         if symbols is None:
             return []
         
@@ -399,29 +991,52 @@ class MultiPairForexBot:
                 quote = symbol_name[3:]
                 
                 if base in forex_currencies and quote in forex_currencies:
-                    if symbol.visible or mt5.symbol_select(symbol_name, True):
+                    if symbol.visible or await self.terminal.symbol_select(symbol_name, True):
                         forex_pairs.append(symbol_name)
         
         return sorted(forex_pairs)
     
     def calculate_sl_tp(self, pair: str, order_type: str, entry_price: float) -> Tuple[float, float]:
         """Calculate Stop Loss and Take Profit levels"""
+        spec = self.symbols.get(pair) if self.symbols else None
+        min_distance = spec.stop_distance() if spec else 0.0
+        
         if order_type == 'LONG':
-            stop_loss = entry_price * (1 - self.stop_loss_percent / 100)
-            take_profit = entry_price * (1 + self.take_profit_percent / 100)
+            stop_loss = min(entry_price * (1 - self.stop_loss_percent / 100), entry_price - min_distance)
+            take_profit = max(entry_price * (1 + self.take_profit_percent / 100), entry_price + min_distance)
         else:  # SHORT
-            stop_loss = entry_price * (1 + self.stop_loss_percent / 100)
-            take_profit = entry_price * (1 - self.take_profit_percent / 100)
+            stop_loss = max(entry_price * (1 + self.stop_loss_percent / 100), entry_price + min_distance)
+            take_profit = min(entry_price * (1 - self.take_profit_percent / 100), entry_price - min_distance)
         
         # Round to proper digits
-        symbol_info = mt5.symbol_info(pair)
-        if symbol_info:
-            digits = symbol_info.digits
-            stop_loss = round(stop_loss, digits)
-            take_profit = round(take_profit, digits)
+        if spec:
+            stop_loss = round(stop_loss, spec.digits)
+            take_profit = round(take_profit, spec.digits)
         
         return stop_loss, take_profit
     
+    async def get_quote(self, pair: str):
+        """Latest bid/ask dari tick cache, fallback symbol_info_tick jika collector tidak jalan"""
+        if self.ticks and self.ticks.is_fresh(self.tick_max_age):
+            quote = self.ticks.latest(pair)
+            if quote is not None:
+                return quote
+        return await self.terminal.symbol_info_tick(pair)
+    
+    def check_spread(self, pair: str, tick) -> bool:
+        """Skip order jika spread > MAX_SPREAD_POINTS (0 = tanpa limit)"""
+        spec = self.symbols.get(pair)
+        if not self.max_spread_points or spec is None or not spec.point:
+            return True
+        
+        spread_points = (tick.ask - tick.bid) / spec.point
+        if spread_points > self.max_spread_points:
+            volatility = self.ticks.volatility(pair) if self.ticks else None
+            detail = f", tick volatility {volatility:.2e}" if volatility is not None else ""
+            print(f"⚠️ Skip {pair}: spread {spread_points:.0f} points > {self.max_spread_points:.0f}{detail}")
+            return False
+        return True
+    
     def check_risk_limits(self) -> bool:
         """Check if we can still trade based on risk management rules"""
         if self.daily_trades >= self.max_trades_per_day:
@@ -443,66 +1058,86 @@ class MultiPairForexBot:
         
         return True
     
-    def open_position(self, pair: str, signal: str, sentiment_data: Dict) -> bool:
+    async def prepare_leg(self, pair: str, signal: str, sentiment_data: Dict) -> Optional[BasketLeg]:
         """
-        Open trading position
+        Build order request untuk satu pair (cached spec + quote, tanpa order_send)
         
-        Args:
-            pair: Currency pair (e.g. 'EURUSD')
-            signal: 'LONG' or 'SHORT'
-            sentiment_data: Sentiment analysis data
-            
         Returns:
-            True if successful, False otherwise
+            BasketLeg, atau None jika pair tidak bisa ditrade sekarang
         """
-        if not self.check_risk_limits():
-            return False
-        
-        # Check if symbol exists and is tradable
-        symbol_info = mt5.symbol_info(pair)
-        if symbol_info is None:
+        # Check if symbol exists and is tradable (cached spec, tanpa terminal call)
+        spec = await self.symbols.ensure(pair)
+        if spec is None:
             print(f"⚠️ Pair {pair} not found")
-            return False
+            return None
         
-        if not symbol_info.visible:
-            if not mt5.symbol_select(pair, True):
+        if not spec.visible:
+            if not await self.terminal.symbol_select(pair, True):
                 print(f"⚠️ Failed to select {pair}")
-                return False
+                return None
+            spec.visible = True
         
         # Get current price
-        tick = mt5.symbol_info_tick(pair)
+        tick = await self.get_quote(pair)
         if tick is None:
             print(f"❌ Failed to get tick for {pair}")
-            return False
+            return None
+        
+        if not self.check_spread(pair, tick):
+            return None
         
         price = tick.ask if signal == 'LONG' else tick.bid
         
         # Calculate SL and TP
         sl, tp = self.calculate_sl_tp(pair, signal, price)
+        volume = spec.normalize_volume(self.default_lot_size)
+        if volume is None:
+            print(f"⚠️ Skipping {pair}: lot size {self.default_lot_size} below broker minimum "
+                  f"{spec.volume_min} (step {spec.volume_step})")
+            return None
         
-        # Prepare order request
+        # Prepare order request (template: filling mode, deviation, magic)
         order_type = mt5.ORDER_TYPE_BUY if signal == 'LONG' else mt5.ORDER_TYPE_SELL
         
-        request = {
-            "action": mt5.TRADE_ACTION_DEAL,
-            "symbol": pair,
-            "volume": self.default_lot_size,
-            "type": order_type,
-            "price": price,
-            "sl": sl,
-            "tp": tp,
-            "deviation": 20,
-            "magic": 234000,
-            "comment": f"AI_{sentiment_data['strength']}_{sentiment_data['sentiment_score']}",
-            "type_time": mt5.ORDER_TIME_GTC,
-            "type_filling": mt5.ORDER_FILLING_IOC,
-        }
+        request = spec.order_request(
+            order_type, price, sl, tp, volume,
+            f"AI_{sentiment_data['strength']}_{sentiment_data['sentiment_score']}"
+        )
+        return BasketLeg(pair, signal, request, spec.point)
+    
+    async def open_position(self, pair: str, signal: str, sentiment_data: Dict) -> bool:
+        """
+        Open trading position
+        
+        Args:
+            pair: Currency pair (e.g. 'EURUSD')
+            signal: 'LONG' or 'SHORT'
+            sentiment_data: Sentiment analysis data
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        if not self.check_risk_limits():
+            return False
+        
+        leg = await self.prepare_leg(pair, signal, sentiment_data)
+        if leg is None:
+            return False
+        request = leg.request
+        price, sl, tp, volume = request['price'], request['sl'], request['tp'], request['volume']
         
         # Send order
-        result = mt5.order_send(request)
+        result = await self.terminal.call('order_send', request, priority=PRIORITY_ORDER)
+        
+        if result is None:
+            print(f"❌ Order failed for {pair}: {await self.terminal.last_error()}")
+            return False
         
         if result.retcode != mt5.TRADE_RETCODE_DONE:
             print(f"❌ Order failed for {pair}: {result.comment}")
+            # Broker ganti spec (filling / volume / stops): reload sebelum order berikutnya
+            if result.retcode in SPEC_CHANGED_RETCODES:
+                await self.symbols.load([pair])
             return False
         
         # Update tracking
@@ -514,7 +1149,7 @@ class MultiPairForexBot:
         print(f"Entry Price: {price:.5f}")
         print(f"Stop Loss: {sl:.5f} (-{self.stop_loss_percent}%)")
         print(f"Take Profit: {tp:.5f} (+{self.take_profit_percent}%)")
-        print(f"Volume: {self.default_lot_size}")
+        print(f"Volume: {volume}")
         print(f"Sentiment Score: {sentiment_data['sentiment_score']:.3f}")
         print(f"Signal Strength: {sentiment_data['strength']}")
         print(f"Order ID: {result.order}")
@@ -523,52 +1158,171 @@ class MultiPairForexBot:
         
         return True
     
-    def monitor_positions(self):
-        """Monitor all open positions"""
-        positions = mt5.positions_get()
-        if positions is None or len(positions) == 0:
+    async def monitor_positions(self):
+        """
+        Sync position book, update daily P/L (realized + floating) & consecutive losses
+        
+        Output: ringkasan setiap POSITION_REPORT_INTERVAL detik, atau segera
+        jika ada position yang dibuka / ditutup.
+        """
+        changes = await self.position_book.sync()
+        if changes is None:
             return
         
-        print(f"\n📊 Monitoring {len(positions)} open position(s)...")
+        for pnl in changes['closed_pnl']:
+            self.consecutive_losses = self.consecutive_losses + 1 if pnl < 0 else 0
+        self.daily_profit = self.position_book.daily_pnl
         
-        total_profit = 0.0
-        for pos in positions:
-            # Calculate current profit percentage
-            if pos.type == mt5.ORDER_TYPE_BUY:
-                profit_pct = ((pos.price_current - pos.price_open) / pos.price_open) * 100
-            else:
-                profit_pct = ((pos.price_open - pos.price_current) / pos.price_open) * 100
-            
-            total_profit += pos.profit
-            
-            status = "🟢" if pos.profit > 0 else "🔴"
-            print(f"{status} {pos.symbol} #{pos.ticket}: {profit_pct:+.2f}% | "
-                  f"P/L: ${pos.profit:.2f} | Price: {pos.price_current:.5f}")
+        now = time.monotonic()
+        if not (changes['opened'] or changes['closed']
+                or now - self._last_position_report >= self.position_report_interval):
+            return
+        if not len(self.position_book.positions) and not changes['closed'] and not self.position_book.deals:
+            return
+        self._last_position_report = now
+        
+        lines = self.position_book.summary()
+        moved = ""
+        if changes['opened'] or changes['closed']:
+            moved = f" (+{changes['opened']} opened, -{changes['closed']} closed)"
+        print(f"\n📊 Positions: {lines[0]}{moved}")
+        for line in lines[1:]:
+            print(f"   {line}")
+    
+    async def submit_basket(self, legs: List[Tuple[str, str]], sentiment_data: Dict):
+        """Kirim basket (pair, side) ke execution stage (atau langsung jika pipeline tidak jalan)"""
+        if self.order_queue is not None:
+            await self.order_queue.put((legs, sentiment_data))
+        else:
+            await self.execute_basket((legs, sentiment_data))
+    
+    async def execute_basket(self, basket: Tuple[List[Tuple[str, str]], Dict]):
+        """
+        Execution stage: prepare semua legs, validasi, submit back to back
+        
+        Jeda ORDER_DELAY hanya antar basket; jeda antar leg = BASKET_LEG_DELAY.
+        """
+        legs, sentiment_data = basket
+        if not self.check_risk_limits():
+            return
+        
+        # Jangan melewati MAX_TRADES_PER_DAY di tengah basket
+        legs = legs[:self.max_trades_per_day - self.daily_trades]
+        prepared = []
+        for pair, side in legs:
+            leg = await self.prepare_leg(pair, side, sentiment_data)
+            if leg is not None:
+                prepared.append(leg)
+        if not prepared:
+            return
         
-        print(f"💰 Total Floating P/L: ${total_profit:.2f}")
-        self.daily_profit = total_profit
+        report = await self.basket_executor.execute(prepared)
+        self.daily_trades += len(report.filled)
+        
+        for leg in report.legs:
+            if leg.retcode in SPEC_CHANGED_RETCODES:
+                await self.symbols.load([leg.symbol])
+        
+        stats = report.stats()
+        print(f"\n🧺 Basket {sentiment_data['strength']} ({sentiment_data['sentiment_score']:.3f}): "
+              f"{stats['filled']}/{stats['legs']} filled, {stats['rejected']} rejected before send"
+              + (f", last fill +{stats['spread_ms']:.1f} ms after first" if stats['spread_ms'] is not None else ""))
+        for line in report.lines():
+            print(f"   {line}")
+        print(f"   Daily Trades: {self.daily_trades}/{self.max_trades_per_day}")
+        
+        await asyncio.sleep(self.order_delay)
+    
+    async def dispatch_calendar_changes(self, changes: List[CalendarChange]):
+        """Calendar ingestion -> analysis stage"""
+        if self.calendar_queue is not None:
+            await self.calendar_queue.put(changes)
+        else:
+            await self.process_forex_factory_news(changes)
+    
+    async def dispatch_news(self, messages: List[Dict]):
+        """Telegram ingestion -> analysis stage"""
+        if self.news_queue is not None:
+            await self.news_queue.put(messages)
+        else:
+            await self.process_telegram_news(messages)
     
-    async def process_forex_factory_news(self):
-        """Process news dari Forex Factory economic calendar"""
+    async def poll_forex_factory(self):
+        """Calendar ingestion tanpa ReleasePoller (setiap check_interval)"""
+        print("\n📊 Checking Forex Factory economic calendar...")
+        changes = await self.forex_factory_scraper.get_high_impact_changes(hours_ahead=2)
+        if changes:
+            await self.dispatch_calendar_changes(changes)
+        else:
+            print("   No new or updated high-impact events in next 2 hours")
+    
+    async def poll_telegram(self):
+        """Telegram ingestion: catch-up / polling setiap check_interval"""
+        messages = await self.telegram_scraper.get_new_messages_from_all_channels()
+        if messages:
+            await self.dispatch_news(messages)
+    
+    async def monitor_cycle(self):
+        """Monitoring stage: daily reset, symbol specs refresh, open positions"""
+        current_time = datetime.now()
+        print(f"\n⏰ {current_time.strftime('%Y-%m-%d %H:%M:%S')}")
+        
+        # Reset daily counters at midnight
+        if current_time.day != self._last_day:
+            print("\n🔄 New trading day - Resetting counters")
+            self.daily_trades = 0
+            self.daily_profit = 0.0
+            self.consecutive_losses = 0
+            self.position_book.reset_day()
+            self._last_day = current_time.day
+        
+        # Reload symbol specs setiap SYMBOL_CACHE_TTL
+        await self.symbols.refresh_if_stale()
+        
+        # Monitor existing positions
+        await self.monitor_positions()
+        
+        if self.pipeline:
+            depths = ', '.join(f"{name} {queue.qsize()}/{queue.maxsize}"
+                               for name, queue in self.pipeline.queues.items())
+            print(f"🧵 Queues: {depths}")
+    
+    async def process_forex_factory_news(self, changes: Optional[List[CalendarChange]] = None):
+        """
+        Process news dari Forex Factory economic calendar
+        
+        Args:
+            changes: High impact changes dari ReleasePoller (None = fetch dulu)
+        """
         if not self.forex_factory_scraper or not self.forex_factory_analyzer:
             return
         
-        print("\n📊 Checking Forex Factory economic calendar...")
+        if changes is None:
+            print("\n📊 Checking Forex Factory economic calendar...")
         
         try:
             # Get upcoming high impact events (dalam 2 jam ke depan)
-            upcoming_events = self.forex_factory_scraper.get_high_impact_events(hours_ahead=2)
+            # Hanya events yang baru atau berubah (e.g. actual baru rilis) sejak check sebelumnya
+            upcoming_changes = changes
+            if upcoming_changes is None:
+                upcoming_changes = await self.forex_factory_scraper.get_high_impact_changes(hours_ahead=2)
             
-            if not upcoming_events:
-                print("   No high-impact events in next 2 hours")
+            if not upcoming_changes:
+                print("   No new or updated high-impact events in next 2 hours")
                 return
             
-            print(f"   Found {len(upcoming_events)} high-impact event(s)")
+            print(f"   Found {len(upcoming_changes)} new/updated high-impact event(s)")
             
-            for event in upcoming_events:
+            for change in upcoming_changes:
+                event = change.event
+                
                 # Create unique ID
                 event_id = event['id']
                 
+                for field in change.revised_fields:
+                    old, new = change.changes[field]
+                    print(f"   📝 {event['currency']} - {event['event']}: {field} revised {old} → {new}")
+                
                 # Skip if already processed
                 if event_id in self.processed_news_ids:
                     continue
@@ -595,49 +1349,51 @@ class MultiPairForexBot:
                         # Get affected currency
                         currency = event['currency']
                         
-                        # Get tradable pairs for this currency
-                        if currency in ['USD', 'EUR', 'GBP', 'JPY', 'AUD', 'CAD', 'CHF', 'NZD']:
-                            target_pairs = self.news_analyzer.get_tradable_pairs([currency])
+                        # Get broker symbols + order side untuk currency ini (limit 5 per event)
+                        legs = self.pair_index.select([currency], analysis['signal'], limit=5)
+                        
+                        if legs and self.check_risk_limits():
+                            print(f"   💹 Trading pairs: {', '.join(f'{p} {side}' for p, side in legs)}")
                             
-                            # Filter to only available pairs
-                            tradable = [p for p in target_pairs if p in self.available_pairs]
+                            # Create sentiment data untuk logging
+                            sentiment_data = {
+                                'sentiment_score': analysis['sentiment_score'],
+                                'strength': analysis['strength'],
+                                'source': 'ForexFactory',
+                                'event_name': event['event']
+                            }
                             
-                            if tradable:
-                                print(f"   💹 Trading pairs: {', '.join(tradable[:5])}")
-                                
-                                # Open positions (limit to 5 pairs per event)
-                                for pair in tradable[:5]:
-                                    if not self.check_risk_limits():
-                                        break
-                                    
-                                    # Create sentiment data untuk logging
-                                    sentiment_data = {
-                                        'sentiment_score': analysis['sentiment_score'],
-                                        'strength': analysis['strength'],
-                                        'source': 'ForexFactory',
-                                        'event_name': event['event']
-                                    }
-                                    
-                                    self.open_position(pair, analysis['signal'], sentiment_data)
-                                    time.sleep(1)  # Small delay
+                            await self.submit_basket(legs, sentiment_data)
                 
                 # Mark as processed
-                self.processed_news_ids.add(event_id)
+                self.mark_processed(event_id)
         
         except Exception as e:
             print(f"❌ Error processing Forex Factory news: {e}")
     
-    async def process_telegram_news(self):
-        """Process news from Telegram channels"""
+    async def process_telegram_news(self, messages: Optional[List[Dict]] = None):
+        """
+        Process news from Telegram channels
+        
+        Args:
+            messages: Pushed messages dari streaming (None = fetch/catch-up dulu)
+        """
         if not self.telegram_scraper or not self.telegram_scraper.client:
             print("⚠️ Telegram scraper not available")
             return
         
-        print("\n📱 Fetching news from Telegram channels...")
+        # Streaming task dan main loop bisa masuk bersamaan
+        async with self._telegram_lock:
+            await self._process_telegram_news(messages)
+    
+    async def _process_telegram_news(self, messages: Optional[List[Dict]]):
+        if messages is None:
+            print("\n📱 Fetching news from Telegram channels...")
         
         try:
             # Get new messages
-            messages = await self.telegram_scraper.get_new_messages_from_all_channels()
+            if messages is None:
+                messages = await self.telegram_scraper.get_new_messages_from_all_channels()
             
             if not messages:
                 print("   No new messages")
@@ -645,19 +1401,46 @@ class MultiPairForexBot:
             
             print(f"   Found {len(messages)} new message(s)")
             
-            for msg in messages:
-                # Create unique ID for this message
+            # Skip messages yang sudah diproses
+            pending = [
+                msg for msg in messages
+                if f"{msg['channel']}_{msg['id']}" not in self.processed_news_ids
+            ]
+            
+            # Skip repost / near-duplicate dari story yang sudah ditrade
+            unique = []
+            for msg in pending:
                 msg_id = f"{msg['channel']}_{msg['id']}"
-                
-                # Skip if already processed
-                if msg_id in self.processed_news_ids:
+                original = self.near_duplicates.check_and_add(msg['text'], msg_id)
+                if original is not None:
+                    print(f"   ♻️ Skip @{msg['channel']} #{msg['id']}: near-duplicate of {original}")
+                    self.mark_processed(msg_id)
                     continue
+                unique.append(msg)
+            pending = unique
+            
+            # Score seluruh backlog sekaligus (model inference jalan di luar event loop)
+            texts = [msg['text'] for msg in pending]
+            if isinstance(self.news_analyzer, ModelNewsAnalyzer):
+                batch = await self.news_analyzer.analyze_batch_async(texts)
+            else:
+                batch = self.news_analyzer.analyze_batch(texts)
+            
+            for i, msg in enumerate(pending):
+                # Create unique ID for this message
+                msg_id = f"{msg['channel']}_{msg['id']}"
                 
                 print(f"\n📰 New message from @{msg['channel']}:")
                 print(f"   {msg['text'][:150]}...")
                 
-                # Analyze sentiment
-                sentiment = self.news_analyzer.analyze_sentiment(msg['text'])
+                sentiment = {
+                    'sentiment_score': float(batch['sentiment_score'][i]),
+                    'raw_score': batch['raw_score'][i].item(),
+                    'signal': str(batch['signal'][i]),
+                    'strength': str(batch['strength'][i]),
+                    'affected_currencies': batch['affected_currencies'][i],
+                    'news_preview': msg['text'][:200]
+                }
                 
                 print(f"   📊 Sentiment: {sentiment['signal']} "
                       f"(Score: {sentiment['sentiment_score']:.3f}, "
@@ -672,50 +1455,84 @@ class MultiPairForexBot:
                         if affected_currencies:
                             print(f"   🎯 Affected currencies: {', '.join(affected_currencies)}")
                             
-                            # Get tradable pairs
-                            target_pairs = self.news_analyzer.get_tradable_pairs(affected_currencies)
+                            # Get broker symbols + order side (limit 5 pairs per news)
+                            legs = self.pair_index.select(affected_currencies, sentiment['signal'], limit=5)
                             
-                            # Filter to only available pairs
-                            tradable = [p for p in target_pairs if p in self.available_pairs]
-                            
-                            if tradable:
-                                print(f"   💹 Trading pairs: {', '.join(tradable[:5])}")  # Show first 5
+                            if legs:
+                                print(f"   💹 Trading pairs: {', '.join(f'{p} {side}' for p, side in legs)}")
                                 
-                                # Open positions
-                                for pair in tradable[:5]:  # Limit to 5 pairs per news
-                                    if not self.check_risk_limits():
-                                        break
-                                    
-                                    self.open_position(pair, sentiment['signal'], sentiment)
-                                    time.sleep(1)  # Small delay between orders
+                                # Open positions (satu basket)
+                                if self.check_risk_limits():
+                                    await self.submit_basket(legs, sentiment)
                             else:
                                 print(f"   ⚠️ No tradable pairs found for affected currencies")
                         else:
                             # Trade major pairs if no specific currency detected
                             print(f"   🌍 No specific currency detected, trading majors")
                             major_pairs = ['EURUSD', 'GBPUSD', 'USDJPY']
+                            legs = [(pair, sentiment['signal']) for pair in major_pairs if pair in self.pair_index]
                             
-                            for pair in major_pairs:
-                                if pair in self.available_pairs:
-                                    if not self.check_risk_limits():
-                                        break
-                                    self.open_position(pair, sentiment['signal'], sentiment)
-                                    time.sleep(1)
+                            if legs and self.check_risk_limits():
+                                await self.submit_basket(legs, sentiment)
                 
                 # Mark as processed
-                self.processed_news_ids.add(msg_id)
+                self.mark_processed(msg_id)
         
         except Exception as e:
             print(f"❌ Error processing Telegram news: {e}")
     
+    async def stream_telegram_news(self):
+        """Process setiap pushed Telegram post begitu datang (tanpa tunggu check_interval)"""
+        while self.telegram_scraper.streaming:
+            messages = await self.telegram_scraper.next_messages()
+            print(f"\n⚡ {len(messages)} pushed Telegram message(s)")
+            await self.dispatch_news(messages)
+    
     async def run_async(self):
-        """Main async loop for bot"""
-        if not self.connect_mt5():
+        """
+        Main async entry point
+        
+        Ingestion (Telegram stream/catch-up, calendar poller), analysis,
+        execution dan position monitoring jalan sebagai task terpisah dengan
+        cadence sendiri, dihubungkan oleh bounded queues.
+        """
+        if not await self.connect_mt5():
             return
         
+        pipeline = self.pipeline = Pipeline()
+        self.news_queue = pipeline.queue('news', self.news_queue_size)
+        self.calendar_queue = pipeline.queue('calendar', self.news_queue_size)
+        self.order_queue = pipeline.queue('orders', self.order_queue_size)
+        
         # Connect to Telegram
+        streaming = False
         if self.telegram_scraper:
-            await self.telegram_scraper.connect()
+            if await self.telegram_scraper.connect():
+                streaming = await self.telegram_scraper.start_streaming()
+        
+        if self.ticks:
+            self.ticks.set_symbols(self.available_pairs)
+            await self.ticks.poll()
+            pipeline.add_task('ticks', self.ticks.run())
+        
+        # Ingestion
+        if streaming:
+            pipeline.add_task('telegram_stream', self.stream_telegram_news())
+        if self.telegram_scraper and self.telegram_scraper.client:
+            pipeline.add_periodic('telegram_poll', self.check_interval, self.poll_telegram)
+        if self.release_poller:
+            pipeline.add_task('calendar_poller', self.release_poller.run())
+        elif self.forex_factory_scraper:
+            pipeline.add_periodic('calendar_poll', self.check_interval, self.poll_forex_factory)
+        
+        # Analysis -> execution
+        pipeline.add_worker('telegram_analysis', self.news_queue, self.process_telegram_news, size=len)
+        pipeline.add_worker('calendar_analysis', self.calendar_queue, self.process_forex_factory_news, size=len)
+        pipeline.add_worker('execution', self.order_queue, self.execute_basket, size=lambda basket: len(basket[0]))
+        
+        # Monitoring
+        self._last_day = datetime.now().day
+        pipeline.add_periodic('monitor', self.monitor_interval, self.monitor_cycle)
         
         self.is_running = True
         
@@ -730,39 +1547,25 @@ class MultiPairForexBot:
         print(f"Max Daily Trades: {self.max_trades_per_day}")
         print(f"Max Daily Loss: ${self.max_daily_loss}")
         print(f"Max Daily Profit: ${self.max_daily_profit}")
+        print(f"Stages: {', '.join(pipeline.metrics)}")
         print(f"{'='*70}\n")
         
-        last_day = datetime.now().day
-        
         try:
-            while self.is_running:
-                current_time = datetime.now()
-                print(f"\n⏰ {current_time.strftime('%Y-%m-%d %H:%M:%S')}")
-                
-                # Reset daily counters at midnight
-                if current_time.day != last_day:
-                    print("\n🔄 New trading day - Resetting counters")
-                    self.daily_trades = 0
-                    self.daily_profit = 0.0
-                    self.consecutive_losses = 0
-                    last_day = current_time.day
-                
-                # Monitor existing positions
-                self.monitor_positions()
-                
-                # Process news from Forex Factory (economic calendar)
-                await self.process_forex_factory_news()
-                
-                # Process news from Telegram
-                await self.process_telegram_news()
-                
-                # Wait for next cycle
-                print(f"\n💤 Waiting {self.check_interval} seconds for next check...")
-                await asyncio.sleep(self.check_interval)
-        
-        except KeyboardInterrupt:
+            await pipeline.wait()
+        except (KeyboardInterrupt, asyncio.CancelledError):
             print("\n\n⚠️ Bot stopped by user")
         finally:
+            if self.release_poller:
+                self.release_poller.stop()
+            if self.ticks:
+                self.ticks.stop()
+            dropped = await pipeline.shutdown()
+            if dropped.get('orders'):
+                print(f"⚠️ {dropped['orders']} queued order(s) not sent")
+            print("🧵 Pipeline stages:")
+            for line in pipeline.summary():
+                print(f"   {line}")
+            self.news_queue = self.calendar_queue = self.order_queue = None
             await self.shutdown()
     
     async def shutdown(self):
@@ -772,7 +1575,64 @@ class MultiPairForexBot:
         if self.telegram_scraper:
             await self.telegram_scraper.disconnect()
         
-        mt5.shutdown()
+        if isinstance(self.news_analyzer, ModelNewsAnalyzer):
+            self.news_analyzer.close()
+        
+        dedup = self.processed_news_ids.stats()
+        print(f"🧹 Dedup set: {dedup['items']} IDs, {dedup['memory_bytes'] / 1024:.0f} KB, "
+              f"{dedup['expired']} expired, {dedup['evictions']} evicted")
+        
+        stats = self.sentiment_cache.stats()
+        print(f"🗃️ Sentiment cache: {stats['hits']} hits / {stats['misses']} misses "
+              f"(hit rate {stats['hit_rate']:.1%}), {stats['evictions']} evictions")
+        
+        if self.forex_factory_scraper:
+            await self.forex_factory_scraper.close()
+            http = self.forex_factory_scraper.http.stats()
+            print(f"🌐 Forex Factory HTTP ({http['backend']}): {http['requests']} requests, "
+                  f"{http['retries']} retries, {http['failures']} failures, "
+                  f"avg {http['avg_request_ms']:.0f} ms")
+            if self.release_poller:
+                poller = self.release_poller.stats()
+                if poller['releases']:
+                    print(f"⚡ Release detection: {poller['releases']} releases, "
+                          f"median {poller['latency_median']:.1f}s, max {poller['latency_max']:.1f}s "
+                          f"({poller['burst_polls']} burst polls)")
+            calendar = self.forex_factory_scraper.calendar_cache.stats()
+            print(f"📅 Calendar cache: {calendar['requests']} requests, "
+                  f"{calendar['bytes_downloaded'] / 1024:.0f} KB downloaded, "
+                  f"hit rate {calendar['hit_rate']:.1%}, "
+                  f"{calendar['parse_seconds_saved']:.2f}s parse time saved")
+            sources = self.forex_factory_scraper.source_stats()
+            print(f"📅 Calendar sources: {sources['feed']} days from feed "
+                  f"({sources['feed_cache']['requests']} feed downloads), {sources['html']} from HTML")
+        
+        self.checkpoints.close()
+        if self.recorder:
+            self.recorder.close()
+        
+        if self.ticks:
+            ticks = self.ticks.stats()
+            print(f"📈 Tick cache: {ticks['ticks']} ticks for {ticks['symbols']} symbols, "
+                  f"{ticks['polls']} polls (avg {ticks['avg_poll_ms']:.1f} ms), "
+                  f"{ticks['memory_bytes'] / 1024:.0f} KB")
+        
+        if self.terminal:
+            await self.terminal.shutdown()
+            gateway = self.terminal.stats()
+            print(f"🔌 MT5 gateway: {gateway['calls']} calls, max queue depth {gateway['max_depth']}")
+            book = self.position_book.stats()
+            if book['syncs']:
+                print(f"📊 Position book: {book['syncs']} syncs (avg {book['avg_sync_ms']:.1f} ms), "
+                      f"{book['deal_fetches']} deal fetches, {book['deals']} deals")
+            baskets = self.basket_executor.stats()
+            if baskets['baskets']:
+                print(f"🧺 Baskets: {baskets['baskets']} sent, {baskets['legs_sent']} legs, "
+                      f"{baskets['legs_rejected']} legs rejected by order_check / margin")
+            for name, call in gateway['functions'].items():
+                print(f"   {name}: {call['calls']} calls, avg {call['avg_run_ms']:.1f} ms "
+                      f"(+{call['avg_wait_ms']:.1f} ms queued), max {call['max_ms']:.1f} ms")
+            self.terminal.close()
         print("\n✅ Bot shutdown complete")
     
     def run(self):
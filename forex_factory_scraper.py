@@ -3,22 +3,124 @@ Forex Factory News Scraper
 Scrape economic calendar dan news dari ForexFactory.com
 """
 
-import requests
+import asyncio
 from bs4 import BeautifulSoup
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from typing import Callable, List, Dict, Optional, Tuple
+from zoneinfo import ZoneInfo
 import time
 import json
+import os
+import xml.etree.ElementTree as ElementTree
+
+from calendar_cache import CalendarCache
+from calendar_diff import CalendarChange, CalendarDiffer
+from calendar_event import CalendarEvent
+from http_client import AsyncHTTPClient
+from news_dedup import TTLDedupSet
+
+try:
+    from lxml import etree
+    from lxml import html as lxml_html
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+
+if LXML_AVAILABLE:
+    # Class token match, sama dengan BeautifulSoup class_='...'
+    CALENDAR_ROWS_XPATH = etree.XPath(
+        "//tr[contains(concat(' ', normalize-space(@class), ' '), ' calendar__row ')]"
+    )
+    CLASSED_CELLS_XPATH = etree.XPath(".//td[@class]")
+    FIRST_SPAN_XPATH = etree.XPath("(.//span)[1]")
+
+# Timezone tampilan calendar Forex Factory untuk visitor tanpa login
+DEFAULT_CALENDAR_TIMEZONE = 'America/New_York'
+
+
+def parse_event_time(date: str, time_str: Optional[str], tz: ZoneInfo) -> Optional[datetime]:
+    """
+    Parse event time ke timezone-aware datetime
+    
+    Args:
+        date: 'YYYY-MM-DD'
+        time_str: Format calendar, e.g. '8:30am' ('All Day', 'Tentative', dll -> None)
+        tz: Timezone yang dipakai calendar page
+    
+    Returns:
+        Aware datetime, atau None jika event tidak punya jam rilis
+    """
+    if not time_str:
+        return None
+    try:
+        return datetime.strptime(f"{date} {time_str}", '%Y-%m-%d %I:%M%p').replace(tzinfo=tz)
+    except ValueError:
+        return None
+
+
+# Weekly calendar export (JSON; versi .xml juga didukung)
+DEFAULT_FEED_URL = 'https://nfs.faireconomy.media/ff_calendar_thisweek.json'
+
+# Jam di XML export dalam GMT (JSON export membawa UTC offset sendiri)
+FEED_XML_TIMEZONE = 'UTC'
+
+# Holiday / Non-Economic -> 'low', sama dengan icon abu-abu di HTML (diff tidak flip impact)
+FEED_IMPACTS = {'high': 'high', 'medium': 'medium'}
+
+CALENDAR_SOURCES = ('auto', 'html', 'feed')
+
+
+CALENDAR_COLUMNS = frozenset({
+    'calendar__time', 'calendar__currency', 'calendar__impact', 'calendar__event',
+    'calendar__actual', 'calendar__forecast', 'calendar__previous'
+})
+
+
+class CalendarFetchError(Exception):
+    """Calendar page / feed tidak bisa diambil (non-200 response, file tidak ada)"""
 
 
 class ForexFactoryNewsScraper:
     """Scraper untuk mendapatkan news dari Forex Factory"""
     
-    def __init__(self):
-        """Initialize Forex Factory scraper"""
+    def __init__(self, checkpoint_store=None, processed_events: Optional[TTLDedupSet] = None,
+                 recorder=None, calendar_cache: Optional[CalendarCache] = None,
+                 http_client: Optional[AsyncHTTPClient] = None, timezone: str = DEFAULT_CALENDAR_TIMEZONE,
+                 calendar_source: str = 'auto', feed_source: Optional[str] = DEFAULT_FEED_URL,
+                 feed_ttl: float = 3600.0):
+        """
+        Initialize Forex Factory scraper
+        
+        Args:
+            checkpoint_store: Optional CheckpointStore untuk persist processed events
+            processed_events: Optional set untuk emitted state fingerprints (default: TTLDedupSet)
+            recorder: Optional NewsRecorder untuk capture events (replay/benchmark)
+            calendar_cache: Optional per-date page cache (default: CalendarCache dengan default TTL)
+            http_client: Optional pooled HTTP client (default: AsyncHTTPClient dengan self.headers)
+            timezone: IANA timezone dari jam di calendar page (DST ikut otomatis)
+            calendar_source: 'html' (page per hari), 'feed' (weekly export saja) atau
+                'auto' (feed jika tanggal ter-cover dan tidak butuh actual, selain itu HTML)
+            feed_source: URL atau local file path weekly feed (JSON / XML)
+            feed_ttl: Berapa detik feed dianggap fresh (juga back-off setelah feed gagal)
+        """
+        if calendar_source not in CALENDAR_SOURCES:
+            raise ValueError(f"calendar_source must be one of {CALENDAR_SOURCES}, got {calendar_source!r}")
+        
+        self.checkpoint_store = checkpoint_store
+        self.recorder = recorder
+        self.calendar_cache = calendar_cache if calendar_cache is not None else CalendarCache()
+        self.timezone = ZoneInfo(timezone)
         self.base_url = "https://www.forexfactory.com"
         self.calendar_url = f"{self.base_url}/calendar"
         
+        # Structured weekly feed: satu download kecil per minggu, bukan page per hari
+        self.calendar_source = calendar_source if feed_source else 'html'
+        self.feed_source = feed_source
+        self.feed_cache = CalendarCache(ttl=feed_ttl, max_entries=2)
+        self._feed_retry_at = 0.0
+        self.source_counts = {'feed': 0, 'html': 0}
+        
         # Headers untuk bypass blocking
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
@@ -30,6 +132,10 @@ class ForexFactoryNewsScraper:
             'Cache-Control': 'max-age=0'
         }
         
+        # Pooled keep-alive connections, retries & per-host limit (non-blocking)
+        self.http = http_client if http_client is not None else AsyncHTTPClient()
+        self.http.headers = {**self.headers, **self.http.headers}
+        
         # Impact levels
         self.impact_levels = {
             'high': 3,      # Red flag - high impact
@@ -38,22 +144,271 @@ class ForexFactoryNewsScraper:
             'holiday': 0    # Holiday/no impact
         }
         
-        # Cache untuk avoid duplicate
-        self.processed_events = set()
+        # Bounded set of emitted (event, state) fingerprints (warm-start dari checkpoint store)
+        self.processed_events = processed_events if processed_events is not None else TTLDedupSet()
+        if checkpoint_store:
+            self.processed_events.update(checkpoint_store.processed_ids('ff_calendar'))
+        
+        # Snapshot per event ID: hanya rows baru / berubah (e.g. actual rilis) yang di-emit
+        self.differ = CalendarDiffer(seen=self.processed_events)
     
-    def get_calendar_events(self, date: Optional[str] = None) -> List[Dict]:
+    async def get_calendar_events(self, date: Optional[str] = None) -> List[Dict]:
         """
         Get economic calendar events from Forex Factory
         
+        Read-only: semua events hari itu, tanpa diff. Changes untuk trading
+        hanya lewat get_high_impact_changes, jadi caller lain tidak "memakan"
+        delta / fingerprint yang belum dilihat trading path.
+        
         Args:
             date: Date in format 'YYYY-MM-DD' (default: today)
         
         Returns:
             List of calendar events
         """
+        try:
+            return await self.get_calendar_snapshot(date)
+        except CalendarFetchError as e:
+            print(f"❌ Failed to fetch: {e}")
+            return []
+        except Exception as e:
+            print(f"❌ Error scraping Forex Factory: {e}")
+            return []
+    
+    def today(self) -> str:
+        """Tanggal hari ini di timezone calendar"""
+        return datetime.now(self.timezone).strftime('%Y-%m-%d')
+    
+    async def get_calendar_changes(self, date: Optional[str] = None, revalidate: bool = False,
+                                   verbose: bool = True,
+                                   select: Optional[Callable[[Dict], bool]] = None) -> List[CalendarChange]:
+        """
+        Get inserts & field changes (actual/forecast/previous revisions) untuk satu hari
+        
+        Stateful: changes yang di-return ditandai seen & di-checkpoint, jadi
+        hanya untuk consumer yang memproses semuanya (trading path).
+        
+        Args:
+            date: Date in format 'YYYY-MM-DD' (default: today)
+            revalidate: Abaikan cache TTL (selalu conditional request), untuk burst polling
+            verbose: Print fetch progress
+            select: Optional filter events yang di-diff (lihat CalendarDiffer.diff)
+        
+        Returns:
+            List of CalendarChange
+        """
+        if date is None:
+            date = self.today()
+        
+        try:
+            all_events = await self.get_calendar_snapshot(date, revalidate=revalidate, verbose=verbose)
+            
+            changes = self.differ.diff(date, all_events, select)
+            
+            if self.checkpoint_store:
+                for change in changes:
+                    self.checkpoint_store.mark_processed('ff_calendar', self.differ.fingerprint(change.event))
+            
+            if self.recorder and changes:
+                self.recorder.record_many('forexfactory', [change.event for change in changes])
+            
+            updates = sum(1 for change in changes if change.kind == CalendarChange.UPDATE)
+            if verbose or changes:
+                print(f"✅ Found {len(changes) - updates} new / {updates} updated events from Forex Factory")
+            return changes
+        
+        except CalendarFetchError as e:
+            print(f"❌ Failed to fetch: {e}")
+            return []
+        except Exception as e:
+            print(f"❌ Error scraping Forex Factory: {e}")
+            return []
+    
+    async def get_calendar_snapshot(self, date: Optional[str] = None, revalidate: bool = False,
+                                    verbose: bool = True) -> List[CalendarEvent]:
+        """
+        Semua rows calendar untuk satu hari (tanpa diff), dari weekly feed atau HTML page
+        
+        Args:
+            date: Date in format 'YYYY-MM-DD' (default: today)
+            revalidate: Abaikan cache TTL (selalu conditional request)
+            verbose: Print fetch progress
+        
+        Returns:
+            List of CalendarEvent
+        
+        Raises:
+            CalendarFetchError jika server tidak mengembalikan page, atau network error
+        """
         if date is None:
-            date = datetime.now().strftime('%Y-%m-%d')
+            date = self.today()
+        
+        if self.calendar_source != 'html':
+            events = await self._get_feed_snapshot(date, revalidate, verbose)
+            if events is not None:
+                self.source_counts['feed'] += 1
+                return events
+        
+        self.source_counts['html'] += 1
+        return await self._get_html_snapshot(date, revalidate, verbose)
+    
+    async def _get_feed_snapshot(self, date: str, revalidate: bool, verbose: bool) -> Optional[List[CalendarEvent]]:
+        """
+        Events satu hari dari weekly feed
+        
+        Returns:
+            List of CalendarEvent, atau None jika mode 'auto' harus pakai HTML:
+            burst revalidation, tanggal di luar feed, event yang sudah lewat jam
+            rilis tapi feed tidak punya actual, atau feed sedang gagal
+        """
+        auto = self.calendar_source == 'auto'
+        
+        # Feed tidak membawa actual, burst polling butuh page
+        if auto and revalidate:
+            return None
+        if auto and time.monotonic() < self._feed_retry_at:
+            return None
+        
+        try:
+            feed_events = await self.get_feed_events(verbose=verbose)
+        except (CalendarFetchError, ValueError) as e:
+            if not auto:
+                raise
+            self._feed_retry_at = time.monotonic() + self.feed_cache.ttl
+            print(f"⚠️ Calendar feed unavailable ({e}), using HTML calendar")
+            return None
+        
+        dates = [event.date for event in feed_events]
+        if not dates or not min(dates) <= date <= max(dates):
+            return None if auto else []
+        
+        events = [event for event in feed_events if event.date == date]
+        
+        if auto:
+            now = datetime.now(self.timezone)
+            for event in events:
+                if event.actual:
+                    continue
+                release = parse_event_time(event.date, event.time, self.timezone)
+                if release is not None and release <= now:
+                    return None
+        
+        return events
+    
+    async def get_feed_events(self, verbose: bool = True) -> List[CalendarEvent]:
+        """
+        Semua events dari weekly feed (URL atau local file), lewat feed cache
+        
+        Returns:
+            List of CalendarEvent (format sama dengan HTML parser)
+        
+        Raises:
+            CalendarFetchError jika feed tidak bisa diambil, ValueError jika format tidak dikenal
+        """
+        source = self.feed_source
+        cache = self.feed_cache
+        
+        events = cache.get_fresh(source)
+        if events is not None:
+            return events
         
+        etag = last_modified = None
+        if source.startswith(('http://', 'https://')):
+            if verbose:
+                print(f"📡 Fetching calendar feed: {source}")
+            response = await self.http.get(source, headers=cache.conditional_headers(source))
+            cache.record_download(len(response.content))
+            
+            if response.status_code == 304:
+                events = cache.not_modified(source)
+                if events is not None:
+                    return events
+            if response.status_code != 200:
+                raise CalendarFetchError(f"Feed status {response.status_code}")
+            
+            content = response.content
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+        else:
+            try:
+                content = await asyncio.to_thread(self._read_file, source)
+            except OSError as e:
+                raise CalendarFetchError(f"Feed file {source}: {e}")
+            cache.record_download(len(content))
+        
+        body_hash = cache.body_hash(content)
+        events = cache.lookup_body(source, body_hash, etag, last_modified)
+        if events is None:
+            parse_start = time.perf_counter()
+            events = await asyncio.to_thread(self.parse_calendar_feed, content)
+            cache.store(source, events, body_hash, etag, last_modified, time.perf_counter() - parse_start)
+        return events
+    
+    @staticmethod
+    def _read_file(path: str) -> bytes:
+        with open(os.path.expanduser(path), 'rb') as f:
+            return f.read()
+    
+    def parse_calendar_feed(self, content: bytes) -> List[CalendarEvent]:
+        """
+        Normalize weekly feed (JSON list / XML <weeklyevents>) ke CalendarEvent
+        
+        ID, jam (di timezone calendar) dan impact sama dengan hasil HTML parser,
+        jadi differ & checkpoints tidak melihat perbedaan antar source.
+        
+        Raises:
+            ValueError jika content bukan JSON / XML feed
+        """
+        text = content.decode('utf-8-sig') if isinstance(content, bytes) else content
+        text = text.lstrip()
+        
+        if text.startswith(('[', '{')):
+            items = json.loads(text)
+            if isinstance(items, dict):
+                items = items.get('events', [])
+            rows = []
+            for item in items:
+                try:
+                    when = datetime.fromisoformat(item['date'])
+                except (KeyError, TypeError, ValueError):
+                    continue
+                rows.append((item, when, None))
+        elif text.startswith('<'):
+            root = ElementTree.fromstring(text)
+            xml_tz = ZoneInfo(FEED_XML_TIMEZONE)
+            rows = []
+            for node in root.iter('event'):
+                item = {child.tag: (child.text or '').strip() for child in node}
+                try:
+                    day = datetime.strptime(item.get('date', ''), '%m-%d-%Y')
+                except ValueError:
+                    continue
+                when = parse_event_time(day.strftime('%Y-%m-%d'), item.get('time'), xml_tz)
+                # All Day / Tentative: tidak ada jam, tanggal tetap
+                rows.append((item, when or day, None if when else item.get('time') or None))
+        else:
+            raise ValueError("Unknown calendar feed format")
+        
+        events = []
+        for item, when, time_text in rows:
+            impact_text = str(item.get('impact') or '').lower()
+            if when.tzinfo is not None:
+                when = when.astimezone(self.timezone)
+            if time_text is None and impact_text == 'holiday':
+                time_text = 'All Day'
+            if time_text is None:
+                time_text = when.strftime('%I:%M%p').lstrip('0').lower()
+            
+            events.append(self._build_event(
+                when, time_text, str(item.get('country') or '').strip(),
+                FEED_IMPACTS.get(impact_text, 'low'), str(item.get('title') or '').strip(),
+                str(item.get('actual') or '').strip(), str(item.get('forecast') or '').strip(),
+                str(item.get('previous') or '').strip()
+            ))
+        return events
+    
+    async def _get_html_snapshot(self, date: str, revalidate: bool, verbose: bool) -> List[CalendarEvent]:
+        """Satu calendar page (per hari) lewat page cache"""
         # Format date untuk URL
         date_obj = datetime.strptime(date, '%Y-%m-%d')
         month = date_obj.strftime('%b').lower()
@@ -63,25 +418,157 @@ class ForexFactoryNewsScraper:
         # URL format: /calendar?month=feb.2024
         url = f"{self.calendar_url}?day={month}{day}.{year}"
         
-        try:
-            print(f"📡 Fetching Forex Factory calendar: {url}")
-            response = requests.get(url, headers=self.headers, timeout=10)
-            
-            if response.status_code != 200:
-                print(f"❌ Failed to fetch: Status {response.status_code}")
-                return []
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
+        cache = self.calendar_cache
+        
+        # Page masih fresh: tanpa request & tanpa parse
+        all_events = None if revalidate else cache.get_fresh(date)
+        
+        if all_events is None:
+            if verbose:
+                print(f"📡 Fetching Forex Factory calendar: {url}")
+            response = await self.http.get(url, headers=cache.conditional_headers(date))
+            cache.record_download(len(response.content))
             
-            # Parse calendar table
-            events = self._parse_calendar_table(soup, date_obj)
+            if response.status_code == 304:
+                all_events = cache.not_modified(date)
             
-            print(f"✅ Found {len(events)} events from Forex Factory")
-            return events
+            if all_events is None:
+                if response.status_code != 200:
+                    raise CalendarFetchError(f"Status {response.status_code}")
+                
+                etag = response.headers.get('ETag')
+                last_modified = response.headers.get('Last-Modified')
+                body_hash = cache.body_hash(response.content)
+                
+                # Server tanpa validators: body sama = tidak perlu parse ulang
+                all_events = cache.lookup_body(date, body_hash, etag, last_modified)
+                
+                if all_events is None:
+                    parse_start = time.perf_counter()
+                    
+                    # Parse di thread supaya event loop (Telegram, trading) tidak blocked
+                    all_events = await asyncio.to_thread(self._parse_calendar_page, response.content, date_obj)
+                    cache.store(date, all_events, body_hash, etag, last_modified,
+                                time.perf_counter() - parse_start)
         
-        except Exception as e:
-            print(f"❌ Error scraping Forex Factory: {e}")
+        return all_events
+    
+    def _parse_calendar_page(self, content: bytes, date: datetime) -> List[Dict]:
+        """Parse raw calendar HTML (lxml fast path, fallback BeautifulSoup)"""
+        if LXML_AVAILABLE:
+            events = self._parse_calendar_rows_lxml(content, date)
+            if events is not None:
+                return events
+        
+        soup = BeautifulSoup(content, 'html.parser')
+        
+        # Parse calendar table
+        return self._parse_calendar_table(soup, date)
+    
+    @staticmethod
+    def _impact_from_classes(impact_class: List[str]) -> str:
+        """Map impact icon classes ke impact level"""
+        if 'icon--ff-impact-red' in impact_class:
+            return 'high'
+        elif 'icon--ff-impact-ora' in impact_class:
+            return 'medium'
+        return 'low'
+    
+    def _build_event(self, date: datetime, current_time: Optional[str], currency: str, impact: str,
+                     event_name: str, actual: Optional[str], forecast: Optional[str],
+                     previous: Optional[str]) -> CalendarEvent:
+        """Create event record (sama untuk kedua parser), values di-parse sekali di sini"""
+        # Create event ID untuk avoid duplicates
+        event_id = f"{date.strftime('%Y%m%d')}_{current_time}_{currency}_{event_name}"
+        
+        return CalendarEvent(
+            id=event_id,
+            date=date.strftime('%Y-%m-%d'),
+            time=current_time,
+            currency=currency,
+            impact=impact,
+            impact_score=self.impact_levels.get(impact, 0),
+            event=event_name,
+            actual=actual,
+            forecast=forecast,
+            previous=previous,
+            source='ForexFactory'
+        )
+    
+    def _parse_calendar_rows_lxml(self, content: bytes, date: datetime) -> Optional[List[Dict]]:
+        """
+        Fast path: lxml tree + precompiled XPath, hanya calendar__row yang diproses
+        
+        Returns:
+            List of events (sama persis dengan _parse_calendar_table), atau None
+            jika page bukan UTF-8 (biar BeautifulSoup yang detect encoding)
+        """
+        try:
+            text = content.decode('utf-8') if isinstance(content, bytes) else content
+        except UnicodeDecodeError:
+            return None
+        
+        if not text.strip():
+            print("⚠️ No calendar rows found")
+            return []
+        
+        root = lxml_html.fromstring(text)
+        calendar_rows = CALENDAR_ROWS_XPATH(root)
+        
+        if not calendar_rows:
+            print("⚠️ No calendar rows found")
             return []
+        
+        events = []
+        current_time = None
+        
+        for row in calendar_rows:
+            try:
+                # Satu pass di semua <td class=...>: first match per column (document order)
+                cells = {}
+                for cell in CLASSED_CELLS_XPATH(row):
+                    for cls in cell.get('class').split():
+                        if cls in CALENDAR_COLUMNS and cls not in cells:
+                            cells[cls] = cell
+                
+                time_cell = cells.get('calendar__time')
+                if time_cell is not None:
+                    time_text = time_cell.text_content().strip()
+                    if time_text:
+                        current_time = time_text
+                
+                currency_cell = cells.get('calendar__currency')
+                if currency_cell is None:
+                    continue
+                currency = currency_cell.text_content().strip()
+                
+                impact = 'low'
+                impact_cell = cells.get('calendar__impact')
+                if impact_cell is not None:
+                    impact_span = FIRST_SPAN_XPATH(impact_cell)
+                    if impact_span:
+                        impact = self._impact_from_classes((impact_span[0].get('class') or '').split())
+                
+                event_cell = cells.get('calendar__event')
+                if event_cell is None:
+                    continue
+                event_name = event_cell.text_content().strip()
+                
+                actual_cell = cells.get('calendar__actual')
+                forecast_cell = cells.get('calendar__forecast')
+                previous_cell = cells.get('calendar__previous')
+                
+                events.append(self._build_event(
+                    date, current_time, currency, impact, event_name,
+                    actual_cell.text_content().strip() if actual_cell is not None else None,
+                    forecast_cell.text_content().strip() if forecast_cell is not None else None,
+                    previous_cell.text_content().strip() if previous_cell is not None else None
+                ))
+            
+            except Exception as e:
+                continue
+        
+        return events
     
     def _parse_calendar_table(self, soup: BeautifulSoup, date: datetime) -> List[Dict]:
         """Parse calendar table from HTML"""
@@ -115,13 +602,7 @@ class ForexFactoryNewsScraper:
                 if impact_cell:
                     impact_span = impact_cell.find('span')
                     if impact_span:
-                        impact_class = impact_span.get('class', [])
-                        if 'icon--ff-impact-red' in impact_class:
-                            impact = 'high'
-                        elif 'icon--ff-impact-ora' in impact_class:
-                            impact = 'medium'
-                        elif 'icon--ff-impact-yel' in impact_class:
-                            impact = 'low'
+                        impact = self._impact_from_classes(impact_span.get('class', []))
                 
                 # Get event name
                 event_cell = row.find('td', class_='calendar__event')
@@ -138,74 +619,114 @@ class ForexFactoryNewsScraper:
                 forecast = forecast_cell.text.strip() if forecast_cell else None
                 previous = previous_cell.text.strip() if previous_cell else None
                 
-                # Create event ID untuk avoid duplicates
-                event_id = f"{date.strftime('%Y%m%d')}_{current_time}_{currency}_{event_name}"
-                
-                if event_id in self.processed_events:
-                    continue
-                
-                # Create event dict
-                event = {
-                    'id': event_id,
-                    'date': date.strftime('%Y-%m-%d'),
-                    'time': current_time,
-                    'currency': currency,
-                    'impact': impact,
-                    'impact_score': self.impact_levels.get(impact, 0),
-                    'event': event_name,
-                    'actual': actual,
-                    'forecast': forecast,
-                    'previous': previous,
-                    'source': 'ForexFactory'
-                }
-                
-                events.append(event)
-                self.processed_events.add(event_id)
+                events.append(self._build_event(
+                    date, current_time, currency, impact, event_name, actual, forecast, previous
+                ))
             
             except Exception as e:
                 continue
         
         return events
     
-    def get_high_impact_events(self, hours_ahead: int = 2) -> List[Dict]:
+    async def get_calendar_range(self, start_date: Optional[str] = None, days: int = 7) -> List[Dict]:
+        """
+        Fetch beberapa hari sekaligus (concurrent, dibatasi per-host limit)
+        
+        Args:
+            start_date: Date in format 'YYYY-MM-DD' (default: today)
+            days: Jumlah hari mulai dari start_date
+        
+        Returns:
+            List of calendar events, urut per tanggal
+        """
+        start = datetime.strptime(start_date or self.today(), '%Y-%m-%d')
+        dates = [(start + timedelta(days=i)).strftime('%Y-%m-%d') for i in range(days)]
+        
+        # Read-only snapshots (tanpa diff)
+        results = await asyncio.gather(*[self.get_calendar_events(date) for date in dates])
+        return [event for events in results for event in events]
+    
+    def source_stats(self) -> Dict:
+        """Berapa snapshot dilayani feed vs HTML, plus feed cache stats"""
+        return {**self.source_counts, 'feed_cache': self.feed_cache.stats()}
+    
+    async def close(self):
+        """Tutup pooled HTTP connections"""
+        await self.http.close()
+    
+    def _upcoming_filter(self, hours_ahead: int) -> Callable[[Dict], bool]:
+        """High impact events dari 1 jam lalu sampai X jam ke depan"""
+        now = datetime.now(self.timezone)
+        
+        def upcoming(event: Dict) -> bool:
+            if event['impact'] != 'high':
+                return False
+            # Format bisa: "8:30am" atau "1:00pm" (All Day / Tentative di-skip)
+            event_datetime = parse_event_time(event['date'], event['time'], self.timezone)
+            if event_datetime is None:
+                return False
+            time_diff = (event_datetime - now).total_seconds() / 3600
+            return -1 <= time_diff <= hours_ahead  # -1 untuk event yang baru lewat
+        
+        return upcoming
+    
+    async def get_high_impact_events(self, hours_ahead: int = 2) -> List[Dict]:
         """
         Get upcoming high impact events dalam X jam ke depan
         
+        Read-only (tanpa diff), lihat get_calendar_events.
+        
         Args:
             hours_ahead: Berapa jam ke depan yang akan dicek
         
         Returns:
             List of high impact events
         """
-        # Get today's events
-        today_events = self.get_calendar_events()
+        upcoming = self._upcoming_filter(hours_ahead)
+        return [event for event in await self.get_calendar_events() if upcoming(event)]
+    
+    async def get_high_impact_changes(self, hours_ahead: int = 2, revalidate: bool = False,
+                                      verbose: bool = True) -> List[CalendarChange]:
+        """
+        Get changes untuk high impact events dalam X jam ke depan
         
-        # Filter high impact only
-        high_impact = [e for e in today_events if e['impact'] == 'high']
+        Args:
+            hours_ahead: Berapa jam ke depan yang akan dicek
+            revalidate: Abaikan cache TTL (lihat get_calendar_changes)
+            verbose: Print fetch progress
         
-        # Filter upcoming events (dalam X jam ke depan)
-        now = datetime.now()
-        upcoming = []
+        Returns:
+            List of CalendarChange
+        """
+        # Hanya high impact events di window yang di-diff & ditandai seen;
+        # event di luar window di-emit sebagai insert begitu masuk window
+        return await self.get_calendar_changes(revalidate=revalidate, verbose=verbose,
+                                               select=self._upcoming_filter(hours_ahead))
+    
+    def pending_releases(self, date: Optional[str] = None) -> List[Tuple[datetime, Dict]]:
+        """
+        High impact events yang sudah diketahui tapi belum punya actual
         
-        for event in high_impact:
-            try:
-                # Parse event time
-                event_time_str = event['time']
-                if event_time_str and event_time_str != 'All Day':
-                    # Format bisa: "8:30am" atau "1:00pm"
-                    event_datetime = datetime.strptime(
-                        f"{event['date']} {event_time_str}", 
-                        '%Y-%m-%d %I:%M%p'
-                    )
-                    
-                    # Check if within hours_ahead
-                    time_diff = (event_datetime - now).total_seconds() / 3600
-                    if -1 <= time_diff <= hours_ahead:  # -1 untuk event yang baru lewat
-                        upcoming.append(event)
-            except:
-                continue
+        Events tanpa forecast dan previous (speeches, auctions, dll) tidak
+        pernah dapat actual, jadi tidak dihitung sebagai pending release.
         
-        return upcoming
+        Args:
+            date: Date in format 'YYYY-MM-DD' (default: today)
+        
+        Returns:
+            List of (release time, event), urut waktu
+        """
+        pending = []
+        for event in self.differ.snapshot(date or self.today()):
+            if event['impact'] != 'high' or event.get('actual'):
+                continue
+            if not event.get('forecast') and not event.get('previous'):
+                continue
+            release = parse_event_time(event['date'], event['time'], self.timezone)
+            if release is not None:
+                pending.append((release, event))
+        pending.sort(key=lambda item: item[0])
+        return pending
     
     def create_news_summary(self, event: Dict) -> str:
         """
@@ -217,32 +738,27 @@ class ForexFactoryNewsScraper:
         Returns:
             News summary text
         """
-        currency = event['currency']
-        event_name = event['event']
-        impact = event['impact']
-        actual = event.get('actual')
-        forecast = event.get('forecast')
-        previous = event.get('previous')
+        event = CalendarEvent.coerce(event)
+        currency = event.currency
+        event_name = event.event
+        impact = event.impact
+        actual = event.actual
+        forecast = event.forecast
+        previous = event.previous
         
         # Build summary
         summary = f"{currency} - {event_name} ({impact.upper()} IMPACT)"
         
-        # Add comparison if available
-        if actual and forecast:
-            try:
-                # Remove non-numeric characters
-                actual_val = float(actual.replace('%', '').replace('K', '000').replace('M', '000000').replace('B', '000000000'))
-                forecast_val = float(forecast.replace('%', '').replace('K', '000').replace('M', '000000').replace('B', '000000000'))
-                
-                if actual_val > forecast_val:
-                    summary += f" - Better than expected! Actual {actual} vs Forecast {forecast}"
-                elif actual_val < forecast_val:
-                    summary += f" - Worse than expected! Actual {actual} vs Forecast {forecast}"
-                else:
-                    summary += f" - As expected: {actual}"
-            except:
-                if actual:
-                    summary += f" - Result: {actual}"
+        # Add comparison if available (values sudah di-parse saat scrape)
+        actual_val = event.actual_value
+        forecast_val = event.forecast_value
+        if actual_val is not None and forecast_val is not None:
+            if actual_val.value > forecast_val.value:
+                summary += f" - Better than expected! Actual {actual} vs Forecast {forecast}"
+            elif actual_val.value < forecast_val.value:
+                summary += f" - Worse than expected! Actual {actual} vs Forecast {forecast}"
+            else:
+                summary += f" - As expected: {actual}"
         elif actual:
             summary += f" - Result: {actual}"
         
@@ -251,7 +767,7 @@ class ForexFactoryNewsScraper:
         
         return summary
     
-    def get_currency_specific_news(self, currency: str) -> List[Dict]:
+    async def get_currency_specific_news(self, currency: str) -> List[Dict]:
         """
         Get news untuk currency tertentu
         
@@ -261,15 +777,22 @@ class ForexFactoryNewsScraper:
         Returns:
             List of events untuk currency tersebut
         """
-        all_events = self.get_calendar_events()
+        all_events = await self.get_calendar_events()
         return [e for e in all_events if e['currency'] == currency]
 
 
 class ForexFactoryNewsAnalyzer:
     """Analyzer untuk convert Forex Factory events ke trading signals"""
     
-    def __init__(self):
-        """Initialize analyzer"""
+    def __init__(self, cache=None):
+        """
+        Initialize analyzer
+        
+        Args:
+            cache: Optional result cache (e.g. news_cache.SentimentCache), key = (event id, actual, forecast)
+        """
+        self.cache = cache
+        
         # Event types dan expected impact
         self.bullish_events = {
             # Employment
@@ -307,73 +830,69 @@ class ForexFactoryNewsAnalyzer:
         Returns:
             Analysis result dengan sentiment
         """
-        currency = event['currency']
-        event_name = event['event'].lower()
-        actual = event.get('actual')
-        forecast = event.get('forecast')
-        previous = event.get('previous')
-        impact = event['impact']
+        if self.cache is not None:
+            key = self.cache.event_key(event)
+            cached = self.cache.get(key)
+            if cached is not None:
+                return {**cached, 'event': event}
+        
+        event = CalendarEvent.coerce(event)
+        currency = event.currency
+        event_name = event.event.lower()
+        impact = event.impact
         
         # Default sentiment
         sentiment = 'NEUTRAL'
         sentiment_score = 0.0
         strength = 'weak'
         
-        # Check if we can compare actual vs forecast
-        if actual and forecast:
-            try:
-                # Clean values
-                actual_clean = actual.replace('%', '').replace('K', '').replace('M', '').replace('B', '')
-                forecast_clean = forecast.replace('%', '').replace('K', '').replace('M', '').replace('B', '')
-                
-                actual_val = float(actual_clean)
-                forecast_val = float(forecast_clean)
-                
-                # Calculate difference percentage
-                diff_pct = ((actual_val - forecast_val) / abs(forecast_val)) * 100 if forecast_val != 0 else 0
-                
-                # Determine if event is bullish or bearish type
-                event_multiplier = 0.5  # Default
-                for keyword, multiplier in self.bullish_events.items():
-                    if keyword in event_name:
-                        event_multiplier = multiplier
-                        break
-                
-                # Calculate sentiment
-                # Positive difference = good news (usually)
-                if diff_pct > 0:
-                    sentiment_score = min(diff_pct / 100 * event_multiplier, 1.0)
-                    sentiment = 'LONG' if sentiment_score > 0.3 else 'NEUTRAL'
-                elif diff_pct < 0:
-                    sentiment_score = max(diff_pct / 100 * event_multiplier, -1.0)
-                    sentiment = 'SHORT' if sentiment_score < -0.3 else 'NEUTRAL'
-                
-                # Adjust by impact level
-                if impact == 'high':
-                    sentiment_score *= 1.5
-                elif impact == 'medium':
-                    sentiment_score *= 1.0
-                else:
-                    sentiment_score *= 0.5
-                
-                # Normalize
-                sentiment_score = max(min(sentiment_score, 1.0), -1.0)
-                
-                # Determine strength
-                abs_score = abs(sentiment_score)
-                if abs_score >= 0.7:
-                    strength = 'very_strong'
-                elif abs_score >= 0.5:
-                    strength = 'strong'
-                elif abs_score >= 0.3:
-                    strength = 'moderate'
-                else:
-                    strength = 'weak'
+        # Check if we can compare actual vs forecast (values sudah di-parse saat scrape)
+        if event.actual_value is not None and event.forecast_value is not None:
+            actual_val = event.actual_value.value
+            forecast_val = event.forecast_value.value
             
-            except:
-                pass
-        
-        return {
+            # Calculate difference percentage
+            diff_pct = ((actual_val - forecast_val) / abs(forecast_val)) * 100 if forecast_val != 0 else 0
+            
+            # Determine if event is bullish or bearish type
+            event_multiplier = 0.5  # Default
+            for keyword, multiplier in self.bullish_events.items():
+                if keyword in event_name:
+                    event_multiplier = multiplier
+                    break
+            
+            # Calculate sentiment
+            # Positive difference = good news (usually)
+            if diff_pct > 0:
+                sentiment_score = min(diff_pct / 100 * event_multiplier, 1.0)
+                sentiment = 'LONG' if sentiment_score > 0.3 else 'NEUTRAL'
+            elif diff_pct < 0:
+                sentiment_score = max(diff_pct / 100 * event_multiplier, -1.0)
+                sentiment = 'SHORT' if sentiment_score < -0.3 else 'NEUTRAL'
+            
+            # Adjust by impact level
+            if impact == 'high':
+                sentiment_score *= 1.5
+            elif impact == 'medium':
+                sentiment_score *= 1.0
+            else:
+                sentiment_score *= 0.5
+            
+            # Normalize
+            sentiment_score = max(min(sentiment_score, 1.0), -1.0)
+            
+            # Determine strength
+            abs_score = abs(sentiment_score)
+            if abs_score >= 0.7:
+                strength = 'very_strong'
+            elif abs_score >= 0.5:
+                strength = 'strong'
+            elif abs_score >= 0.3:
+                strength = 'moderate'
+            else:
+                strength = 'weak'
+        
+        result = {
             'event': event,
             'sentiment_score': round(sentiment_score, 3),
             'signal': sentiment,
@@ -382,6 +901,11 @@ class ForexFactoryNewsAnalyzer:
             'news_text': self.create_news_text(event, sentiment_score),
             'source': 'ForexFactory'
         }
+        
+        if self.cache is not None:
+            self.cache.put(key, result)
+        
+        return result
     
     def create_news_text(self, event: Dict, sentiment_score: float) -> str:
         """Create descriptive news text"""
@@ -402,7 +926,7 @@ class ForexFactoryNewsAnalyzer:
 
 
 # Demo & Testing
-if __name__ == "__main__":
+async def demo():
     print("""
     ╔═══════════════════════════════════════════════════════════════════╗
     ║          FOREX FACTORY NEWS SCRAPER - DEMO                       ║
@@ -416,7 +940,7 @@ if __name__ == "__main__":
     print("\n1️⃣  Fetching today's calendar events...\n")
     
     # Get today's events
-    events = scraper.get_calendar_events()
+    events = await scraper.get_calendar_events()
     
     if events:
         print(f"Found {len(events)} events today:\n")
@@ -437,7 +961,7 @@ if __name__ == "__main__":
     
     print("\n\n2️⃣  Getting upcoming high impact events...\n")
     
-    upcoming = scraper.get_high_impact_events(hours_ahead=24)
+    upcoming = await scraper.get_high_impact_events(hours_ahead=24)
     
     if upcoming:
         print(f"Found {len(upcoming)} upcoming high impact events in next 24h:\n")
@@ -464,3 +988,9 @@ if __name__ == "__main__":
         print("No events with actual data yet (events haven't occurred)")
     
     print("\n✅ Demo complete!")
+    
+    await scraper.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(demo())
@@ -0,0 +1,194 @@
+"""
+HTTP Client
+Pooled async HTTP client (keep-alive, retries dengan jittered backoff, per-host limits)
+"""
+
+import asyncio
+import random
+import time
+from typing import Dict, Mapping, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    aiohttp = None
+    AIOHTTP_AVAILABLE = False
+
+
+# Status yang layak di-retry (rate limit & server errors)
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class HTTPResponse:
+    """Response minimal yang sama untuk backend aiohttp maupun requests"""
+
+    __slots__ = ('status_code', 'content', 'headers', 'url')
+
+    def __init__(self, status_code: int, content: bytes, headers: Mapping[str, str], url: str):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers
+        self.url = url
+
+
+class AsyncHTTPClient:
+    """
+    Connection-pooled HTTP client untuk dipakai dari asyncio code.
+
+    Pakai aiohttp jika terinstall; kalau tidak, requests.Session (juga
+    keep-alive) dijalankan di thread executor supaya event loop tidak
+    pernah blocked. Jumlah request bersamaan per host dibatasi semaphore,
+    dan connection errors / 429 / 5xx di-retry dengan exponential backoff
+    + full jitter.
+    """
+
+    def __init__(self, headers: Optional[Dict[str, str]] = None, timeout: float = 10.0,
+                 per_host_limit: int = 4, max_retries: int = 3, backoff_base: float = 0.5,
+                 backoff_max: float = 10.0):
+        """
+        Initialize client
+
+        Args:
+            headers: Default headers untuk semua request
+            timeout: Total timeout per attempt (detik)
+            per_host_limit: Maksimal request bersamaan ke satu host
+            max_retries: Jumlah retry setelah attempt pertama
+            backoff_base: Backoff awal (detik), dikali 2 setiap retry
+            backoff_max: Batas atas backoff (detik)
+        """
+        self.headers = dict(headers or {})
+        self.timeout = timeout
+        self.per_host_limit = per_host_limit
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+        self._session = None
+        self._host_limits: Dict[str, asyncio.Semaphore] = {}
+
+        # Stats
+        self.requests = 0
+        self.retries = 0
+        self.failures = 0
+        self.bytes_received = 0
+        self.request_seconds = 0.0
+
+    @property
+    def backend(self) -> str:
+        return 'aiohttp' if AIOHTTP_AVAILABLE else 'requests'
+
+    def _get_session(self):
+        if self._session is None:
+            if AIOHTTP_AVAILABLE:
+                self._session = aiohttp.ClientSession(
+                    headers=self.headers,
+                    timeout=aiohttp.ClientTimeout(total=self.timeout),
+                    connector=aiohttp.TCPConnector(limit_per_host=self.per_host_limit,
+                                                   keepalive_timeout=60)
+                )
+            else:
+                session = requests.Session()
+                session.headers.update(self.headers)
+                adapter = HTTPAdapter(pool_connections=8, pool_maxsize=self.per_host_limit)
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                self._session = session
+        return self._session
+
+    def _host_limit(self, url: str) -> asyncio.Semaphore:
+        host = urlsplit(url).netloc
+        limit = self._host_limits.get(host)
+        if limit is None:
+            limit = self._host_limits[host] = asyncio.Semaphore(self.per_host_limit)
+        return limit
+
+    async def _request_once(self, url: str, headers: Optional[Dict[str, str]]) -> HTTPResponse:
+        session = self._get_session()
+        if AIOHTTP_AVAILABLE:
+            async with session.get(url, headers=headers) as response:
+                content = await response.read()
+                # Copy case-insensitive headers (response object ditutup setelah block ini)
+                return HTTPResponse(response.status, content, response.headers.copy(), str(response.url))
+
+        response = await asyncio.to_thread(session.get, url, headers=headers, timeout=self.timeout)
+        return HTTPResponse(response.status_code, response.content, response.headers, response.url)
+
+    def _backoff(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Full jitter: uniform(0, base * 2^attempt), atau Retry-After dari server"""
+        if retry_after:
+            try:
+                return min(float(retry_after), self.backoff_max)
+            except ValueError:
+                pass
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+    async def get(self, url: str, headers: Optional[Dict[str, str]] = None) -> HTTPResponse:
+        """
+        GET dengan retries
+
+        Args:
+            url: URL
+            headers: Extra headers untuk request ini (e.g. conditional validators)
+
+        Returns:
+            HTTPResponse (response terakhir jika semua retry gagal karena status)
+
+        Raises:
+            Exception terakhir jika semua attempt gagal karena network error
+        """
+        errors = (asyncio.TimeoutError, requests.RequestException)
+        if AIOHTTP_AVAILABLE:
+            errors += (aiohttp.ClientError,)
+
+        async with self._host_limit(url):
+            for attempt in range(self.max_retries + 1):
+                if attempt:
+                    self.retries += 1
+
+                start = time.perf_counter()
+                try:
+                    response = await self._request_once(url, headers)
+                except errors:
+                    self.request_seconds += time.perf_counter() - start
+                    if attempt >= self.max_retries:
+                        self.failures += 1
+                        raise
+                    await asyncio.sleep(self._backoff(attempt))
+                    continue
+
+                self.request_seconds += time.perf_counter() - start
+                self.requests += 1
+                self.bytes_received += len(response.content)
+
+                if response.status_code in RETRY_STATUSES and attempt < self.max_retries:
+                    await asyncio.sleep(self._backoff(attempt, response.headers.get('Retry-After')))
+                    continue
+                if response.status_code >= 400:
+                    self.failures += 1
+                return response
+
+    async def close(self):
+        """Tutup pooled connections"""
+        if self._session is None:
+            return
+        if AIOHTTP_AVAILABLE:
+            await self._session.close()
+        else:
+            self._session.close()
+        self._session = None
+
+    def stats(self) -> Dict:
+        """Request, retry dan failure counters"""
+        return {
+            'backend': self.backend,
+            'requests': self.requests,
+            'retries': self.retries,
+            'failures': self.failures,
+            'bytes_received': self.bytes_received,
+            'avg_request_ms': round(1000 * self.request_seconds / self.requests, 1) if self.requests else 0.0
+        }
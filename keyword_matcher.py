@@ -0,0 +1,251 @@
+"""
+Keyword Matcher
+Single-pass, word-boundary aware matcher untuk sentiment & currency lexicons
+"""
+
+import re
+from itertools import chain, repeat
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+
+# Token = huruf/angka berurutan (hyphen & punctuation jadi pemisah)
+TOKEN_PATTERN = re.compile(r"[^\W_]+")
+
+# Suffix yang masih dihitung sebagai kata yang sama (e.g. 'rises', 'gained')
+DEFAULT_SUFFIXES = ('s', 'es', 'd', 'ed', 'ing')
+
+VOWELS = frozenset('aeiou')
+
+# match_batch: texts di-join dengan separator yang jadi token sendiri (id SEPARATOR_ID)
+BATCH_SEPARATOR = '\x00'
+BATCH_TOKEN_PATTERN = re.compile(r"[^\W_]+|\x00")
+SEPARATOR_ID = -2
+# ASCII non-alphanumeric (selain separator) -> spasi; sama dengan TOKEN_PATTERN untuk ASCII text
+ASCII_SEPARATORS = str.maketrans({
+    chr(code): ' ' for code in range(1, 128) if not chr(code).isalnum()
+})
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase text lalu pecah jadi word tokens"""
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+class KeywordMatcher:
+    """
+    Word-level keyword index untuk banyak lexicon sekaligus.
+
+    Semua keyword dikompilasi sekali: single-word keyword (plus variasi suffix)
+    masuk ke satu hash index, phrase seperti 'bank of england' disimpan sebagai
+    head token -> sisa tokens. Setiap message cukup di-tokenize sekali, lalu
+    satu set intersection menemukan semua kandidat, jadi cost per message
+    linear terhadap jumlah token, bukan jumlah keyword.
+
+    Match selalu di word boundary: 'up' tidak match 'update', 'uk' tidak
+    match 'ukraine'.
+    """
+
+    def __init__(self, suffixes: Iterable[str] = DEFAULT_SUFFIXES):
+        """
+        Initialize matcher
+
+        Args:
+            suffixes: Suffix yang boleh menempel di token terakhir keyword
+        """
+        self.suffixes = tuple(suffixes)
+        self._entries: List[Tuple[str, str, object]] = []
+
+        # token variant -> entry ids (single-word keywords)
+        self._words: Dict[str, List[int]] = {}
+        # head token -> [(middle tokens, last token variants, entry id)]
+        self._phrases: Dict[str, List[Tuple[Tuple[str, ...], FrozenSet[str], int]]] = {}
+
+        self._word_keys: FrozenSet[str] = frozenset()
+        self._phrase_keys: FrozenSet[str] = frozenset()
+
+        # Token id index untuk match_batch (di-build ulang setelah add_lexicon)
+        self._batch_index: Optional[Tuple] = None
+
+    def _variants(self, token: str) -> FrozenSet[str]:
+        """
+        Token beserta semua variasi suffix-nya
+
+        Suffix yang diawali vowel mengikuti ejaan Inggris: final 'e' dibuang
+        ('rise' -> 'rising'), consonant-vowel-consonant digandakan
+        ('drop' -> 'dropped') dan consonant + 'y' jadi 'i' ('rally' -> 'rallied').
+        """
+        variants = {token}
+        for suffix in self.suffixes:
+            variants.add(token + suffix)
+            if suffix[0] not in VOWELS or len(token) < 2:
+                continue
+            last, before = token[-1], token[-2]
+            if last == 'e':
+                variants.add(token[:-1] + suffix)
+            elif last == 'y' and before not in VOWELS and suffix != 'ing':
+                variants.add(token[:-1] + 'i' + suffix)
+            elif (last not in VOWELS and last not in 'wxy' and before in VOWELS
+                    and (len(token) < 3 or token[-3] not in VOWELS)):
+                variants.add(token + last + suffix)
+        return frozenset(variants)
+
+    def add_lexicon(self, group: str, lexicon: Dict[str, object]):
+        """
+        Add keywords ke index
+
+        Args:
+            group: Nama group (e.g. 'bullish', 'bearish', 'currency')
+            lexicon: Dict keyword -> payload (score, currency code, dll)
+        """
+        for keyword, payload in lexicon.items():
+            tokens = tokenize(keyword)
+            if not tokens:
+                continue
+
+            entry_id = len(self._entries)
+            self._entries.append((group, keyword, payload))
+
+            if len(tokens) == 1:
+                for variant in self._variants(tokens[0]):
+                    self._words.setdefault(variant, []).append(entry_id)
+            else:
+                self._phrases.setdefault(tokens[0], []).append(
+                    (tuple(tokens[1:-1]), self._variants(tokens[-1]), entry_id)
+                )
+
+        self._word_keys = frozenset(self._words)
+        self._phrase_keys = frozenset(self._phrases)
+        self._batch_index = None
+
+    def match_tokens(self, tokens: List[str]) -> List[int]:
+        """
+        Find matched entries dari token list
+
+        Returns:
+            Sorted entry ids (setiap keyword maksimal sekali)
+        """
+        token_set = set(tokens)
+        matched = set()
+
+        for token in token_set & self._word_keys:
+            matched.update(self._words[token])
+
+        heads = token_set & self._phrase_keys
+        if heads:
+            last = len(tokens)
+            for start, token in enumerate(tokens):
+                if token not in heads:
+                    continue
+                for middle, tail_variants, entry_id in self._phrases[token]:
+                    end = start + 1 + len(middle)
+                    if end >= last:
+                        continue
+                    if tuple(tokens[start + 1:end]) == middle and tokens[end] in tail_variants:
+                        matched.add(entry_id)
+
+        return sorted(matched)
+
+    def _build_batch_index(self) -> Tuple:
+        """
+        Token -> id untuk semua token yang relevan (word keys & phrase tokens),
+        plus CSR token id -> entry ids untuk single-word keywords
+        """
+        token_ids: Dict[str, int] = {BATCH_SEPARATOR: SEPARATOR_ID}
+        for token in chain(self._words, self._phrases):
+            token_ids.setdefault(token, len(token_ids) - 1)
+        for phrases in self._phrases.values():
+            for middle, tail_variants, _ in phrases:
+                for token in chain(middle, tail_variants):
+                    token_ids.setdefault(token, len(token_ids) - 1)
+
+        counts = np.zeros(len(token_ids), dtype=np.intp)
+        for token, entry_ids in self._words.items():
+            counts[token_ids[token] + 1] = len(entry_ids)
+        indptr = np.cumsum(counts)
+        indices = np.empty(indptr[-1], dtype=np.intp)
+        for token, entry_ids in self._words.items():
+            start = indptr[token_ids[token]]
+            indices[start:start + len(entry_ids)] = entry_ids
+
+        phrases = [
+            (token_ids[head], [token_ids[token] for token in middle],
+             np.array([token_ids[token] for token in tail_variants]), entry_id)
+            for head, items in self._phrases.items()
+            for middle, tail_variants, entry_id in items
+        ]
+        return token_ids, indptr, indices, phrases
+
+    def match_batch(self, texts: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Match banyak texts sekaligus
+
+        Semua token di-concat jadi satu stream, di-map ke token id dengan
+        satu dict lookup per token (tanpa set per message), lalu word hits
+        di-expand ke entry ids lewat CSR index dan phrases dicek sebagai
+        array comparison per phrase di seluruh stream.
+
+        Returns:
+            (rows, entry_ids): pasangan unik urut (row, entry id), sama
+            dengan match_tokens per text
+        """
+        if self._batch_index is None:
+            self._batch_index = self._build_batch_index()
+        token_ids, indptr, indices, phrases = self._batch_index
+
+        # Satu lower + tokenize untuk semua texts; BATCH_SEPARATOR jadi token pemisah message.
+        # ASCII (kasus umum): translate + split, hasil sama dengan TOKEN_PATTERN tapi ~4x lebih cepat
+        joined = BATCH_SEPARATOR.join(texts).lower()
+        if joined.count(BATCH_SEPARATOR) == len(texts) - 1:
+            if joined.isascii():
+                flat = joined.translate(ASCII_SEPARATORS).replace(BATCH_SEPARATOR, ' \x00 ').split()
+            else:
+                flat = BATCH_TOKEN_PATTERN.findall(joined)
+        else:
+            flat = list(chain.from_iterable(
+                chain(tokenize(text), (BATCH_SEPARATOR,)) for text in texts
+            ))
+        ids = np.fromiter(map(token_ids.get, flat, repeat(-1)), dtype=np.intp, count=len(flat))
+        token_rows = np.cumsum(ids == SEPARATOR_ID)
+
+        # Single-word keywords: token id -> entry ids (CSR expand)
+        hit = np.flatnonzero(ids >= 0)
+        starts = indptr[ids[hit]]
+        counts = indptr[ids[hit] + 1] - starts
+        total = int(counts.sum())
+        offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+        rows = [np.repeat(token_rows[hit], counts)]
+        entry_ids = [indices[np.repeat(starts, counts) + offsets]]
+
+        # Phrases: head token diikuti middle tokens & tail variant di message yang sama
+        for head, middle, tails, entry_id in phrases:
+            positions = np.flatnonzero(ids == head)
+            positions = positions[positions + len(middle) + 1 < len(ids)]
+            for offset, token in enumerate(middle, 1):
+                positions = positions[ids[positions + offset] == token]
+            end = positions + len(middle) + 1
+            positions = positions[np.isin(ids[end], tails) & (token_rows[end] == token_rows[positions])]
+            rows.append(token_rows[positions])
+            entry_ids.append(np.full(len(positions), entry_id, dtype=np.intp))
+
+        width = max(len(self._entries), 1)
+        keys = np.unique(np.concatenate(rows) * width + np.concatenate(entry_ids))
+        return keys // width, keys % width
+
+    def match(self, text: str) -> List[Tuple[str, str, object]]:
+        """
+        Match text terhadap semua lexicon dalam satu pass
+
+        Args:
+            text: Raw text (akan di-lowercase)
+
+        Returns:
+            List of (group, keyword, payload) dalam urutan lexicon asli
+        """
+        return [self._entries[i] for i in self.match_tokens(tokenize(text))]
+
+    @property
+    def entries(self) -> List[Tuple[str, str, object]]:
+        """All compiled (group, keyword, payload) entries, index = entry id"""
+        return self._entries
@@ -0,0 +1,178 @@
+"""
+MT5 Gateway
+Jalankan semua MetaTrader5 calls di satu worker thread, return awaitables ke asyncio
+"""
+
+import asyncio
+import itertools
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Optional
+
+
+# Urutan eksekusi di worker queue (angka kecil duluan, FIFO dalam satu priority)
+PRIORITY_ORDER = 0
+PRIORITY_NORMAL = 1
+PRIORITY_BACKGROUND = 2
+_PRIORITY_STOP = 3
+
+
+class CallStats:
+    """Latency counters per MT5 function"""
+
+    __slots__ = ('calls', 'errors', 'wait_seconds', 'run_seconds', 'max_seconds')
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.wait_seconds = 0.0
+        self.run_seconds = 0.0
+        self.max_seconds = 0.0
+
+
+class MT5Gateway:
+    """
+    Serialized MetaTrader5 access untuk asyncio code.
+
+    Terminal API bersifat blocking dan tidak thread-safe, jadi setiap call
+    masuk ke satu request queue dan dieksekusi berurutan oleh worker thread;
+    caller mendapat awaitable sehingga event loop (Telegram streaming,
+    calendar poller) tetap jalan selama order_send / positions_get.
+
+        gateway = MT5Gateway(mt5)
+        tick = await gateway.symbol_info_tick('EURUSD')
+        result = await gateway.call('order_send', request)
+
+    Attribute non-callable (constants seperti ORDER_TYPE_BUY) diteruskan apa adanya.
+
+    Queue berbasis priority: order requests (PRIORITY_ORDER) dieksekusi
+    sebelum calls biasa yang sudah antri, dan background polling (tick
+    collector, PRIORITY_BACKGROUND) paling akhir. Keyword `priority` di
+    submit / call / run dipakai gateway, tidak diteruskan ke MT5.
+    """
+
+    def __init__(self, module, name: str = 'mt5-gateway'):
+        """
+        Initialize gateway
+
+        Args:
+            module: MetaTrader5 module (atau object dengan API yang sama)
+            name: Nama worker thread
+        """
+        self.module = module
+        self.name = name
+        self._queue: 'queue.PriorityQueue[tuple]' = queue.PriorityQueue()
+        self._seq = itertools.count()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+        # Metrics
+        self._stats: Dict[str, CallStats] = {}
+        self.max_depth = 0
+
+    def start(self):
+        """Start worker thread (otomatis saat call pertama)"""
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._worker, name=self.name, daemon=True)
+                self._thread.start()
+
+    def _worker(self):
+        while True:
+            _, _, item = self._queue.get()
+            if item is None:
+                break
+
+            future, name, func, args, kwargs, enqueued = item
+            if not future.set_running_or_notify_cancel():
+                continue
+
+            started = time.perf_counter()
+            try:
+                result = func(*args, **kwargs)
+            except BaseException as e:
+                self._record(name, enqueued, started, error=True)
+                future.set_exception(e)
+            else:
+                self._record(name, enqueued, started)
+                future.set_result(result)
+
+    def _record(self, name: str, enqueued: float, started: float, error: bool = False):
+        finished = time.perf_counter()
+        stats = self._stats.get(name)
+        if stats is None:
+            stats = self._stats[name] = CallStats()
+        stats.calls += 1
+        stats.errors += error
+        stats.wait_seconds += started - enqueued
+        stats.run_seconds += finished - started
+        stats.max_seconds = max(stats.max_seconds, finished - enqueued)
+
+    def submit(self, name: str, func: Callable, *args, priority: int = PRIORITY_NORMAL, **kwargs) -> Future:
+        """Queue satu call, return concurrent.futures.Future"""
+        self.start()
+        future: Future = Future()
+        item = (future, name, func, args, kwargs, time.perf_counter())
+        self._queue.put((priority, next(self._seq), item))
+        self.max_depth = max(self.max_depth, self._queue.qsize())
+        return future
+
+    async def call(self, name: str, *args, priority: int = PRIORITY_NORMAL, **kwargs) -> Any:
+        """
+        Await MetaTrader5 function `name` (e.g. 'order_send') di worker thread
+
+        Returns:
+            Return value dari MT5 (exceptions di-raise di caller)
+        """
+        return await asyncio.wrap_future(
+            self.submit(name, getattr(self.module, name), *args, priority=priority, **kwargs)
+        )
+
+    async def run(self, func: Callable, *args, priority: int = PRIORITY_NORMAL, **kwargs) -> Any:
+        """Jalankan beberapa MT5 calls sekaligus (func(module, ...)) sebagai satu queue item"""
+        return await asyncio.wrap_future(
+            self.submit(getattr(func, '__name__', 'run'), func, self.module, *args, priority=priority, **kwargs)
+        )
+
+    def __getattr__(self, name: str):
+        value = getattr(self.module, name)
+        if not callable(value):
+            return value
+
+        async def proxy(*args, **kwargs):
+            return await self.call(name, *args, **kwargs)
+
+        proxy.__name__ = name
+        return proxy
+
+    @property
+    def depth(self) -> int:
+        """Calls yang sedang antri"""
+        return self._queue.qsize()
+
+    def close(self, timeout: float = 5.0):
+        """Selesaikan antrian lalu stop worker thread"""
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.put((_PRIORITY_STOP, next(self._seq), None))
+            self._thread.join(timeout)
+        self._thread = None
+
+    def stats(self) -> Dict:
+        """Queue depth & latency per function (ms)"""
+        functions = {}
+        for name, stats in sorted(self._stats.items()):
+            functions[name] = {
+                'calls': stats.calls,
+                'errors': stats.errors,
+                'avg_wait_ms': round(stats.wait_seconds / stats.calls * 1000, 3),
+                'avg_run_ms': round(stats.run_seconds / stats.calls * 1000, 3),
+                'max_ms': round(stats.max_seconds * 1000, 3)
+            }
+        return {
+            'calls': sum(stats.calls for stats in self._stats.values()),
+            'depth': self.depth,
+            'max_depth': self.max_depth,
+            'functions': functions
+        }
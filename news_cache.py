@@ -0,0 +1,153 @@
+"""
+News Cache
+Content-addressed LRU cache untuk hasil sentiment analysis
+"""
+
+import hashlib
+import re
+import sys
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Optional
+
+
+# Emoji, pictographs, dingbats, variation selectors & zero-width joiner
+EMOJI_PATTERN = re.compile(
+    "["
+    "\U0001F000-\U0001FAFF"
+    "\U00002600-\U000027BF"
+    "\U00002B00-\U00002BFF"
+    "\U0000FE00-\U0000FE0F"
+    "\U0000200D"
+    "]+"
+)
+
+
+def normalize_text(text: str) -> str:
+    """Lowercase, buang emoji, dan rapikan whitespace"""
+    text = EMOJI_PATTERN.sub(' ', text.lower())
+    return ' '.join(text.split())
+
+
+def estimate_size(value) -> int:
+    """Perkiraan memory (bytes) dari result dict/list/str"""
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        for key, item in value.items():
+            size += sys.getsizeof(key) + estimate_size(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            size += estimate_size(item)
+    return size
+
+
+class SentimentCache:
+    """
+    Bounded LRU (+ optional TTL) cache untuk sentiment results.
+
+    Key untuk Telegram news = hash dari text yang sudah dinormalisasi, jadi
+    headline yang sama dari @marketfeed dan @wfwitness (atau yang di-edit lalu
+    di-post ulang) cukup dianalisis sekali. Key untuk Forex Factory event =
+    (event id, actual, forecast).
+    """
+
+    def __init__(self, max_entries: int = 4096, max_bytes: int = 16 * 1024 * 1024,
+                 ttl: Optional[float] = None):
+        """
+        Initialize cache
+
+        Args:
+            max_entries: Maksimal jumlah entries
+            max_bytes: Memory ceiling (perkiraan) untuk semua cached values
+            ttl: Umur maksimal entry dalam detik (None = tanpa expiry)
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+
+        # key -> (value, expires_at, size)
+        self._entries = OrderedDict()
+        self.current_bytes = 0
+
+        # Counters
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def text_key(text: str) -> str:
+        """Content hash dari normalized text"""
+        return hashlib.blake2b(normalize_text(text).encode('utf-8'), digest_size=16).hexdigest()
+
+    @staticmethod
+    def event_key(event: Dict) -> tuple:
+        """Key untuk Forex Factory event"""
+        return ('event', event['id'], event.get('actual'), event.get('forecast'))
+
+    def get(self, key: Hashable):
+        """Get cached value (None jika miss atau expired)"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        value, expires_at, size = entry
+        if expires_at is not None and expires_at < time.monotonic():
+            self._remove(key)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: Hashable, value):
+        """Store value, evict least recently used jika melewati limit"""
+        if key in self._entries:
+            self._remove(key)
+
+        size = estimate_size(value)
+        if size > self.max_bytes:
+            return
+
+        expires_at = time.monotonic() + self.ttl if self.ttl else None
+        self._entries[key] = (value, expires_at, size)
+        self.current_bytes += size
+
+        while len(self._entries) > self.max_entries or self.current_bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], object]):
+        """Return cached value atau hitung lalu simpan"""
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def _remove(self, key: Hashable):
+        value, expires_at, size = self._entries.pop(key)
+        self.current_bytes -= size
+
+    def clear(self):
+        """Hapus semua entries (counters tetap)"""
+        self._entries.clear()
+        self.current_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict:
+        """Hit/miss/eviction counters dan pemakaian memory"""
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'bytes': self.current_bytes,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0
+        }
@@ -0,0 +1,318 @@
+"""
+News Dedup
+Near-duplicate detection (MinHash + LSH bands) dan bounded TTL dedup set
+"""
+
+import hashlib
+import math
+import time
+from collections import deque
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from keyword_matcher import KeywordMatcher, tokenize
+
+
+# Kata arah: headline mirip dengan arah berlawanan ('hikes' vs 'cuts') bukan duplicate
+DIRECTION_KEYWORDS = {
+    'up': ['rise', 'hike', 'raise', 'increase', 'above', 'beat', 'higher', 'up', 'gain', 'surge',
+           'jump', 'climb', 'strong', 'stronger', 'hawkish', 'rally', 'accelerate', 'exceed'],
+    'down': ['fall', 'cut', 'lower', 'decrease', 'below', 'miss', 'down', 'drop', 'decline', 'slump',
+             'weak', 'weaker', 'dovish', 'plunge', 'slow', 'tumble', 'ease', 'contract']
+}
+
+
+class NearDuplicateDetector:
+    """
+    Streaming near-duplicate detector dengan time window.
+
+    Setiap message diubah jadi MinHash signature dari set word tokens-nya,
+    lalu signature dipotong jadi beberapa LSH bands. Message yang mirip
+    (Jaccard similarity tinggi) hampir pasti berbagi minimal satu band, jadi
+    setiap check hanya membandingkan kandidat di bucket yang sama, bukan
+    semua message di window.
+
+    Similarity saja tidak cukup untuk headline data/kebijakan: 'Fed hikes
+    rates by 25bp' dan 'Fed cuts rates by 25bp' hampir identik. Kandidat
+    hanya dianggap duplicate jika numeric tokens dan arah (net sign dari
+    DIRECTION_KEYWORDS) juga sama persis.
+    """
+
+    def __init__(self, similarity: float = 0.6, window_seconds: float = 3600,
+                 num_perm: int = 64, seed: int = 1):
+        """
+        Initialize detector
+
+        Args:
+            similarity: Minimal Jaccard similarity (0-1) untuk dianggap duplicate
+            window_seconds: Berapa lama fingerprint disimpan
+            num_perm: Panjang MinHash signature
+            seed: Seed untuk hash permutations
+        """
+        self.similarity = similarity
+        self.window_seconds = window_seconds
+        self.num_perm = num_perm
+
+        # Satu random salt per permutation
+        rng = np.random.default_rng(seed)
+        self._salts = rng.integers(0, 2**63, size=num_perm, dtype=np.uint64)
+
+        # Pilih bands x rows dengan LSH threshold (1/b)^(1/r) sedikit di bawah similarity
+        self.bands, self.rows = self._choose_bands(num_perm, similarity)
+
+        # (band index, band bytes) -> list of entries
+        self._buckets: Dict[tuple, List] = {}
+        # Entries urut waktu: [timestamp, signature, item_id, guard]
+        self._window = deque()
+
+        self._direction = KeywordMatcher()
+        self._direction.add_lexicon('up', {word: 1 for word in DIRECTION_KEYWORDS['up']})
+        self._direction.add_lexicon('down', {word: -1 for word in DIRECTION_KEYWORDS['down']})
+
+        # Stats
+        self.checked = 0
+        self.duplicates = 0
+
+    @staticmethod
+    def _choose_bands(num_perm: int, similarity: float) -> tuple:
+        target = similarity * 0.85
+        best = (num_perm, 1)
+        for rows in range(1, num_perm + 1):
+            if num_perm % rows:
+                continue
+            bands = num_perm // rows
+            if (1.0 / bands) ** (1.0 / rows) <= target:
+                best = (bands, rows)
+        return best
+
+    def signature(self, text: str) -> Optional[np.ndarray]:
+        """MinHash signature dari set word tokens (None untuk text kosong)"""
+        tokens = set(tokenize(text))
+        if not tokens:
+            return None
+
+        digests = b''.join(
+            hashlib.blake2b(token.encode('utf-8'), digest_size=8).digest()
+            for token in tokens
+        )
+        hashes = np.frombuffer(digests, dtype=np.uint64)
+
+        # Salted splitmix64 finalizer = num_perm hash functions yang independen
+        z = hashes[:, None] ^ self._salts
+        z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+        z = z ^ (z >> np.uint64(31))
+        return z.min(axis=0)
+
+    def guard(self, text: str) -> tuple:
+        """(numeric tokens, direction sign) yang harus sama agar dianggap duplicate"""
+        tokens = tokenize(text)
+        numbers = frozenset(token for token in tokens if any(char.isdigit() for char in token))
+        direction = sum(self._direction.entries[i][2] for i in self._direction.match_tokens(tokens))
+        return numbers, (direction > 0) - (direction < 0)
+
+    def _band_keys(self, signature: np.ndarray) -> List[tuple]:
+        return [
+            (band, signature[band * self.rows:(band + 1) * self.rows].tobytes())
+            for band in range(self.bands)
+        ]
+
+    def _expire(self, now: float):
+        """Buang fingerprint yang sudah keluar dari window"""
+        cutoff = now - self.window_seconds
+        while self._window and self._window[0][0] < cutoff:
+            entry = self._window.popleft()
+            for key in self._band_keys(entry[1]):
+                bucket = self._buckets.get(key)
+                if bucket is None:
+                    continue
+                bucket[:] = [item for item in bucket if item is not entry]
+                if not bucket:
+                    del self._buckets[key]
+
+    def _lookup(self, signature: np.ndarray, guard: tuple) -> Optional[str]:
+        seen = set()
+        for key in self._band_keys(signature):
+            for entry in self._buckets.get(key, ()):
+                if id(entry) in seen:
+                    continue
+                seen.add(id(entry))
+                if entry[3] != guard:
+                    continue
+                # Estimated Jaccard = fraksi posisi signature yang sama
+                if np.count_nonzero(entry[1] == signature) >= self.similarity * self.num_perm:
+                    return entry[2]
+        return None
+
+    def _insert(self, signature: np.ndarray, guard: tuple, item_id: str, now: float):
+        entry = [now, signature, item_id, guard]
+        self._window.append(entry)
+        for key in self._band_keys(signature):
+            self._buckets.setdefault(key, []).append(entry)
+
+    def find_duplicate(self, text: str, now: Optional[float] = None) -> Optional[str]:
+        """
+        Cari message mirip di dalam window (tanpa menyimpan text ini)
+
+        Returns:
+            item_id dari message yang mirip, atau None
+        """
+        now = time.time() if now is None else now
+        self._expire(now)
+        signature = self.signature(text)
+        return self._lookup(signature, self.guard(text)) if signature is not None else None
+
+    def add(self, text: str, item_id: str, now: Optional[float] = None):
+        """Add message ke index"""
+        signature = self.signature(text)
+        if signature is not None:
+            self._insert(signature, self.guard(text), item_id, time.time() if now is None else now)
+
+    def check_and_add(self, text: str, item_id: str, now: Optional[float] = None) -> Optional[str]:
+        """
+        Check duplicate lalu simpan fingerprint jika message baru
+
+        Returns:
+            item_id dari original message jika duplicate, None jika baru
+        """
+        now = time.time() if now is None else now
+        self._expire(now)
+        self.checked += 1
+
+        signature = self.signature(text)
+        if signature is None:
+            return None
+
+        guard = self.guard(text)
+        original = self._lookup(signature, guard)
+        if original is not None:
+            self.duplicates += 1
+            return original
+
+        self._insert(signature, guard, item_id, now)
+        return None
+
+    def stats(self) -> Dict:
+        """Jumlah check, duplicates dan ukuran window"""
+        return {
+            'checked': self.checked,
+            'duplicates': self.duplicates,
+            'window_size': len(self._window),
+            'buckets': len(self._buckets),
+            'bands': self.bands,
+            'rows': self.rows
+        }
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter (bytearray bitset + double hashing)"""
+
+    def __init__(self, capacity: int, fp_rate: float):
+        self.capacity = max(1, capacity)
+        self.num_bits = max(8, int(-self.capacity * math.log(fp_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / self.capacity * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    def add(self, item: str):
+        for pos in self._positions(item):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        bits = self.bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+
+class TTLDedupSet:
+    """
+    Bounded dedup set dengan time-based expiry (rotating Bloom filters).
+
+    Waktu dibagi jadi beberapa buckets; setiap bucket adalah Bloom filter
+    dengan ukuran tetap. Bucket tertua dibuang saat umurnya melewati TTL,
+    atau lebih awal jika bucket aktif sudah penuh (hard memory cap). Drop-in
+    untuk set yang hanya memakai `in` dan `add`.
+    """
+
+    def __init__(self, ttl_seconds: float = 7 * 86400, capacity: int = 200000,
+                 fp_rate: float = 0.001, num_buckets: int = 8):
+        """
+        Initialize dedup set
+
+        Args:
+            ttl_seconds: Umur maksimal ID sebelum dilupakan
+            capacity: Total ID yang bisa diingat dalam satu TTL window
+            fp_rate: Target false-positive rate (keseluruhan)
+            num_buckets: Jumlah time buckets
+        """
+        self.ttl_seconds = ttl_seconds
+        self.num_buckets = num_buckets
+        self.bucket_span = ttl_seconds / num_buckets
+        self.bucket_capacity = max(1, capacity // num_buckets)
+        # FP gabungan ~= jumlah buckets x FP per bucket
+        self.bucket_fp_rate = fp_rate / num_buckets
+
+        self._buckets = deque([BloomFilter(self.bucket_capacity, self.bucket_fp_rate)])
+        self._bucket_started = time.time()
+
+        # Stats
+        self.expired = 0
+        self.evictions = 0
+
+    def _rotate(self, now: float, force: bool = False):
+        """Buka bucket baru jika span habis (atau bucket aktif penuh)"""
+        while force or now - self._bucket_started >= self.bucket_span:
+            self._buckets.append(BloomFilter(self.bucket_capacity, self.bucket_fp_rate))
+            self._bucket_started = now if force else self._bucket_started + self.bucket_span
+            if len(self._buckets) > self.num_buckets:
+                dropped = self._buckets.popleft()
+                if force:
+                    self.evictions += dropped.count
+                else:
+                    self.expired += dropped.count
+            if force:
+                break
+            # Idle lama: tidak perlu loop bucket kosong satu per satu
+            if now - self._bucket_started >= self.ttl_seconds:
+                self.expired += sum(bucket.count for bucket in self._buckets)
+                self._buckets = deque([BloomFilter(self.bucket_capacity, self.bucket_fp_rate)])
+                self._bucket_started = now
+                break
+
+    def add(self, item: str, now: Optional[float] = None):
+        """Add ID ke bucket aktif"""
+        now = time.time() if now is None else now
+        self._rotate(now)
+        if self._buckets[-1].count >= self.bucket_capacity:
+            self._rotate(now, force=True)
+        self._buckets[-1].add(item)
+
+    def update(self, items):
+        """Add banyak IDs (e.g. warm-start dari checkpoint store)"""
+        for item in items:
+            self.add(item)
+
+    def __contains__(self, item: str) -> bool:
+        self._rotate(time.time())
+        return any(item in bucket for bucket in reversed(self._buckets))
+
+    def __len__(self) -> int:
+        return sum(bucket.count for bucket in self._buckets)
+
+    def stats(self) -> Dict:
+        """Ukuran, memory dan evictions"""
+        return {
+            'items': len(self),
+            'buckets': len(self._buckets),
+            'memory_bytes': sum(len(bucket.bits) for bucket in self._buckets),
+            'max_memory_bytes': self.num_buckets * len(self._buckets[-1].bits),
+            'expired': self.expired,
+            'evictions': self.evictions
+        }
@@ -0,0 +1,288 @@
+"""
+News Replay
+Record news dari Telegram / Forex Factory ke file lokal dan replay sebagai load generator
+"""
+
+import asyncio
+import gzip
+import json
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from calendar_diff import CalendarChange, CalendarDiffer
+
+
+def _encode(value):
+    """JSON default: datetime sebagai ISO string (bisa di-decode lagi), records via to_dict()"""
+    if isinstance(value, datetime):
+        return {'__dt__': value.isoformat()}
+    if hasattr(value, 'to_dict'):
+        return value.to_dict()
+    return str(value)
+
+
+def _decode(obj: Dict):
+    if len(obj) == 1 and '__dt__' in obj:
+        return datetime.fromisoformat(obj['__dt__'])
+    return obj
+
+
+def _open(path: str, mode: str):
+    if path.endswith('.gz'):
+        return gzip.open(path, mode + 't', encoding='utf-8')
+    return open(path, mode, encoding='utf-8')
+
+
+class NewsRecorder:
+    """
+    Append-only recorder untuk message/event dicts.
+
+    Format: JSON Lines (gzip jika path berakhiran .gz), satu record per baris:
+    {"t": capture time, "source": "telegram" | "forexfactory", "item": {...}}
+    """
+
+    def __init__(self, path: str):
+        """
+        Initialize recorder
+
+        Args:
+            path: Output file (.jsonl atau .jsonl.gz), di-append jika sudah ada
+        """
+        self.path = path
+        self._file = _open(path, 'a')
+        self._lock = threading.Lock()
+        self.records = 0
+
+    def record(self, source: str, item: Dict, now: Optional[float] = None):
+        """Tulis satu item"""
+        line = json.dumps({
+            't': time.time() if now is None else now,
+            'source': source,
+            'item': item
+        }, default=_encode, ensure_ascii=False)
+        with self._lock:
+            self._file.write(line + '\n')
+            self.records += 1
+
+    def record_many(self, source: str, items: List[Dict]):
+        """Tulis banyak items dengan capture time yang sama"""
+        now = time.time()
+        for item in items:
+            self.record(source, item, now)
+
+    def close(self):
+        """Flush dan tutup file"""
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+
+def load_recording(path: str, source: Optional[str] = None) -> Iterator[Tuple[float, str, Dict]]:
+    """
+    Baca recording file
+
+    Args:
+        path: File hasil NewsRecorder
+        source: Filter source (None = semua)
+
+    Yields:
+        (capture time, source, item)
+    """
+    with _open(path, 'r') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            record = json.loads(line, object_hook=_decode)
+            if source is None or record['source'] == source:
+                yield record['t'], record['source'], record['item']
+
+
+class ReplayClock:
+    """Map capture time di recording ke wall clock (speed 0 = secepat mungkin)"""
+
+    def __init__(self, speed: float = 1.0):
+        self.speed = speed
+        self._origin = None
+        self._started = None
+
+    def start(self, origin: float):
+        if self._started is None:
+            self._origin = origin
+            self._started = time.monotonic()
+
+    def due_in(self, t: float) -> float:
+        """Detik sampai record dengan capture time t boleh dirilis"""
+        if self.speed <= 0 or self._started is None:
+            return 0.0
+        target = self._started + (t - self._origin) / self.speed
+        return target - time.monotonic()
+
+
+class ReplayTelegramSource:
+    """
+    Stand-in untuk TelegramNewsScaper yang membaca recording file.
+
+    Interface sama dengan yang dipakai MultiPairForexBot (client, connect,
+    start_streaming, next_messages, get_new_messages_from_all_channels,
+    disconnect), jadi bot bisa jalan tanpa Telegram credentials.
+    """
+
+    def __init__(self, path: str, speed: float = 1.0, streaming: bool = True,
+                 clock: Optional[ReplayClock] = None):
+        """
+        Initialize replay source
+
+        Args:
+            path: Recording file
+            speed: 1.0 = real time, 10.0 = 10x lebih cepat, 0 = tanpa jeda
+            streaming: Push via next_messages (True) atau polling (False)
+            clock: Shared clock (supaya Telegram & Forex Factory replay sinkron)
+        """
+        self.records = []
+        seen = set()
+        for t, _, msg in load_recording(path, 'telegram'):
+            # Message yang sama bisa terekam dari push dan catch-up
+            key = (msg['channel'], msg['id'])
+            if key in seen:
+                continue
+            seen.add(key)
+            self.records.append((t, msg))
+        self.records.sort(key=lambda record: record[0])
+
+        self.clock = clock or ReplayClock(speed)
+        self.streaming_enabled = streaming
+        self.channels = sorted({msg['channel'] for _, msg in self.records})
+        self.client = self
+        self.streaming = False
+        self.queue = None
+        self._position = 0
+        self._connected = False
+        self._feeder = None
+
+        # (channel, id) -> perf_counter saat message dirilis (untuk latency)
+        self.released_at: Dict[Tuple[str, int], float] = {}
+
+    def is_connected(self) -> bool:
+        return self._connected
+
+    @property
+    def finished(self) -> bool:
+        """True jika semua records sudah dirilis"""
+        return self._position >= len(self.records)
+
+    async def connect(self) -> bool:
+        self._connected = True
+        if self.records:
+            self.clock.start(self.records[0][0])
+        print(f"▶️ Replaying {len(self.records)} Telegram message(s) from {len(self.channels)} channel(s)")
+        return True
+
+    async def start_streaming(self) -> bool:
+        if not self.streaming_enabled or self.streaming:
+            return self.streaming
+        self.queue = asyncio.Queue()
+        self.streaming = True
+        self._feeder = asyncio.create_task(self._feed())
+        return True
+
+    def _release(self, msg: Dict) -> Dict:
+        self.released_at[(msg['channel'], msg['id'])] = time.perf_counter()
+        return msg
+
+    async def _feed(self):
+        """Push records ke queue sesuai jadwal replay"""
+        while not self.finished:
+            t, msg = self.records[self._position]
+            wait = self.clock.due_in(t)
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._position += 1
+            self.queue.put_nowait(self._release(msg))
+            if self.clock.speed <= 0:
+                # Beri kesempatan consumer memproses batch
+                await asyncio.sleep(0)
+
+    async def next_messages(self) -> List[Dict]:
+        first = await self.queue.get()
+        messages = [first]
+        while not self.queue.empty():
+            messages.append(self.queue.get_nowait())
+        return messages
+
+    async def get_new_messages_from_all_channels(self) -> List[Dict]:
+        """Polling mode: semua records yang sudah jatuh tempo"""
+        if self.streaming:
+            messages = []
+            while self.queue is not None and not self.queue.empty():
+                messages.append(self.queue.get_nowait())
+            return messages
+
+        messages = []
+        while not self.finished and self.clock.due_in(self.records[self._position][0]) <= 0:
+            messages.append(self._release(self.records[self._position][1]))
+            self._position += 1
+        return messages
+
+    async def disconnect(self):
+        self.streaming = False
+        self._connected = False
+        if self._feeder:
+            self._feeder.cancel()
+            try:
+                await self._feeder
+            except asyncio.CancelledError:
+                pass
+            self._feeder = None
+
+
+class ReplayForexFactorySource:
+    """
+    Stand-in untuk ForexFactoryNewsScraper yang membaca recording file.
+
+    Setiap event ID bisa terekam beberapa kali (sebelum dan sesudah actual
+    rilis); records yang sudah jatuh tempo di-diff dengan CalendarDiffer,
+    jadi replay meng-emit insert/update yang sama seperti scraper aslinya.
+    """
+
+    def __init__(self, path: str, speed: float = 1.0, clock: Optional[ReplayClock] = None):
+        self.records = sorted(
+            ((t, event) for t, _, event in load_recording(path, 'forexfactory')),
+            key=lambda record: record[0]
+        )
+        self.clock = clock or ReplayClock(speed)
+        self.differ = CalendarDiffer()
+        self._position = 0
+
+    @property
+    def finished(self) -> bool:
+        return self._position >= len(self.records)
+
+    async def get_calendar_changes(self, date: Optional[str] = None) -> List[CalendarChange]:
+        if self.records:
+            self.clock.start(self.records[0][0])
+
+        # Records yang jatuh tempo, versi terbaru per event ID, dikelompokkan per tanggal
+        due: Dict[str, Dict[str, Dict]] = {}
+        while not self.finished and self.clock.due_in(self.records[self._position][0]) <= 0:
+            event = self.records[self._position][1]
+            due.setdefault(event['date'], {})[event['id']] = event
+            self._position += 1
+
+        changes = []
+        for event_date, events in due.items():
+            latest = {e['id']: e for e in self.differ.snapshot(event_date)}
+            latest.update(events)
+            changes.extend(self.differ.diff(event_date, list(latest.values())))
+        return [c for c in changes if date is None or c.event['date'] == date]
+
+    async def get_calendar_events(self, date: Optional[str] = None) -> List[Dict]:
+        return [change.event for change in await self.get_calendar_changes(date)]
+
+    async def get_high_impact_changes(self, hours_ahead: int = 2) -> List[CalendarChange]:
+        return [c for c in await self.get_calendar_changes() if c.event['impact'] == 'high']
+
+    async def get_high_impact_events(self, hours_ahead: int = 2) -> List[Dict]:
+        return [change.event for change in await self.get_high_impact_changes(hours_ahead)]
@@ -0,0 +1,104 @@
+"""
+Pair Index
+Precomputed currency -> (symbol, side) orientation index untuk pair selection
+"""
+
+from typing import Dict, Iterable, List, Tuple
+
+
+# Urutan prioritas counterpart currency (majors dulu)
+CURRENCY_PRIORITY = ['EUR', 'GBP', 'USD', 'JPY', 'AUD', 'CAD', 'CHF', 'NZD']
+
+
+class PairOrientationIndex:
+    """
+    Index dari (currency, view) ke broker symbols + arah order.
+
+    Dibangun sekali dari daftar symbol broker. View = sentiment terhadap
+    currency ('LONG' = bullish, 'SHORT' = bearish); side = arah order di
+    symbol tersebut ('LONG' = BUY, 'SHORT' = SELL). Contoh: bullish USD
+    -> USDJPY LONG, EURUSD SHORT (inverse-quoted).
+    """
+
+    def __init__(self, symbols: Iterable[str]):
+        """
+        Build index
+
+        Args:
+            symbols: Broker symbol names (e.g. 'EURUSD', 'GBPJPY')
+        """
+        self._index: Dict[Tuple[str, str], Tuple[Tuple[str, str], ...]] = {}
+        self._symbols = frozenset()
+
+        buckets: Dict[Tuple[str, str], List[Tuple[int, str, str]]] = {}
+        symbols_seen = set()
+        for symbol in symbols:
+            if len(symbol) < 6 or symbol in symbols_seen:
+                continue
+            symbols_seen.add(symbol)
+
+            base, quote = symbol[:3], symbol[3:6]
+            # Bullish base -> BUY, bullish quote -> SELL (dan sebaliknya untuk bearish)
+            for currency, other, long_side, short_side in (
+                (base, quote, 'LONG', 'SHORT'),
+                (quote, base, 'SHORT', 'LONG'),
+            ):
+                rank = self._rank(other)
+                buckets.setdefault((currency, 'LONG'), []).append((rank, symbol, long_side))
+                buckets.setdefault((currency, 'SHORT'), []).append((rank, symbol, short_side))
+
+        for key, legs in buckets.items():
+            legs.sort()
+            self._index[key] = tuple((symbol, side) for _, symbol, side in legs)
+
+        self._symbols = frozenset(symbols_seen)
+
+    @staticmethod
+    def _rank(currency: str) -> int:
+        if currency in CURRENCY_PRIORITY:
+            return CURRENCY_PRIORITY.index(currency)
+        return len(CURRENCY_PRIORITY)
+
+    def lookup(self, currency: str, view: str) -> Tuple[Tuple[str, str], ...]:
+        """
+        Get (symbol, side) untuk currency dengan view tertentu
+
+        Args:
+            currency: Currency code (e.g. 'USD')
+            view: 'LONG' (bullish) atau 'SHORT' (bearish)
+
+        Returns:
+            Tuple of (symbol, side), majors dulu
+        """
+        return self._index.get((currency, view), ())
+
+    def select(self, currencies: List[str], view: str, limit: int = None) -> List[Tuple[str, str]]:
+        """
+        Gabungkan legs untuk beberapa currency dengan view yang sama
+
+        Symbol yang muncul dengan side berlawanan (e.g. EURUSD saat EUR dan USD
+        sama-sama bullish) di-skip karena arahnya ambigu.
+
+        Returns:
+            List of (symbol, side)
+        """
+        sides: Dict[str, str] = {}
+        conflicted = set()
+        order = []
+
+        for currency in currencies:
+            for symbol, side in self.lookup(currency, view):
+                if symbol not in sides:
+                    sides[symbol] = side
+                    order.append(symbol)
+                elif sides[symbol] != side:
+                    conflicted.add(symbol)
+
+        legs = [(symbol, sides[symbol]) for symbol in order if symbol not in conflicted]
+        return legs[:limit] if limit is not None else legs
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._symbols
+
+    def __len__(self) -> int:
+        return len(self._symbols)
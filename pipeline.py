@@ -0,0 +1,240 @@
+"""
+Pipeline
+Independent asyncio stages (ingestion, analysis, execution, monitoring) joined by bounded queues
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, List
+
+
+class StageMetrics:
+    """Throughput & latency counters per stage"""
+
+    __slots__ = ('kind', 'items', 'runs', 'errors', 'busy_seconds', 'max_seconds', 'started_at')
+
+    def __init__(self, kind: str):
+        self.kind = kind
+        self.items = 0
+        self.runs = 0
+        self.errors = 0
+        self.busy_seconds = 0.0
+        self.max_seconds = 0.0
+        self.started_at = time.monotonic()
+
+    def record(self, elapsed: float, items: int = 1, error: bool = False):
+        self.runs += 1
+        self.items += items
+        self.errors += error
+        self.busy_seconds += elapsed
+        self.max_seconds = max(self.max_seconds, elapsed)
+
+
+class StageQueue(asyncio.Queue):
+    """Bounded asyncio.Queue yang mencatat depth maksimal"""
+
+    def __init__(self, name: str, maxsize: int):
+        super().__init__(maxsize)
+        self.name = name
+        self.max_depth = 0
+        self.put_waits = 0
+
+    async def put(self, item):
+        # Queue penuh: producer menunggu (backpressure), dihitung untuk metrics
+        if self.full():
+            self.put_waits += 1
+        await super().put(item)
+        self.max_depth = max(self.max_depth, self.qsize())
+
+    def put_nowait(self, item):
+        super().put_nowait(item)
+        self.max_depth = max(self.max_depth, self.qsize())
+
+
+class Pipeline:
+    """
+    Kumpulan long-running asyncio tasks dengan metrics & clean shutdown.
+
+    - worker: consume satu StageQueue, handler(item) per item
+    - periodic: func() setiap interval detik (cadence sendiri per stage)
+    - task: coroutine yang mengatur loop sendiri (e.g. streaming, poller)
+
+    Error di handler dicatat dan stage tetap jalan; wait() selesai jika
+    ada stage yang crash, stage required yang berhenti, atau stop()
+    dipanggil. Stage biasa yang selesai normal (e.g. replay source habis)
+    hanya dicatat, stages lain tetap jalan.
+    """
+
+    def __init__(self):
+        self.queues: Dict[str, StageQueue] = {}
+        self.metrics: Dict[str, StageMetrics] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._required = set()
+        self.finished: List[str] = []
+        self._stopped = asyncio.Event()
+
+    def queue(self, name: str, maxsize: int = 100) -> StageQueue:
+        """Buat bounded queue antar stages"""
+        queue = self.queues[name] = StageQueue(name, maxsize)
+        return queue
+
+    def _metrics(self, name: str, kind: str) -> StageMetrics:
+        metrics = self.metrics[name] = StageMetrics(kind)
+        return metrics
+
+    def _start(self, name: str, coro: Awaitable, required: bool = False):
+        if required:
+            self._required.add(name)
+        task = asyncio.create_task(coro, name=name)
+        task.add_done_callback(self._on_done)
+        self._tasks[name] = task
+
+    def _on_done(self, task: asyncio.Task):
+        if task.cancelled():
+            return
+        name = task.get_name()
+        error = task.exception()
+        if error is not None:
+            print(f"❌ Stage {name} crashed: {error!r}")
+            self._stopped.set()
+            return
+        self.finished.append(name)
+        if name in self._required:
+            print(f"⏹️ Required stage {name} finished, stopping pipeline")
+            self._stopped.set()
+        else:
+            print(f"✅ Stage {name} finished")
+
+    def add_worker(self, name: str, queue: StageQueue, handler: Callable[[Any], Awaitable],
+                   size: Callable[[Any], int] = lambda item: 1):
+        """
+        Consumer stage
+
+        Args:
+            name: Stage name (metrics)
+            queue: Input queue
+            handler: Coroutine function untuk satu item
+            size: Jumlah logical items di satu queue item (e.g. batch of messages)
+        """
+        metrics = self._metrics(name, 'worker')
+
+        async def loop():
+            while True:
+                item = await queue.get()
+                started = time.perf_counter()
+                error = False
+                try:
+                    await handler(item)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    error = True
+                    print(f"❌ {name}: {e}")
+                finally:
+                    queue.task_done()
+                metrics.record(time.perf_counter() - started, size(item), error)
+
+        self._start(name, loop())
+
+    def add_periodic(self, name: str, interval: float, func: Callable[[], Awaitable]):
+        """Stage yang jalan setiap interval detik (interval dihitung dari start run)"""
+        metrics = self._metrics(name, 'periodic')
+
+        async def loop():
+            while True:
+                started = time.perf_counter()
+                error = False
+                try:
+                    await func()
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    error = True
+                    print(f"❌ {name}: {e}")
+                elapsed = time.perf_counter() - started
+                metrics.record(elapsed, 1, error)
+                await asyncio.sleep(max(0.0, interval - elapsed))
+
+        self._start(name, loop())
+
+    def add_task(self, name: str, coro: Awaitable, required: bool = False):
+        """
+        Long-running coroutine dengan loop sendiri
+
+        Args:
+            name: Stage name
+            coro: Coroutine
+            required: True = pipeline berhenti jika task ini selesai (walau tanpa error)
+        """
+        self._metrics(name, 'task')
+        self._start(name, coro, required)
+
+    async def wait(self):
+        """Tunggu sampai stop() atau ada stage yang berhenti"""
+        await self._stopped.wait()
+
+    def stop(self):
+        self._stopped.set()
+
+    async def shutdown(self) -> Dict[str, int]:
+        """
+        Cancel semua stages dan tunggu sampai benar-benar selesai
+
+        Returns:
+            Items yang tertinggal di setiap queue (tidak diproses)
+        """
+        self._stopped.set()
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._tasks.clear()
+
+        dropped = {}
+        for name, queue in self.queues.items():
+            count = 0
+            while not queue.empty():
+                queue.get_nowait()
+                queue.task_done()
+                count += 1
+            if count:
+                dropped[name] = count
+        return dropped
+
+    def stats(self) -> Dict:
+        """Per stage: items, throughput, avg/max handling time; per queue: depth"""
+        now = time.monotonic()
+        stages = {}
+        for name, metrics in self.metrics.items():
+            uptime = max(now - metrics.started_at, 1e-9)
+            stages[name] = {
+                'kind': metrics.kind,
+                'items': metrics.items,
+                'runs': metrics.runs,
+                'errors': metrics.errors,
+                'per_second': round(metrics.items / uptime, 3),
+                'avg_ms': round(metrics.busy_seconds / metrics.runs * 1000, 3) if metrics.runs else 0.0,
+                'max_ms': round(metrics.max_seconds * 1000, 3)
+            }
+        queues = {
+            name: {'depth': queue.qsize(), 'max_depth': queue.max_depth,
+                   'maxsize': queue.maxsize, 'put_waits': queue.put_waits}
+            for name, queue in self.queues.items()
+        }
+        return {'stages': stages, 'queues': queues}
+
+    def summary(self) -> List[str]:
+        """One line per stage / queue untuk log"""
+        stats = self.stats()
+        lines = []
+        for name, stage in stats['stages'].items():
+            if stage['kind'] == 'task':
+                lines.append(f"{name}: {'finished' if name in self.finished else 'long-running'} task")
+                continue
+            lines.append(f"{name}: {stage['items']} items ({stage['per_second']:.2f}/s), "
+                         f"avg {stage['avg_ms']:.1f} ms, max {stage['max_ms']:.1f} ms, "
+                         f"{stage['errors']} errors")
+        for name, queue in stats['queues'].items():
+            lines.append(f"queue {name}: depth {queue['depth']}/{queue['maxsize']}, "
+                         f"max {queue['max_depth']}, {queue['put_waits']} blocked puts")
+        return lines
@@ -0,0 +1,293 @@
+"""
+Position Book
+Open positions & closed deals bot ini (magic number) sebagai NumPy arrays, di-sync incremental dari MT5
+"""
+
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import numpy as np
+
+
+POSITION_DTYPE = np.dtype([
+    ('ticket', 'i8'), ('symbol', 'i4'), ('type', 'i1'), ('volume', 'f8'),
+    ('price_open', 'f8'), ('price_current', 'f8'), ('profit', 'f8'), ('swap', 'f8')
+])
+
+# deal.type / deal.entry (MQL5 DEAL_TYPE_*, DEAL_ENTRY_*)
+DEAL_TYPE_BUY = 0
+DEAL_TYPE_SELL = 1
+DEAL_ENTRY_IN = 0
+
+
+class PositionBook:
+    """
+    Open positions + realized P/L harian untuk satu magic number.
+
+    Setiap sync() = satu MT5Gateway queue item: positions_get, dan
+    history_deals_get hanya jika ada position baru / tertutup / partial
+    close atau history_deals_total bertambah (position yang dibuka dan
+    kena SL/TP di antara dua sync), mulai dari deal terakhir yang sudah
+    dicatat (deal ticket cursor). Range history_deals_get selalu epoch seconds (convention yang
+    sama dengan deal.time). Symbol string hanya di-resolve untuk ticket baru; floating
+    dan realized P/L per symbol & per currency dihitung dengan bincount
+    dan matrix symbol x currency, tanpa loop per position.
+    """
+
+    def __init__(self, gateway, magic: int):
+        """
+        Initialize book
+
+        Args:
+            gateway: MT5Gateway
+            magic: Magic number order bot (positions/deals lain diabaikan)
+        """
+        self.gateway = gateway
+        self.magic = magic
+
+        self.symbols: List[str] = []
+        self._symbol_index: Dict[str, int] = {}
+        self.currencies: List[str] = []
+        self._currency_index: Dict[str, int] = {}
+        self._matrix: Optional[np.ndarray] = None
+
+        self.positions = np.empty(0, dtype=POSITION_DTYPE)
+        self.realized = np.zeros(0)
+
+        # Deal cursor (ticket naik terus) + awal hari trading, epoch seconds
+        self.day_start = self._midnight()
+        self.last_deal_ticket = 0
+        self.last_deal_time = 0
+        self._deals_pending = True
+        # (since, jumlah deals) dari fetch terakhir, dibandingkan dengan history_deals_total
+        self._deals_seen = None
+
+        # Stats
+        self.syncs = 0
+        self.deal_fetches = 0
+        self.deals = 0
+        self.errors = 0
+        self.sync_seconds = 0.0
+
+    @staticmethod
+    def _midnight() -> int:
+        return int(datetime.now().replace(hour=0, minute=0, second=0, microsecond=0).timestamp())
+
+    def symbol_index(self, symbol: str) -> int:
+        """Index symbol di arrays (symbol & currency baru ditambahkan)"""
+        index = self._symbol_index.get(symbol)
+        if index is None:
+            index = self._symbol_index[symbol] = len(self.symbols)
+            self.symbols.append(symbol)
+            self.realized = np.append(self.realized, 0.0)
+            for currency in (symbol[:3], symbol[3:6]):
+                if currency and currency not in self._currency_index:
+                    self._currency_index[currency] = len(self.currencies)
+                    self.currencies.append(currency)
+            self._matrix = None
+        return index
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """symbols x currencies: +1 base, -1 quote (LONG symbol = long base, short quote)"""
+        if self._matrix is None:
+            matrix = np.zeros((len(self.symbols), len(self.currencies)))
+            for i, symbol in enumerate(self.symbols):
+                if len(symbol) >= 6:
+                    matrix[i, self._currency_index[symbol[:3]]] = 1.0
+                    matrix[i, self._currency_index[symbol[3:6]]] = -1.0
+            self._matrix = matrix
+        return self._matrix
+
+    def fetch(self, module, known: np.ndarray, volumes: np.ndarray) -> Dict:
+        """
+        Jalan di gateway thread: positions, lalu deals baru jika ada perubahan
+
+        Returns:
+            Dict positions (None = terminal error), deals (None = tidak di-fetch) dan deals_error
+        """
+        positions = module.positions_get()
+        if positions is None:
+            return {'positions': None, 'deals': None, 'deals_error': False, 'error': module.last_error()}
+        positions = [p for p in positions if p.magic == self.magic]
+
+        tickets = np.fromiter((p.ticket for p in positions), dtype='i8', count=len(positions))
+        current = np.fromiter((p.volume for p in positions), dtype='f8', count=len(positions))
+        changed = (self._deals_pending or len(tickets) != len(known)
+                   or not np.array_equal(np.sort(tickets), known)
+                   or not np.allclose(np.sort(current), volumes))
+
+        # Epoch seconds untuk kedua bound; deal dengan time == since di-dedupe lewat ticket cursor.
+        # Upper bound +1 hari supaya server time di depan local time tetap tercakup.
+        since = self.last_deal_time or self.day_start
+        until = int(time.time()) + 86400
+        if not changed:
+            # Open + close di antara dua sync: ticket set sama, tapi ada deals baru
+            total = module.history_deals_total(since, until)
+            changed = total is None or (since, total) != self._deals_seen
+
+        deals = None
+        if changed:
+            deals = module.history_deals_get(since, until)
+        return {'positions': positions, 'deals': deals, 'deals_error': changed and deals is None,
+                'error': module.last_error() if changed and deals is None else None}
+
+    def _positions_array(self, positions) -> np.ndarray:
+        """MT5 positions -> POSITION_DTYPE; symbol lookup hanya untuk ticket baru"""
+        rows = np.array([(p.ticket, -1, p.type, p.volume, p.price_open, p.price_current, p.profit, p.swap)
+                         for p in positions], dtype=POSITION_DTYPE)
+        if not len(rows):
+            return rows
+
+        old = self.positions
+        if len(old):
+            order = np.argsort(old['ticket'])
+            tickets = old['ticket'][order]
+            found = np.searchsorted(tickets, rows['ticket']).clip(max=len(old) - 1)
+            match = tickets[found] == rows['ticket']
+            rows['symbol'][match] = old['symbol'][order[found[match]]]
+        for i in np.flatnonzero(rows['symbol'] < 0):
+            rows['symbol'][i] = self.symbol_index(positions[i].symbol)
+        return rows
+
+    def _apply_deals(self, deals) -> np.ndarray:
+        """Deals baru (ticket > cursor) ke realized; return net P/L closing deals (urut waktu)"""
+        deals = sorted((d for d in deals or ()
+                        if d.ticket > self.last_deal_ticket and d.magic == self.magic
+                        and d.type in (DEAL_TYPE_BUY, DEAL_TYPE_SELL)),
+                       key=lambda d: d.ticket)
+        if not deals:
+            return np.zeros(0)
+
+        symbols = np.fromiter((self.symbol_index(d.symbol) for d in deals), dtype='i4', count=len(deals))
+        net = np.array([d.profit + d.commission + d.swap + getattr(d, 'fee', 0.0) for d in deals])
+        closing = np.fromiter((d.entry != DEAL_ENTRY_IN for d in deals), dtype=bool, count=len(deals))
+
+        np.add.at(self.realized, symbols, net)
+        self.last_deal_ticket = deals[-1].ticket
+        self.last_deal_time = max(self.last_deal_time, max(d.time for d in deals))
+        self.deals += len(deals)
+        return net[closing]
+
+    async def sync(self) -> Optional[Dict]:
+        """
+        Refresh open positions & deals baru
+
+        Returns:
+            Dict dengan 'opened', 'closed' (jumlah ticket) dan 'closed_pnl' (net P/L closing deals),
+            atau None jika positions_get gagal (state sebelumnya dipertahankan)
+        """
+        started = time.perf_counter()
+        known = np.sort(self.positions['ticket'])
+        volumes = np.sort(self.positions['volume'])
+        result = await self.gateway.run(self.fetch, known, volumes)
+
+        if result['positions'] is None:
+            # Terminal / IPC error, bukan "semua position tertutup"
+            self.errors += 1
+            print(f"⚠️ positions_get failed: {result['error']}, keeping previous position book")
+            return None
+
+        # Deals gagal di-fetch: ulangi di sync berikutnya walau positions tidak berubah
+        self._deals_pending = result['deals_error']
+        if result['deals_error']:
+            self.errors += 1
+            print(f"⚠️ history_deals_get failed: {result['error']}, retrying next sync")
+
+        positions, deals = result['positions'], result['deals']
+        rows = self._positions_array(positions)
+        opened = int(np.count_nonzero(~np.isin(rows['ticket'], known)))
+        closed = int(np.count_nonzero(~np.isin(known, rows['ticket'])))
+        self.positions = rows
+
+        closed_pnl = np.zeros(0)
+        if deals is not None:
+            self.deal_fetches += 1
+            closed_pnl = self._apply_deals(deals)
+            since = self.last_deal_time or self.day_start
+            self._deals_seen = (since, sum(1 for d in deals if d.time >= since))
+
+        self.syncs += 1
+        self.sync_seconds += time.perf_counter() - started
+        return {'opened': opened, 'closed': closed, 'closed_pnl': closed_pnl}
+
+    def reset_day(self):
+        """Trading day baru: realized P/L mulai dari nol (cursor deal tetap)"""
+        self.day_start = self._midnight()
+        self.realized[:] = 0.0
+
+    def floating_by_symbol(self) -> np.ndarray:
+        """Profit + swap open positions per symbol"""
+        rows = self.positions
+        return np.bincount(rows['symbol'], weights=rows['profit'] + rows['swap'], minlength=len(self.symbols))
+
+    def exposure_by_symbol(self) -> np.ndarray:
+        """Net lots per symbol (BUY +, SELL -)"""
+        rows = self.positions
+        signed = np.where(rows['type'] == 0, rows['volume'], -rows['volume'])
+        return np.bincount(rows['symbol'], weights=signed, minlength=len(self.symbols))
+
+    def by_currency(self) -> Dict[str, np.ndarray]:
+        """
+        Per currency: P/L semua symbols yang memakai currency itu (base atau quote)
+        dan net exposure dalam lots (long base = +, long quote = -)
+        """
+        matrix = self.matrix
+        involved = np.abs(matrix).T
+        return {
+            'floating': involved @ self.floating_by_symbol(),
+            'realized': involved @ self.realized,
+            'exposure': matrix.T @ self.exposure_by_symbol()
+        }
+
+    @property
+    def floating(self) -> float:
+        rows = self.positions
+        return float(rows['profit'].sum() + rows['swap'].sum())
+
+    @property
+    def realized_total(self) -> float:
+        return float(self.realized.sum())
+
+    @property
+    def daily_pnl(self) -> float:
+        """Realized hari ini + floating open positions"""
+        return self.realized_total + self.floating
+
+    def summary(self, top: int = 5) -> List[str]:
+        """Ringkasan untuk log: total + top symbols / currencies (by |P/L|)"""
+        rows = self.positions
+        longs = int(np.count_nonzero(rows['type'] == 0))
+        lines = [f"{len(rows)} open ({longs} long / {len(rows) - longs} short), "
+                 f"floating ${self.floating:.2f}, realized ${self.realized_total:.2f}, "
+                 f"daily ${self.daily_pnl:.2f}"]
+        if not self.symbols:
+            return lines
+
+        floating = self.floating_by_symbol()
+        total = floating + self.realized
+        exposure = self.exposure_by_symbol()
+        for i in np.argsort(-np.abs(total))[:top]:
+            if total[i] or exposure[i]:
+                lines.append(f"{self.symbols[i]}: {exposure[i]:+.2f} lots, "
+                             f"floating ${floating[i]:.2f}, realized ${self.realized[i]:.2f}")
+
+        currency = self.by_currency()
+        pnl = currency['floating'] + currency['realized']
+        parts = [f"{self.currencies[i]} {currency['exposure'][i]:+.2f} lots ${pnl[i]:.2f}"
+                 for i in np.argsort(-np.abs(pnl))[:top] if pnl[i] or currency['exposure'][i]]
+        if parts:
+            lines.append("by currency: " + ", ".join(parts))
+        return lines
+
+    def stats(self) -> Dict:
+        return {
+            'positions': len(self.positions),
+            'symbols': len(self.symbols),
+            'syncs': self.syncs,
+            'deal_fetches': self.deal_fetches,
+            'deals': self.deals,
+            'errors': self.errors,
+            'avg_sync_ms': round(self.sync_seconds / self.syncs * 1000, 3) if self.syncs else 0.0
+        }
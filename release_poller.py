@@ -0,0 +1,165 @@
+"""
+Release Poller
+Burst polling Forex Factory calendar di sekitar jam rilis high-impact events
+"""
+
+import asyncio
+import time
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from calendar_diff import CalendarChange
+from forex_factory_scraper import parse_event_time
+
+
+class ReleasePoller:
+    """
+    Scheduler untuk calendar checks berdasarkan jadwal rilis.
+
+    Idle: poll setiap idle_interval. Menjelang rilis high-impact event
+    (release - lead_seconds) poller bangun dan poll setiap burst_interval
+    (selalu conditional request, abaikan cache TTL) sampai semua events di
+    jam rilis tersebut punya actual, atau burst_timeout habis. Setelah itu
+    kembali ke idle. Latency release -> detection dicatat per event.
+    """
+
+    def __init__(self, scraper, on_changes: Callable[[List[CalendarChange]], Awaitable[None]],
+                 idle_interval: float = 60.0, lead_seconds: float = 5.0, burst_interval: float = 1.0,
+                 burst_timeout: float = 120.0, hours_ahead: int = 2):
+        """
+        Initialize poller
+
+        Args:
+            scraper: ForexFactoryNewsScraper
+            on_changes: Coroutine yang memproses high impact changes
+            idle_interval: Interval poll saat tidak ada rilis (detik)
+            lead_seconds: Mulai burst N detik sebelum jam rilis
+            burst_interval: Interval poll saat burst (detik)
+            burst_timeout: Maksimal durasi burst setelah jam rilis (detik)
+            hours_ahead: Window events yang diteruskan ke on_changes
+
+        Raises:
+            ValueError jika scraper pakai calendar_source 'feed' (weekly feed
+            tidak pernah membawa actual, burst tidak akan pernah selesai)
+        """
+        if getattr(scraper, 'calendar_source', None) == 'feed':
+            raise ValueError("ReleasePoller needs actual values; calendar_source 'feed' has none (use 'auto')")
+
+        self.scraper = scraper
+        self.on_changes = on_changes
+        self.idle_interval = idle_interval
+        self.lead_seconds = lead_seconds
+        self.burst_interval = burst_interval
+        self.burst_timeout = burst_timeout
+        self.hours_ahead = hours_ahead
+
+        self.running = False
+        self.latencies: List[Dict] = []
+        self.polls = 0
+        self.burst_polls = 0
+
+    def _now(self) -> datetime:
+        return datetime.now(self.scraper.timezone)
+
+    def next_release(self) -> Optional[datetime]:
+        """Jam rilis terdekat yang belum punya actual (termasuk yang masih dalam burst_timeout)"""
+        cutoff = self._now() - timedelta(seconds=self.burst_timeout)
+        for release, _ in self.scraper.pending_releases():
+            if release >= cutoff:
+                return release
+        return None
+
+    async def poll(self, burst: bool = False) -> List[CalendarChange]:
+        """Satu calendar check, teruskan high impact changes ke on_changes"""
+        self.polls += 1
+        if burst:
+            self.burst_polls += 1
+
+        changes = await self.scraper.get_high_impact_changes(
+            hours_ahead=self.hours_ahead, revalidate=burst, verbose=not burst
+        )
+        detected = self._now()
+
+        for change in changes:
+            # Latency hanya untuk actual yang muncul selama diamati (kosong -> terisi);
+            # insert yang sudah punya actual (e.g. bot start setelah rilis) bukan detection
+            if change.kind != CalendarChange.UPDATE or not change.is_release:
+                continue
+            event = change.event
+            release = self._release_time(event)
+            if release is None:
+                continue
+            latency = (detected - release).total_seconds()
+            self.latencies.append({
+                'id': event['id'],
+                'currency': event['currency'],
+                'event': event['event'],
+                'release': release,
+                'detected': detected,
+                'latency': latency
+            })
+            print(f"⚡ {event['currency']} - {event['event']}: actual {event['actual']} "
+                  f"detected {latency:.1f}s after release")
+
+        if changes:
+            await self.on_changes(changes)
+        return changes
+
+    def _release_time(self, event: Dict) -> Optional[datetime]:
+        return parse_event_time(event['date'], event['time'], self.scraper.timezone)
+
+    async def _burst(self, release: datetime):
+        """Poll rapat sampai semua events di jam rilis ini punya actual"""
+        print(f"🎯 Burst polling for {release.strftime('%H:%M %Z')} release")
+        deadline = release + timedelta(seconds=self.burst_timeout)
+
+        while self.running and self._now() < deadline:
+            started = time.monotonic()
+            await self.poll(burst=True)
+
+            waiting = [event for when, event in self.scraper.pending_releases() if when == release]
+            if not waiting and self._now() >= release:
+                return
+
+            await asyncio.sleep(max(0.0, self.burst_interval - (time.monotonic() - started)))
+
+        print(f"⏳ Burst for {release.strftime('%H:%M %Z')} timed out, back to idle polling")
+
+    async def run(self):
+        """Main loop (jalankan sebagai asyncio task)"""
+        self.running = True
+        last_poll = float('-inf')
+        try:
+            while self.running:
+                if time.monotonic() - last_poll >= self.idle_interval:
+                    await self.poll()
+                    last_poll = time.monotonic()
+
+                release = self.next_release()
+                if release is not None:
+                    until_burst = (release - self._now()).total_seconds() - self.lead_seconds
+                    if until_burst <= 0:
+                        await self._burst(release)
+                        last_poll = time.monotonic()
+                        continue
+                    wait = min(until_burst, self.idle_interval - (time.monotonic() - last_poll))
+                else:
+                    wait = self.idle_interval - (time.monotonic() - last_poll)
+
+                await asyncio.sleep(max(0.0, wait))
+        finally:
+            self.running = False
+
+    def stop(self):
+        self.running = False
+
+    def stats(self) -> Dict:
+        """Poll counters dan release -> detection latency"""
+        values = sorted(item['latency'] for item in self.latencies)
+        return {
+            'polls': self.polls,
+            'burst_polls': self.burst_polls,
+            'releases': len(values),
+            'latency_median': values[len(values) // 2] if values else None,
+            'latency_max': values[-1] if values else None
+        }
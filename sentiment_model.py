@@ -0,0 +1,304 @@
+"""
+Sentiment Model
+Hashing vectorizer + linear model (CPU only) sebagai alternatif keyword engine
+"""
+
+import argparse
+import asyncio
+import json
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from keyword_matcher import tokenize
+
+
+def hash_features(texts: List[str], n_features: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Hashing vectorizer (unigrams + bigrams) untuk batch texts
+
+    Returns:
+        COO arrays (rows, cols, values) dari sparse term matrix
+    """
+    rows = []
+    cols = []
+    values = []
+
+    for row, text in enumerate(texts):
+        tokens = tokenize(text)
+        features = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+        for feature in features:
+            h = zlib.crc32(feature.encode('utf-8'))
+            rows.append(row)
+            cols.append(h % n_features)
+            # Signed hashing supaya collision saling cancel
+            values.append(1.0 if h & 0x80000000 else -1.0)
+
+    return (np.asarray(rows, dtype=np.intp),
+            np.asarray(cols, dtype=np.intp),
+            np.asarray(values, dtype=np.float64))
+
+
+class LinearSentimentModel:
+    """Linear regression di atas hashed features, output score -1..1"""
+
+    def __init__(self, weights: np.ndarray, bias: float = 0.0):
+        self.weights = weights
+        self.bias = bias
+        self.n_features = len(weights)
+
+    @classmethod
+    def load(cls, path: str) -> 'LinearSentimentModel':
+        """Load model dari file .npz"""
+        with np.load(path) as data:
+            return cls(data['weights'], float(data['bias']))
+
+    def save(self, path: str):
+        """Save model ke file .npz"""
+        np.savez_compressed(path, weights=self.weights, bias=np.float64(self.bias))
+
+    def predict(self, texts: List[str]) -> np.ndarray:
+        """Predict score (-1..1) untuk batch texts"""
+        rows, cols, values = hash_features(texts, self.n_features)
+        raw = np.bincount(rows, weights=self.weights[cols] * values, minlength=len(texts))
+        return np.clip(raw + self.bias, -1.0, 1.0)
+
+    @classmethod
+    def train(cls, texts: List[str], labels: List[float], n_features: int = 2 ** 18,
+              epochs: int = 5, learning_rate: float = 0.1, l2: float = 1e-6,
+              batch_size: int = 256, seed: int = 0) -> 'LinearSentimentModel':
+        """
+        Train offline dengan minibatch SGD (squared loss)
+
+        Args:
+            texts: Archived news texts
+            labels: Target score per text (-1 = bearish, 1 = bullish)
+        """
+        y_all = np.clip(np.asarray(labels, dtype=np.float64), -1.0, 1.0)
+        weights = np.zeros(n_features)
+        bias = 0.0
+        rng = np.random.default_rng(seed)
+
+        for epoch in range(epochs):
+            order = rng.permutation(len(texts))
+            for start in range(0, len(order), batch_size):
+                index = order[start:start + batch_size]
+                rows, cols, values = hash_features([texts[i] for i in index], n_features)
+                y = y_all[index]
+
+                pred = np.bincount(rows, weights=weights[cols] * values, minlength=len(index)) + bias
+                error = (pred - y) / len(index)
+
+                gradient = np.bincount(cols, weights=error[rows] * values, minlength=n_features)
+                weights *= 1.0 - learning_rate * l2
+                weights -= learning_rate * gradient
+                bias -= learning_rate * error.sum()
+
+        return cls(weights, bias)
+
+
+# Model per worker process (di-load sekali oleh initializer)
+_worker_model: Optional[LinearSentimentModel] = None
+
+
+def _init_worker(model_path: str):
+    global _worker_model
+    _worker_model = LinearSentimentModel.load(model_path)
+
+
+def _predict_in_worker(texts: List[str]) -> np.ndarray:
+    return _worker_model.predict(texts)
+
+
+class ModelNewsAnalyzer:
+    """
+    Drop-in pengganti EnhancedNewsAnalyzer yang memakai trained model.
+
+    Score diambil dari LinearSentimentModel, sedangkan currency detection dan
+    pair selection tetap didelegasikan ke keyword analyzer. Return format
+    sama dengan keyword engine (raw_score int dalam skala keyword points,
+    model score x max_possible_score), dan results lewat SentimentCache yang
+    sama (key diberi prefix 'model' supaya tidak tertukar dengan keyword results).
+    """
+
+    def __init__(self, model_path: str, keyword_analyzer, workers: int = 0,
+                 chunk_size: int = 256, cache=None):
+        """
+        Initialize model analyzer
+
+        Args:
+            model_path: Path ke model .npz hasil training
+            keyword_analyzer: EnhancedNewsAnalyzer untuk currency detection
+            workers: Jumlah worker process (0 = inference di thread executor)
+            chunk_size: Jumlah texts per task ke worker
+            cache: Optional SentimentCache (default: cache milik keyword_analyzer)
+        """
+        self.model_path = model_path
+        self.model = LinearSentimentModel.load(model_path)
+        self.keyword_analyzer = keyword_analyzer
+        self.chunk_size = chunk_size
+        self.cache = cache if cache is not None else getattr(keyword_analyzer, 'cache', None)
+
+        self.pool = None
+        if workers > 0:
+            self.pool = ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(model_path,)
+            )
+
+    def detect_currencies(self, text: str) -> List[str]:
+        return self.keyword_analyzer.detect_currencies(text)
+
+    def get_tradable_pairs(self, affected_currencies: List[str]) -> List[str]:
+        return self.keyword_analyzer.get_tradable_pairs(affected_currencies)
+
+    def _cache_key(self, text: str) -> Tuple:
+        return ('model', self.cache.text_key(text))
+
+    def _build_results(self, texts: List[str], scores: np.ndarray) -> List[Dict]:
+        """Model scores -> result dicts (format analyze_sentiment)"""
+        normalized = np.clip(scores, -1.0, 1.0)
+        raw_score = np.rint(normalized * self.keyword_analyzer.max_possible_score).astype(int)
+        signal = np.select(
+            [normalized >= 0.3, normalized <= -0.3],
+            ['LONG', 'SHORT'],
+            default='NEUTRAL'
+        )
+        magnitude = np.abs(normalized)
+        strength = np.select(
+            [magnitude >= 0.7, magnitude >= 0.5, magnitude >= 0.3],
+            ['very_strong', 'strong', 'moderate'],
+            default='weak'
+        )
+        return [{
+            'sentiment_score': float(round(score, 3)),
+            'raw_score': int(raw),
+            'signal': str(sig),
+            'strength': str(level),
+            'bullish_keywords': [],
+            'bearish_keywords': [],
+            'affected_currencies': self.detect_currencies(text),
+            'news_preview': text[:200]
+        } for text, score, raw, sig, level in zip(texts, normalized, raw_score, signal, strength)]
+
+    def _lookup(self, texts: List[str]) -> Tuple[List, List[Optional[Dict]], Dict]:
+        """Cache lookup; return (keys, results, key -> row pertama yang harus di-score)"""
+        if self.cache is None:
+            return list(range(len(texts))), [None] * len(texts), {row: row for row in range(len(texts))}
+
+        keys = [self._cache_key(text) for text in texts]
+        results = [self.cache.get(key) for key in keys]
+        missing = {}
+        for row, (key, cached) in enumerate(zip(keys, results)):
+            if cached is None and key not in missing:
+                missing[key] = row
+        return keys, results, missing
+
+    def _merge(self, texts: List[str], keys: List, results: List[Optional[Dict]], missing: Dict,
+               scores: np.ndarray) -> Dict:
+        """Gabung cached + fresh results ke batch format EnhancedNewsAnalyzer.analyze_batch"""
+        fresh = dict(zip(missing, self._build_results([texts[row] for row in missing.values()], scores)))
+        if self.cache is not None:
+            for key, result in fresh.items():
+                self.cache.put(key, result)
+        results = [cached if cached is not None else fresh[key] for key, cached in zip(keys, results)]
+
+        return {
+            'sentiment_score': np.array([r['sentiment_score'] for r in results], dtype=np.float64),
+            'raw_score': np.array([r['raw_score'] for r in results], dtype=np.int64),
+            'signal': np.array([r['signal'] for r in results], dtype='<U7'),
+            'strength': np.array([r['strength'] for r in results], dtype='<U11'),
+            'bullish_keywords': [r['bullish_keywords'] for r in results],
+            'bearish_keywords': [r['bearish_keywords'] for r in results],
+            'affected_currencies': [r['affected_currencies'] for r in results]
+        }
+
+    def analyze_batch(self, texts: List[str]) -> Dict:
+        """Batched inference (hanya cache misses), format sama dengan EnhancedNewsAnalyzer.analyze_batch"""
+        keys, results, missing = self._lookup(texts)
+        scores = self.model.predict([texts[row] for row in missing.values()]) if missing else np.zeros(0)
+        return self._merge(texts, keys, results, missing, scores)
+
+    async def analyze_batch_async(self, texts: List[str]) -> Dict:
+        """Batched inference di luar event loop (process pool atau thread)"""
+        keys, results, missing = self._lookup(texts)
+        pending = [texts[row] for row in missing.values()]
+        loop = asyncio.get_running_loop()
+
+        if not pending:
+            scores = np.zeros(0)
+        elif self.pool is None:
+            scores = await loop.run_in_executor(None, self.model.predict, pending)
+        else:
+            chunks = [pending[i:i + self.chunk_size] for i in range(0, len(pending), self.chunk_size)]
+            parts = await asyncio.gather(*[
+                loop.run_in_executor(self.pool, _predict_in_worker, chunk) for chunk in chunks
+            ])
+            scores = np.concatenate(parts)
+
+        return self._merge(texts, keys, results, missing, scores)
+
+    def analyze_sentiment(self, news_text: str) -> Dict:
+        """Drop-in untuk EnhancedNewsAnalyzer.analyze_sentiment (return format & cache sama)"""
+        if self.cache is not None:
+            key = self._cache_key(news_text)
+            cached = self.cache.get(key)
+            if cached is not None:
+                return {**cached, 'news_preview': news_text[:200]}
+
+        result = self._build_results([news_text], self.model.predict([news_text]))[0]
+        if self.cache is not None:
+            self.cache.put(key, result)
+        return result
+
+    def close(self):
+        """Shutdown worker processes"""
+        if self.pool is not None:
+            self.pool.shutdown(wait=False, cancel_futures=True)
+            self.pool = None
+
+
+def load_labeled_archive(path: str) -> Tuple[List[str], List[float]]:
+    """Load JSON Lines archive: satu object per baris dengan 'text' dan 'label'"""
+    texts = []
+    labels = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            record = json.loads(line)
+            if 'label' not in record:
+                continue
+            texts.append(record['text'])
+            labels.append(float(record['label']))
+    return texts, labels
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Train sentiment model dari archived news")
+    parser.add_argument('archive', help='JSON Lines file dengan field text & label (-1..1)')
+    parser.add_argument('-o', '--output', default='sentiment_model.npz', help='Output model path')
+    parser.add_argument('--features', type=int, default=18, help='Hash space = 2^N features')
+    parser.add_argument('--epochs', type=int, default=5)
+    args = parser.parse_args()
+
+    texts, labels = load_labeled_archive(args.archive)
+    if not texts:
+        print("❌ Tidak ada labeled records di archive")
+        return
+
+    print(f"🧠 Training on {len(texts)} labeled messages...")
+    model = LinearSentimentModel.train(texts, labels, n_features=2 ** args.features, epochs=args.epochs)
+    model.save(args.output)
+
+    predictions = model.predict(texts)
+    mae = float(np.mean(np.abs(predictions - np.clip(labels, -1.0, 1.0))))
+    print(f"✅ Model saved to {args.output} (train MAE: {mae:.3f})")
+
+
+if __name__ == "__main__":
+    main()
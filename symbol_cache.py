@@ -0,0 +1,208 @@
+"""
+Symbol Cache
+Per-symbol trading metadata (digits, volume limits, stops level, filling mode) + order request templates
+"""
+
+import math
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+# symbol_info.filling_mode flags (MQL5 SYMBOL_FILLING_*)
+SYMBOL_FILLING_FOK = 1
+SYMBOL_FILLING_IOC = 2
+
+# Retcodes yang berarti spec symbol di broker berubah -> reload metadata
+SPEC_CHANGED_RETCODES = frozenset({
+    10014,  # TRADE_RETCODE_INVALID_VOLUME
+    10015,  # TRADE_RETCODE_INVALID_PRICE
+    10016,  # TRADE_RETCODE_INVALID_STOPS
+    10030,  # TRADE_RETCODE_INVALID_FILL
+})
+
+
+class SymbolSpec:
+    """
+    Metadata satu symbol + pre-built order request template.
+
+    Hot path hanya mengisi type, price, sl, tp, volume dan comment di copy
+    dari template; semua field lain (filling mode yang di-support broker,
+    deviation, magic) sudah di-resolve saat load.
+    """
+
+    __slots__ = ('name', 'digits', 'point', 'volume_min', 'volume_max', 'volume_step',
+                 'stops_level', 'filling_mode', 'visible', 'template', 'loaded_at')
+
+    def __init__(self, info, module, deviation: int = 20, magic: int = 234000):
+        """
+        Args:
+            info: mt5.symbol_info() result
+            module: MetaTrader5 module (constants)
+            deviation: Max slippage (points)
+            magic: EA magic number
+        """
+        self.name = info.name
+        self.digits = info.digits
+        self.point = info.point
+        self.volume_min = info.volume_min
+        self.volume_max = info.volume_max
+        self.volume_step = info.volume_step
+        self.stops_level = info.trade_stops_level
+        self.filling_mode = info.filling_mode
+        self.visible = info.visible
+        self.loaded_at = time.monotonic()
+
+        self.template = {
+            "action": module.TRADE_ACTION_DEAL,
+            "symbol": self.name,
+            "deviation": deviation,
+            "magic": magic,
+            "type_time": module.ORDER_TIME_GTC,
+            "type_filling": self.order_filling(module),
+        }
+
+    def order_filling(self, module) -> int:
+        """IOC jika di-support (default lama), lalu FOK, selain itu RETURN"""
+        if self.filling_mode & SYMBOL_FILLING_IOC:
+            return module.ORDER_FILLING_IOC
+        if self.filling_mode & SYMBOL_FILLING_FOK:
+            return module.ORDER_FILLING_FOK
+        return module.ORDER_FILLING_RETURN
+
+    def key(self) -> Tuple:
+        """Fields yang dibandingkan saat refresh (change detection)"""
+        return (self.digits, self.point, self.volume_min, self.volume_max, self.volume_step,
+                self.stops_level, self.filling_mode)
+
+    def normalize_volume(self, volume: float) -> Optional[float]:
+        """
+        Bulatkan ke bawah ke volume_step, clamp ke volume_max
+
+        Returns:
+            Volume valid, atau None jika di bawah volume_min (tidak dinaikkan
+            diam-diam ke minimum broker = risk lebih besar dari konfigurasi)
+        """
+        step = self.volume_step or self.volume_min or 0.01
+        volume = math.floor(volume / step + 1e-9) * step
+        if volume < self.volume_min - 1e-9:
+            return None
+        volume = min(volume, self.volume_max)
+        return round(volume, max(0, -int(math.floor(math.log10(step)))))
+
+    def stop_distance(self) -> float:
+        """Jarak minimum SL/TP dari harga (stops level dalam price units)"""
+        return self.stops_level * self.point
+
+    def order_request(self, order_type: int, price: float, sl: float, tp: float, volume: float,
+                      comment: str) -> Dict:
+        """Copy template + field per order"""
+        request = self.template.copy()
+        request["type"] = order_type
+        request["price"] = price
+        request["sl"] = sl
+        request["tp"] = tp
+        request["volume"] = volume
+        request["comment"] = comment
+        return request
+
+
+class SymbolCache:
+    """
+    SymbolSpec per symbol, di-load sekaligus lewat MT5Gateway.
+
+    Full reload setiap ttl detik (refresh_if_stale dari main loop); satu
+    symbol di-reload segera jika order ditolak dengan retcode yang
+    menandakan spec berubah (lihat SPEC_CHANGED_RETCODES).
+    """
+
+    def __init__(self, gateway, ttl: float = 3600.0, deviation: int = 20, magic: int = 234000):
+        """
+        Initialize cache
+
+        Args:
+            gateway: MT5Gateway
+            ttl: Interval full refresh (detik)
+            deviation: Max slippage di order template (points)
+            magic: Magic number di order template
+        """
+        self.gateway = gateway
+        self.ttl = ttl
+        self.deviation = deviation
+        self.magic = magic
+        self._specs: Dict[str, SymbolSpec] = {}
+        self.loaded_at = 0.0
+
+        # Stats
+        self.loads = 0
+        self.changes = 0
+
+    def symbol_info_batch(self, module, symbols: List[str]) -> Dict[str, SymbolSpec]:
+        """Jalan di gateway thread: semua symbol_info dalam satu queue item"""
+        specs = {}
+        for symbol in symbols:
+            info = module.symbol_info(symbol)
+            if info is not None:
+                specs[symbol] = SymbolSpec(info, module, self.deviation, self.magic)
+        return specs
+
+    async def load(self, symbols: Iterable[str]) -> Dict[str, SymbolSpec]:
+        """
+        Load / reload metadata
+
+        Returns:
+            Specs yang berubah dibanding versi sebelumnya
+        """
+        symbols = list(symbols)
+        specs = await self.gateway.run(self.symbol_info_batch, symbols)
+        self.loads += 1
+
+        changed = {}
+        for symbol, spec in specs.items():
+            old = self._specs.get(symbol)
+            if old is not None and old.key() != spec.key():
+                changed[symbol] = spec
+                print(f"🔧 {symbol} spec changed: {old.key()} → {spec.key()}")
+            self._specs[symbol] = spec
+
+        self.changes += len(changed)
+        if len(symbols) > 1 or not self.loaded_at:
+            self.loaded_at = time.monotonic()
+        return changed
+
+    async def refresh_if_stale(self) -> Dict[str, SymbolSpec]:
+        """Full reload jika umur cache >= ttl"""
+        if not self._specs or time.monotonic() - self.loaded_at < self.ttl:
+            return {}
+        return await self.load(self._specs)
+
+    def get(self, symbol: str) -> Optional[SymbolSpec]:
+        return self._specs.get(symbol)
+
+    async def ensure(self, symbol: str) -> Optional[SymbolSpec]:
+        """Spec dari cache, load dulu jika belum ada"""
+        spec = self._specs.get(symbol)
+        if spec is None:
+            await self.load([symbol])
+            spec = self._specs.get(symbol)
+        return spec
+
+    def invalidate(self, symbol: Optional[str] = None):
+        """Buang satu symbol (atau semua), load ulang saat ensure berikutnya"""
+        if symbol is None:
+            self._specs.clear()
+        else:
+            self._specs.pop(symbol, None)
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._specs
+
+    def __len__(self) -> int:
+        return len(self._specs)
+
+    def stats(self) -> Dict:
+        return {
+            'symbols': len(self._specs),
+            'loads': self.loads,
+            'changes': self.changes,
+            'age_seconds': round(time.monotonic() - self.loaded_at, 1) if self.loaded_at else None
+        }
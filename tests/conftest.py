@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Modules bot ada di root repo (flat layout)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,88 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from basket import BasketExecutor, BasketLeg
+from mt5_gateway import MT5Gateway
+
+POINT = 0.00001
+
+
+class FakeTerminal:
+    """Harga naik 1 point setiap order_send (market bergerak selama basket dikirim)"""
+
+    TRADE_RETCODE_DONE = 10009
+
+    def __init__(self, margin_free=1000.0, margin=200.0, check_retcodes=None):
+        self.drift = 0
+        self.margin_free = margin_free
+        self.margin = margin
+        self.check_retcodes = check_retcodes or {}
+        self.sent = []
+
+    def price(self, symbol):
+        return {'EURUSD': 1.10000, 'GBPUSD': 1.27000, 'AUDUSD': 0.66000}[symbol] + self.drift * POINT
+
+    def account_info(self):
+        return SimpleNamespace(margin_free=self.margin_free)
+
+    def order_check(self, request):
+        retcode = self.check_retcodes.get(request['symbol'], 0)
+        return SimpleNamespace(retcode=retcode, comment='ok' if not retcode else 'No money')
+
+    def order_calc_margin(self, order_type, symbol, volume, price):
+        return self.margin
+
+    def symbol_info_tick(self, symbol):
+        bid = self.price(symbol)
+        return SimpleNamespace(bid=bid, ask=bid + 2 * POINT)
+
+    def order_send(self, request):
+        self.sent.append(request['symbol'])
+        self.drift += 1
+        tick = self.symbol_info_tick(request['symbol'])
+        price = tick.ask if request['type'] == 0 else tick.bid
+        return SimpleNamespace(retcode=10009, comment='done', order=len(self.sent), price=price)
+
+    def last_error(self):
+        return (1, 'error')
+
+
+def leg(symbol, signal, price):
+    request = {'symbol': symbol, 'type': 0 if signal == 'LONG' else 1, 'volume': 0.01, 'price': price}
+    return BasketLeg(symbol, signal, request, POINT)
+
+
+def execute(terminal, legs, **kwargs):
+    gateway = MT5Gateway(terminal)
+    try:
+        return asyncio.run(BasketExecutor(gateway, **kwargs).execute(legs))
+    finally:
+        gateway.close()
+
+
+@pytest.mark.parametrize('leg_delay', [0.0, 0.01])
+def test_slippage_is_relative_to_first_leg(leg_delay):
+    terminal = FakeTerminal()
+    # Decision prices basi (5 points di bawah market) tidak mempengaruhi slippage
+    legs = [leg('EURUSD', 'LONG', 1.09995), leg('GBPUSD', 'SHORT', 1.26995), leg('AUDUSD', 'LONG', 0.65995)]
+    report = execute(terminal, legs, leg_delay=leg_delay)
+
+    assert terminal.sent == ['EURUSD', 'GBPUSD', 'AUDUSD']
+    assert [round(l.slippage_points, 1) for l in report.legs] == [1.0, -2.0, 3.0]
+    assert report.stats()['filled'] == 3
+    assert report.offset_ms(report.legs[0]) == pytest.approx(report.legs[0].latency_ms)
+    assert 'vs first leg' in report.lines()[0]
+
+
+def test_failed_check_and_margin_budget_reject_before_send():
+    terminal = FakeTerminal(margin_free=500.0, check_retcodes={'GBPUSD': 10019})
+    legs = [leg('EURUSD', 'LONG', 1.1), leg('GBPUSD', 'LONG', 1.27), leg('AUDUSD', 'LONG', 0.66),
+            leg('EURUSD', 'SHORT', 1.1)]
+    report = execute(terminal, legs, max_margin_usage=0.9)
+
+    assert terminal.sent == ['EURUSD', 'AUDUSD']
+    assert [l.rejected is not None for l in report.legs] == [False, True, False, True]
+    assert 'order_check 10019' in report.legs[1].rejected
+    assert 'exceeds basket budget' in report.legs[3].rejected
@@ -0,0 +1,59 @@
+from calendar_diff import CalendarChange, CalendarDiffer
+from news_dedup import TTLDedupSet
+
+
+def row(event_id='ev1', actual='', forecast='0.3%', previous='0.2%', impact='high'):
+    return {'id': event_id, 'currency': 'USD', 'event': 'CPI m/m', 'impact': impact,
+            'actual': actual, 'forecast': forecast, 'previous': previous}
+
+
+def test_first_snapshot_emits_inserts_only_once():
+    differ = CalendarDiffer()
+    changes = differ.diff('2024-03-12', [row('a'), row('b')])
+    assert [(c.kind, c.event_id) for c in changes] == [('insert', 'a'), ('insert', 'b')]
+    assert differ.diff('2024-03-12', [row('a'), row('b')]) == []
+
+
+def test_release_and_revision_are_updates():
+    differ = CalendarDiffer()
+    differ.diff('2024-03-12', [row()])
+
+    [release] = differ.diff('2024-03-12', [row(actual='0.4%')])
+    assert release.kind == CalendarChange.UPDATE
+    assert release.changes == {'actual': ('', '0.4%')}
+    assert release.is_release and release.revised_fields == []
+
+    [revision] = differ.diff('2024-03-12', [row(actual='0.4%', previous='0.1%')])
+    assert not revision.is_release
+    assert revision.revised_fields == ['previous']
+
+
+def test_seen_set_suppresses_unchanged_rows_after_restart():
+    seen = TTLDedupSet()
+    CalendarDiffer(seen=seen).diff('2024-03-12', [row('a'), row('b')])
+
+    restarted = CalendarDiffer(seen=seen)
+    changes = restarted.diff('2024-03-12', [row('a'), row('b', actual='0.4%')])
+    assert [(c.kind, c.event_id) for c in changes] == [('insert', 'b')]
+
+
+def test_snapshots_are_bounded_lru():
+    differ = CalendarDiffer(max_dates=2)
+    for date in ('2024-03-11', '2024-03-12', '2024-03-13'):
+        differ.diff(date, [row()])
+    assert differ.snapshot('2024-03-11') == []
+    assert differ.stats()['dates'] == 2
+
+
+def test_select_skips_rows_until_they_pass():
+    seen = TTLDedupSet()
+    differ = CalendarDiffer(seen=seen)
+    high = lambda event: event['impact'] == 'high'
+    changes = differ.diff('2024-03-12', [row('a'), row('b', impact='low')], high)
+    assert [c.event_id for c in changes] == ['a']
+    assert [e['id'] for e in differ.snapshot('2024-03-12')] == ['a']
+    assert len(seen) == 1
+
+    # 'b' naik ke high impact: di-emit sebagai insert, bukan hilang
+    changes = differ.diff('2024-03-12', [row('a'), row('b')], high)
+    assert [(c.kind, c.event_id) for c in changes] == [('insert', 'b')]
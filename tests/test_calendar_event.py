@@ -0,0 +1,44 @@
+import pytest
+
+from calendar_event import CalendarEvent, parse_value
+
+
+@pytest.mark.parametrize('raw, value, unit, is_percent, comparator', [
+    ('0.3%', 0.3, '', True, ''),
+    ('-0.2%', -0.2, '', True, ''),
+    ('+1.5%', 1.5, '', True, ''),
+    ('−0.2%', -0.2, '', True, ''),
+    ('12K', 12e3, 'K', False, ''),
+    ('-12k', -12e3, 'K', False, ''),
+    ('3.4M', 3.4e6, 'M', False, ''),
+    ('1.25B', 1.25e9, 'B', False, ''),
+    ('2T', 2e12, 'T', False, ''),
+    ('$1.2B', 1.2e9, 'B', False, ''),
+    ('-$68.9B', -68.9e9, 'B', False, ''),
+    ('£-3.1B', -3.1e9, 'B', False, ''),
+    ('<0.10%', 0.1, '', True, '<'),
+    ('> 50.0', 50.0, '', False, '>'),
+    ('1,234', 1234.0, '', False, ''),
+    ('1,234.5K', 1234.5e3, 'K', False, ''),
+    ('52.3', 52.3, '', False, ''),
+    ('.5%', 0.5, '', True, ''),
+    (' 4 ', 4.0, '', False, ''),
+])
+def test_parse_value(raw, value, unit, is_percent, comparator):
+    parsed = parse_value(raw)
+    assert parsed.value == pytest.approx(value)
+    assert (parsed.unit, parsed.is_percent, parsed.comparator, parsed.raw) == (unit, is_percent, comparator, raw)
+
+
+@pytest.mark.parametrize('raw', [None, '', '   ', 'N/A', 'Tentative', '1.2X', '%', '--'])
+def test_parse_value_empty_or_not_numeric(raw):
+    assert parse_value(raw) is None
+
+
+def test_event_parses_values_once():
+    event = CalendarEvent.coerce({'id': '1', 'date': '2024-03-08', 'time': '8:30am', 'currency': 'USD',
+                                  'impact': 'high', 'impact_score': 3, 'event': 'Non-Farm Employment Change',
+                                  'actual': '275K', 'forecast': '198K', 'previous': '-229K'})
+    assert event.actual_value.value > event.forecast_value.value
+    assert event.previous_value.value == -229e3
+    assert event['actual'] == '275K' and event.to_dict()['forecast'] == '198K'
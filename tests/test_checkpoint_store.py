@@ -0,0 +1,69 @@
+import sqlite3
+import time
+
+import pytest
+
+from checkpoint_store import CheckpointStore
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / 'state.db')
+
+
+def test_cursors_and_processed_survive_restart(db_path):
+    store = CheckpointStore(db_path, flush_interval=0.01)
+    store.set_cursor('telegram', 'marketfeed', 120)
+    store.mark_processed('news', 'marketfeed:120')
+    store.close()
+
+    store = CheckpointStore(db_path)
+    assert store.cursors('telegram') == {'marketfeed': 120}
+    assert store.processed_ids('news') == {'marketfeed:120'}
+    store.close()
+
+
+def test_same_id_from_two_sources_is_kept(db_path):
+    store = CheckpointStore(db_path)
+    store.mark_processed('news', 'ff:123')
+    store.mark_processed('ff_calendar', 'ff:123')
+    store.close()
+
+    store = CheckpointStore(db_path)
+    assert store.processed_ids('news') == {'ff:123'}
+    assert store.processed_ids('ff_calendar') == {'ff:123'}
+    store.close()
+
+
+def test_old_schema_is_migrated(db_path):
+    conn = sqlite3.connect(db_path)
+    conn.execute('CREATE TABLE processed (id TEXT PRIMARY KEY, source TEXT NOT NULL, seen_at REAL NOT NULL)')
+    conn.execute("INSERT INTO processed VALUES ('a', 'news', ?)", (time.time(),))
+    conn.commit()
+    conn.close()
+
+    store = CheckpointStore(db_path)
+    store.mark_processed('ff_calendar', 'a')
+    store.close()
+
+    store = CheckpointStore(db_path)
+    assert store.processed_ids('news') == {'a'}
+    assert store.processed_ids('ff_calendar') == {'a'}
+    store.close()
+
+
+def test_writer_prunes_expired_ids(db_path):
+    store = CheckpointStore(db_path, flush_interval=0.01, retention_days=1.0, prune_interval=0.05)
+    with store._lock:
+        store._pending_processed[('news', 'old')] = time.time() - 2 * 86400
+    store.mark_processed('news', 'new')
+
+    deadline = time.time() + 2
+    while store.stats()['rows_pruned'] < 1 and time.time() < deadline:
+        time.sleep(0.02)
+    store.close()
+
+    assert store.stats()['rows_pruned'] == 1
+    conn = sqlite3.connect(db_path)
+    assert [row[0] for row in conn.execute('SELECT id FROM processed')] == ['new']
+    conn.close()
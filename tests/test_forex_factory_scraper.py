@@ -0,0 +1,51 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from forex_factory_scraper import ForexFactoryNewsScraper
+
+
+def event(event_id, when, impact='high', actual=''):
+    return {
+        'id': event_id, 'date': when.strftime('%Y-%m-%d'),
+        'time': when.strftime('%I:%M%p').lstrip('0').lower(),
+        'currency': 'USD', 'impact': impact, 'event': f'Event {event_id}',
+        'actual': actual, 'forecast': '0.3%', 'previous': '0.2%'
+    }
+
+
+@pytest.fixture
+def scraper():
+    scraper = ForexFactoryNewsScraper()
+    now = datetime.now(scraper.timezone).replace(second=0, microsecond=0)
+    scraper.rows = [event('soon', now + timedelta(minutes=30)),
+                    event('later', now + timedelta(hours=5)),
+                    event('low', now + timedelta(minutes=30), impact='low')]
+
+    async def snapshot(date=None, revalidate=False, verbose=True):
+        # Satu "hari" berisi semua rows, jadi window yang lewat tengah malam tetap sama
+        return scraper.rows
+
+    scraper.get_calendar_snapshot = snapshot
+    return scraper
+
+
+def ids(changes):
+    return sorted(change.event_id for change in changes)
+
+
+def test_read_only_callers_do_not_consume_changes(scraper):
+    async def run():
+        await scraper.get_calendar_events()
+        await scraper.get_currency_specific_news('USD')
+        await scraper.get_high_impact_events(hours_ahead=24)
+        return await scraper.get_high_impact_changes(hours_ahead=2)
+
+    assert ids(asyncio.run(run())) == ['soon']
+    assert len(scraper.processed_events) == 1
+
+
+def test_event_outside_window_is_emitted_when_it_enters(scraper):
+    assert ids(asyncio.run(scraper.get_high_impact_changes(hours_ahead=2))) == ['soon']
+    assert ids(asyncio.run(scraper.get_high_impact_changes(hours_ahead=6))) == ['later']
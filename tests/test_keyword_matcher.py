@@ -0,0 +1,46 @@
+import pytest
+
+from keyword_matcher import KeywordMatcher, tokenize
+
+
+@pytest.fixture
+def matcher():
+    matcher = KeywordMatcher()
+    matcher.add_lexicon('bullish', {'rise': 1.0, 'rally': 1.0, 'hike': 1.0, 'gain': 1.0})
+    matcher.add_lexicon('bearish', {'drop': -1.0, 'cut': -1.0, 'bank of england': 0.0})
+    return matcher
+
+
+@pytest.mark.parametrize('word, keyword', [
+    ('rising', 'rise'), ('rises', 'rise'), ('risen', None),
+    ('dropped', 'drop'), ('dropping', 'drop'), ('drops', 'drop'),
+    ('rallied', 'rally'), ('rallies', 'rally'), ('rallying', 'rally'),
+    ('hiking', 'hike'), ('hiked', 'hike'),
+    ('cutting', 'cut'), ('gained', 'gain'), ('gaining', 'gain'),
+])
+def test_inflected_forms(matcher, word, keyword):
+    matched = [entry[1] for entry in matcher.match(f"EUR/USD {word} after data")]
+    assert matched == ([keyword] if keyword else [])
+
+
+def test_word_boundary(matcher):
+    assert matcher.match('update on the ukraine situation') == []
+    assert matcher.match('Bank of England hikes') == [('bullish', 'hike', 1.0), ('bearish', 'bank of england', 0.0)]
+
+
+def test_tokenize_splits_punctuation():
+    assert tokenize('U.S. CPI-rises 0.3%') == ['u', 's', 'cpi', 'rises', '0', '3']
+
+
+BATCH_TEXTS = [
+    'EUR/USD rising, Bank of England hikes', '', 'bank of', 'dropped. Bank   of\nEngland',
+    'Café — “rally” cut’s', 'rise_drop rise-drop', 'x\x00 rallied', 'gain gain gained',
+]
+
+
+def test_match_batch_equals_per_text(matcher):
+    for texts in (BATCH_TEXTS, BATCH_TEXTS[:4], [t for t in BATCH_TEXTS if t.isascii() and '\x00' not in t], []):
+        rows, entry_ids = matcher.match_batch(texts)
+        per_text = [(row, entry_id) for row, text in enumerate(texts)
+                    for entry_id in matcher.match_tokens(tokenize(text))]
+        assert list(zip(rows.tolist(), entry_ids.tolist())) == per_text
@@ -0,0 +1,46 @@
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+from mt5_gateway import PRIORITY_BACKGROUND, PRIORITY_ORDER, MT5Gateway
+
+
+def test_calls_run_on_worker_thread():
+    module = SimpleNamespace(ORDER_TYPE_BUY=0, thread=lambda: threading.current_thread().name)
+    gateway = MT5Gateway(module)
+    assert gateway.ORDER_TYPE_BUY == 0
+    assert asyncio.run(gateway.thread()) == 'mt5-gateway'
+    gateway.close()
+
+
+def test_orders_jump_ahead_of_background_work():
+    order = []
+    gate = threading.Event()
+    module = SimpleNamespace(block=lambda: gate.wait(2), record=lambda name: order.append(name))
+    gateway = MT5Gateway(module)
+
+    async def main():
+        blocker = asyncio.ensure_future(gateway.call('block'))
+        await asyncio.sleep(0.05)
+        background = [gateway.call('record', f"ticks-{i}", priority=PRIORITY_BACKGROUND) for i in range(3)]
+        normal = gateway.call('record', 'positions')
+        send = gateway.call('record', 'order_send', priority=PRIORITY_ORDER)
+        tasks = [asyncio.ensure_future(c) for c in (*background, normal, send)]
+        await asyncio.sleep(0.05)
+        gate.set()
+        await blocker
+        await asyncio.gather(*tasks)
+
+    asyncio.run(main())
+    gateway.close()
+    assert order == ['order_send', 'positions', 'ticks-0', 'ticks-1', 'ticks-2']
+
+
+def test_close_drains_queue_first():
+    done = []
+    module = SimpleNamespace(slow=lambda i: (time.sleep(0.01), done.append(i)))
+    gateway = MT5Gateway(module)
+    futures = [gateway.submit('slow', module.slow, i) for i in range(5)]
+    gateway.close()
+    assert all(f.done() for f in futures) and done == [0, 1, 2, 3, 4]
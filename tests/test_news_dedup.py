@@ -0,0 +1,75 @@
+import pytest
+
+from news_dedup import NearDuplicateDetector, TTLDedupSet
+
+
+@pytest.fixture
+def detector():
+    return NearDuplicateDetector(similarity=0.6, window_seconds=3600)
+
+
+@pytest.mark.parametrize('original, followup', [
+    ("Fed hikes rates by 25bp", "Fed cuts rates by 25bp"),
+    ("US CPI rises 0.4% m/m, above expectations of 0.3%",
+     "US CPI falls 0.4% m/m, below expectations of 0.3%"),
+    ("NFP ACTUAL 250K VS EST 180K", "NFP ACTUAL 90K VS EST 180K"),
+])
+def test_opposite_meaning_is_not_duplicate(detector, original, followup):
+    assert detector.check_and_add(original, 'a', now=0) is None
+    assert detector.check_and_add(followup, 'b', now=1) is None
+    assert detector.stats()['duplicates'] == 0
+
+
+def test_repost_is_duplicate(detector):
+    text = "BREAKING: Fed hikes rates by 25bp to 5.50%, as expected"
+    assert detector.check_and_add(text, 'a', now=0) is None
+    assert detector.check_and_add("Fed hikes rates by 25bp to 5.50%, as expected", 'b', now=10) == 'a'
+
+
+def test_window_expiry(detector):
+    text = "ECB leaves deposit rate unchanged at 4.00%"
+    detector.check_and_add(text, 'a', now=0)
+    assert detector.find_duplicate(text, now=3599) == 'a'
+    assert detector.find_duplicate(text, now=3601) is None
+    assert detector.stats()['window_size'] == 0
+
+
+def test_empty_text_is_never_duplicate(detector):
+    assert detector.check_and_add('', 'a', now=0) is None
+    assert detector.check_and_add('', 'b', now=0) is None
+
+
+def test_ttl_set_membership_and_expiry():
+    ids = TTLDedupSet(ttl_seconds=80, capacity=1000, num_buckets=8)
+    start = ids._bucket_started
+    ids.add('a', now=start)
+    ids.add('b', now=start + 45)
+    assert 'a' in ids and 'b' in ids and 'c' not in ids
+
+    # 'a' keluar setelah bucket-nya lebih tua dari TTL, 'b' masih di window
+    ids._rotate(start + 85)
+    assert 'b' in ids
+    assert ids.stats()['expired'] == 1
+
+
+def test_ttl_set_idle_longer_than_ttl_forgets_everything():
+    ids = TTLDedupSet(ttl_seconds=80, capacity=1000, num_buckets=8)
+    start = ids._bucket_started
+    ids.update(['a', 'b', 'c'])
+    ids._rotate(start + 1000)
+    assert len(ids) == 0
+    assert ids.stats()['expired'] == 3
+
+
+def test_ttl_set_memory_is_bounded():
+    ids = TTLDedupSet(ttl_seconds=3600, capacity=80, num_buckets=4)
+    now = ids._bucket_started
+    for i in range(1000):
+        ids.add(f"id-{i}", now=now)
+
+    stats = ids.stats()
+    assert stats['buckets'] <= 4
+    assert stats['memory_bytes'] <= stats['max_memory_bytes']
+    assert stats['evictions'] > 0
+    # ID terbaru selalu masih diingat
+    assert 'id-999' in ids
@@ -0,0 +1,25 @@
+import advanced_config
+from advanced_config import get_optimal_legs_for_currency, get_optimal_pairs_for_currency
+from pair_index import PairOrientationIndex
+
+
+def test_lookup_orientation():
+    index = PairOrientationIndex(['EURUSD', 'USDJPY', 'GBPUSD', 'EURUSD', 'XAU'])
+    assert index.lookup('USD', 'LONG') == (('EURUSD', 'SHORT'), ('GBPUSD', 'SHORT'), ('USDJPY', 'LONG'))
+    assert index.lookup('JPY', 'SHORT') == (('USDJPY', 'LONG'),)
+    assert index.lookup('CHF', 'LONG') == ()
+
+
+def test_optimal_pairs_keeps_pair_string_shape():
+    pairs = get_optimal_pairs_for_currency('EUR', 'LONG')
+    assert pairs[:3] == ['EURGBP', 'EURUSD', 'EURJPY']
+    assert [pair for pair, _ in get_optimal_legs_for_currency('EUR', 'LONG')] == pairs
+
+
+def test_optimal_pairs_uses_prebuilt_index(monkeypatch):
+    # Tidak ada index baru per call
+    monkeypatch.setattr(advanced_config, 'PairOrientationIndex', None)
+    broker = PairOrientationIndex(['EURUSD', 'USDJPY'])
+    assert get_optimal_pairs_for_currency('USD', 'SHORT', broker) == ['EURUSD', 'USDJPY']
+    assert get_optimal_legs_for_currency('USD', 'SHORT', broker) == [('EURUSD', 'LONG'), ('USDJPY', 'SHORT')]
+    assert get_optimal_legs_for_currency('USD', 'SHORT', PairOrientationIndex([])) == []
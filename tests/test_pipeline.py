@@ -0,0 +1,76 @@
+import asyncio
+
+from pipeline import Pipeline
+
+
+async def forever():
+    await asyncio.Event().wait()
+
+
+def test_normal_task_exit_keeps_pipeline_running(capsys):
+    async def main():
+        pipeline = Pipeline()
+        queue = pipeline.queue('items', maxsize=2)
+        handled = []
+
+        async def handler(item):
+            handled.append(item)
+
+        async def producer():
+            for i in range(5):
+                await queue.put(i)
+
+        pipeline.add_worker('consumer', queue, handler)
+        pipeline.add_task('producer', producer())
+        pipeline.add_task('stream', forever())
+
+        await asyncio.sleep(0.05)
+        stopped = pipeline._stopped.is_set()
+        dropped = await pipeline.shutdown()
+        return pipeline, handled, stopped, dropped
+
+    pipeline, handled, stopped, dropped = asyncio.run(main())
+    assert not stopped
+    assert handled == [0, 1, 2, 3, 4] and dropped == {}
+    assert pipeline.finished == ['producer']
+    assert 'Stage producer finished' in capsys.readouterr().out
+    assert 'producer: finished task' in pipeline.summary()
+
+
+def test_required_task_exit_stops_pipeline():
+    async def main():
+        pipeline = Pipeline()
+
+        async def source():
+            await asyncio.sleep(0.01)
+
+        pipeline.add_task('source', source(), required=True)
+        pipeline.add_task('stream', forever())
+        await asyncio.wait_for(pipeline.wait(), 1)
+        await pipeline.shutdown()
+
+    asyncio.run(main())
+
+
+def test_crash_stops_pipeline_and_worker_errors_do_not(capsys):
+    async def main():
+        pipeline = Pipeline()
+        queue = pipeline.queue('items')
+
+        async def handler(item):
+            raise ValueError(item)
+
+        async def crash():
+            await queue.put('bad')
+            await asyncio.sleep(0.01)
+            raise RuntimeError('boom')
+
+        pipeline.add_worker('consumer', queue, handler)
+        pipeline.add_task('crash', crash())
+        await asyncio.wait_for(pipeline.wait(), 1)
+        await pipeline.shutdown()
+        return pipeline.stats()
+
+    stats = asyncio.run(main())
+    assert stats['stages']['consumer']['errors'] == 1
+    assert 'Stage crash crashed' in capsys.readouterr().out
@@ -0,0 +1,144 @@
+import asyncio
+import time
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from mt5_gateway import MT5Gateway
+from position_book import PositionBook
+
+MAGIC = 234000
+NOW = int(time.time())
+
+
+def position(ticket, symbol, side, volume, profit, magic=MAGIC):
+    return SimpleNamespace(ticket=ticket, symbol=symbol, type=side, volume=volume, price_open=1.0,
+                           price_current=1.0, profit=profit, swap=-0.1, magic=magic)
+
+
+def deal(ticket, symbol, entry, profit, magic=MAGIC, deal_type=0, commission=-0.2):
+    return SimpleNamespace(ticket=ticket, symbol=symbol, type=deal_type, entry=entry, profit=profit,
+                           commission=commission, swap=0.0, fee=0.0, magic=magic, time=NOW + ticket)
+
+
+class FakeTerminal:
+    def __init__(self):
+        self.positions = []
+        self.deals = []
+        self.deal_requests = []
+        self.fail_positions = False
+
+    def positions_get(self):
+        return None if self.fail_positions else tuple(self.positions)
+
+    def history_deals_total(self, date_from, date_to):
+        return sum(1 for d in self.deals if d.time >= date_from)
+
+    def history_deals_get(self, date_from, date_to):
+        self.deal_requests.append((date_from, date_to))
+        return tuple(d for d in self.deals if d.time >= date_from)
+
+    def last_error(self):
+        return (-10004, 'No IPC connection')
+
+
+@pytest.fixture
+def terminal():
+    return FakeTerminal()
+
+
+@pytest.fixture
+def book(terminal):
+    gateway = MT5Gateway(terminal)
+    yield PositionBook(gateway, MAGIC)
+    gateway.close()
+
+
+def test_apply_deals_realized_and_closing_pnl():
+    book = PositionBook(None, MAGIC)
+    closed = book._apply_deals([
+        deal(3, 'EURUSD', 1, -4.0),
+        deal(1, 'EURUSD', 0, 0.0),
+        deal(2, 'GBPUSD', 0, 0.0, deal_type=1),
+        deal(4, 'GBPUSD', 1, 6.0, magic=1),        # EA lain
+        deal(5, '', 0, 1000.0, deal_type=2),       # balance deposit
+    ])
+    assert list(closed) == pytest.approx([-4.2])
+    assert dict(zip(book.symbols, book.realized)) == pytest.approx({'EURUSD': -4.4, 'GBPUSD': -0.2})
+    assert book.last_deal_ticket == 3
+
+    # Deals yang sudah dicatat tidak dihitung ulang
+    assert len(book._apply_deals([deal(3, 'EURUSD', 1, -4.0)])) == 0
+    assert book.realized_total == pytest.approx(-4.6)
+
+
+def test_by_currency_exposure_and_pnl():
+    book = PositionBook(None, MAGIC)
+    book.positions = book._positions_array([
+        position(1, 'EURUSD', 0, 0.1, 5.1),
+        position(2, 'USDJPY', 1, 0.2, -2.1),
+    ])
+    currency = dict(zip(book.currencies, zip(*book.by_currency().values())))
+    # (floating, realized, exposure)
+    assert currency['EUR'] == pytest.approx((5.0, 0.0, 0.1))
+    assert currency['USD'] == pytest.approx((2.8, 0.0, -0.3))
+    assert currency['JPY'] == pytest.approx((-2.2, 0.0, 0.2))
+
+
+def test_sync_is_incremental(terminal, book):
+    terminal.positions = [position(10, 'EURUSD', 0, 0.1, 1.0), position(99, 'EURUSD', 0, 1.0, 50, magic=7)]
+    terminal.deals = [deal(1, 'EURUSD', 0, 0.0)]
+
+    first = asyncio.run(book.sync())
+    assert first['opened'] == 1 and len(book.positions) == 1
+    assert book.daily_pnl == pytest.approx(0.9 - 0.2)
+
+    # Hanya profit berubah: tanpa history_deals_get
+    terminal.positions[0].profit = 3.0
+    asyncio.run(book.sync())
+    assert len(terminal.deal_requests) == 1
+    assert book.floating == pytest.approx(2.9)
+
+    terminal.positions = []
+    terminal.deals.append(deal(2, 'EURUSD', 1, 3.0))
+    closed = asyncio.run(book.sync())
+    assert closed['closed'] == 1 and list(closed['closed_pnl']) == pytest.approx([2.8])
+    assert book.daily_pnl == pytest.approx(2.6)
+
+    # Satu convention: kedua bound epoch seconds (int)
+    assert all(isinstance(bound, int) for request in terminal.deal_requests for bound in request)
+    assert terminal.deal_requests[-1][0] == terminal.deals[0].time
+
+
+def test_positions_get_failure_keeps_book(terminal, book, capsys):
+    terminal.positions = [position(10, 'EURUSD', 0, 0.1, 1.0)]
+    asyncio.run(book.sync())
+
+    terminal.fail_positions = True
+    assert asyncio.run(book.sync()) is None
+    assert list(book.positions['ticket']) == [10]
+    assert book.stats()['errors'] == 1
+    assert 'No IPC connection' in capsys.readouterr().out
+
+    terminal.fail_positions = False
+    assert asyncio.run(book.sync())['closed'] == 0
+
+
+def test_position_opened_and_closed_between_syncs(terminal, book):
+    terminal.positions = [position(10, 'EURUSD', 0, 0.1, 1.0)]
+    terminal.deals = [deal(1, 'EURUSD', 0, 0.0)]
+    asyncio.run(book.sync())
+    asyncio.run(book.sync())
+    assert len(terminal.deal_requests) == 1
+
+    # Ticket 11 dibuka & kena SL sebelum sync berikutnya: ticket set tidak berubah
+    terminal.deals += [deal(2, 'GBPUSD', 0, 0.0), deal(3, 'GBPUSD', 1, -5.0)]
+    changes = asyncio.run(book.sync())
+    assert changes['opened'] == 0 and changes['closed'] == 0
+    assert list(changes['closed_pnl']) == pytest.approx([-5.2])
+    assert book.realized_total == pytest.approx(-5.6)
+
+    # Tidak ada deal baru: kembali tanpa history_deals_get
+    asyncio.run(book.sync())
+    assert len(terminal.deal_requests) == 2
@@ -0,0 +1,182 @@
+import asyncio
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from calendar_diff import CalendarChange
+from forex_factory_scraper import ForexFactoryNewsScraper
+from release_poller import ReleasePoller
+
+
+def event(event_id, name, when, forecast='', previous='', actual=''):
+    return {
+        'id': event_id, 'date': when.strftime('%Y-%m-%d'),
+        'time': when.strftime('%I:%M%p').lstrip('0').lower(),
+        'currency': 'USD', 'impact': 'high', 'event': name,
+        'actual': actual, 'forecast': forecast, 'previous': previous
+    }
+
+
+@pytest.fixture
+def scraper():
+    return ForexFactoryNewsScraper()
+
+
+def test_events_without_values_are_not_pending(scraper):
+    release = datetime(2024, 3, 8, 8, 30, tzinfo=scraper.timezone)
+    scraper.differ.diff('2024-03-08', [
+        event('1', 'Fed Chair Powell Speaks', release),
+        event('2', '10-y Bond Auction', release, previous='4.21|2.5'),
+        event('3', 'Non-Farm Employment Change', release, forecast='180K', previous='150K'),
+    ])
+    assert [e['id'] for _, e in scraper.pending_releases('2024-03-08')] == ['2', '3']
+
+
+def test_speech_does_not_trigger_burst(scraper):
+    release = datetime.now(scraper.timezone).replace(second=0, microsecond=0)
+    scraper.differ.diff(scraper.today(), [event('1', 'Fed Chair Powell Speaks', release)])
+
+    async def on_changes(changes):
+        pass
+
+    poller = ReleasePoller(scraper, on_changes, idle_interval=60)
+    assert poller.next_release() is None
+
+    async def fake_changes(**kwargs):
+        return []
+
+    scraper.get_high_impact_changes = fake_changes
+
+    async def run_briefly():
+        task = asyncio.create_task(poller.run())
+        await asyncio.sleep(0.2)
+        poller.stop()
+        task.cancel()
+
+    asyncio.run(run_briefly())
+    assert poller.burst_polls == 0
+
+
+def test_feed_mode_refuses_poller():
+    # Weekly feed tidak punya actual: burst tidak akan pernah selesai
+    scraper = ForexFactoryNewsScraper(calendar_source='feed')
+
+    async def on_changes(changes):
+        pass
+
+    with pytest.raises(ValueError):
+        ReleasePoller(scraper, on_changes)
+
+
+class FakeScraper:
+    """pending_releases & get_high_impact_changes tanpa HTTP; actual muncul pada actual_at"""
+
+    def __init__(self, releases, actual_at=None):
+        self.timezone = ForexFactoryNewsScraper().timezone
+        self.releases = releases
+        self.actual_at = actual_at
+        self.clock = None
+        self.calls = []
+
+    def pending_releases(self, date=None):
+        if self.actual_at is not None and self.clock() >= self.actual_at:
+            return []
+        return [(release, {'id': str(i)}) for i, release in enumerate(self.releases)]
+
+    async def get_high_impact_changes(self, hours_ahead=2, revalidate=False, verbose=True):
+        self.calls.append((revalidate, self.clock()))
+        return []
+
+
+def make_poller(scraper, **kwargs):
+    async def on_changes(changes):
+        pass
+
+    poller = ReleasePoller(scraper, on_changes, **kwargs)
+    started = time.monotonic()
+    base = datetime(2024, 3, 8, 8, 29, 59, tzinfo=scraper.timezone)
+    poller._now = lambda: base + timedelta(seconds=time.monotonic() - started)
+    scraper.clock = poller._now
+    return poller, base
+
+
+def run_for(poller, seconds):
+    async def run():
+        task = asyncio.create_task(poller.run())
+        await asyncio.sleep(seconds)
+        poller.stop()
+        task.cancel()
+
+    asyncio.run(run())
+
+
+def test_next_release_skips_timed_out_releases():
+    scraper = FakeScraper([])
+    poller, base = make_poller(scraper, burst_timeout=60)
+    assert poller.next_release() is None
+
+    scraper.releases = [base - timedelta(seconds=90), base - timedelta(seconds=30), base + timedelta(minutes=5)]
+    assert poller.next_release() == base - timedelta(seconds=30)
+
+    scraper.releases = scraper.releases[:1]
+    assert poller.next_release() is None
+
+
+def test_idle_polling_without_releases():
+    scraper = FakeScraper([])
+    poller, _ = make_poller(scraper, idle_interval=0.05)
+    run_for(poller, 0.22)
+    assert 4 <= poller.polls <= 6
+    assert poller.burst_polls == 0
+    assert not any(revalidate for revalidate, _ in scraper.calls)
+
+
+def test_burst_starts_at_lead_and_stops_on_actual():
+    scraper = FakeScraper([])
+    poller, base = make_poller(scraper, idle_interval=60, lead_seconds=0.05, burst_interval=0.01,
+                               burst_timeout=5)
+    release = base + timedelta(seconds=0.1)
+    scraper.releases = [release]
+    scraper.actual_at = release + timedelta(seconds=0.05)
+    run_for(poller, 0.4)
+
+    # Idle poll saat start, lalu burst (revalidate) dari release - lead sampai actual muncul
+    assert scraper.calls[0][0] is False
+    bursts = [when for revalidate, when in scraper.calls if revalidate]
+    assert len(bursts) == poller.burst_polls == len(scraper.calls) - 1
+    assert release - timedelta(seconds=0.06) <= bursts[0] < release
+    assert scraper.actual_at <= bursts[-1] < scraper.actual_at + timedelta(seconds=0.05)
+
+
+def test_burst_times_out(capsys):
+    scraper = FakeScraper([])
+    poller, base = make_poller(scraper, idle_interval=60, lead_seconds=0, burst_interval=0.02,
+                               burst_timeout=0.1)
+    scraper.releases = [base]
+    run_for(poller, 0.3)
+    assert 'timed out' in capsys.readouterr().out
+    # Setelah timeout release ini tidak di-burst lagi
+    assert 3 <= poller.burst_polls <= 7
+    assert poller.next_release() is None
+
+
+def test_latency_only_for_actual_filled_while_watching():
+    scraper = ForexFactoryNewsScraper()
+    release = datetime.now(scraper.timezone).replace(second=0, microsecond=0)
+    late = event('1', 'CPI m/m', release, forecast='0.3%', actual='0.4%')
+    watched = event('2', 'Retail Sales m/m', release, forecast='0.2%')
+
+    changes = [
+        CalendarChange(CalendarChange.INSERT, late, {'actual': (None, '0.4%')}),
+        CalendarChange(CalendarChange.UPDATE, {**watched, 'actual': '0.5%'}, {'actual': ('', '0.5%')}),
+    ]
+
+    async def fake_changes(**kwargs):
+        return changes
+
+    scraper.get_high_impact_changes = fake_changes
+    poller, _ = make_poller(scraper)
+    asyncio.run(poller.poll())
+    assert [item['id'] for item in poller.latencies] == ['2']
+    assert poller.stats()['releases'] == 1
@@ -0,0 +1,27 @@
+import numpy as np
+
+from benchmark_sentiment import build_corpus
+from forex_ai_bot import EnhancedNewsAnalyzer
+from news_cache import SentimentCache
+
+FIELDS = ('sentiment_score', 'raw_score', 'signal', 'strength',
+          'bullish_keywords', 'bearish_keywords', 'affected_currencies')
+
+
+def test_analyze_batch_matches_analyze_sentiment():
+    analyzer = EnhancedNewsAnalyzer()
+    texts = build_corpus(300) + ['', 'Fed, USD & the dollar: crash? Euro rallies', 'Café — “euro” surges']
+    batch = analyzer.analyze_batch(texts)
+    for i, text in enumerate(texts):
+        single = analyzer.analyze_sentiment(text)
+        for field in FIELDS:
+            value = batch[field][i]
+            assert (value.item() if isinstance(value, np.generic) else value) == single[field]
+
+
+def test_analyze_batch_uses_cache():
+    analyzer = EnhancedNewsAnalyzer(cache=SentimentCache())
+    texts = ['Dollar surges after payrolls', 'Yen slumps', 'Dollar surges after payrolls']
+    first = analyzer.analyze_batch(texts)
+    assert list(analyzer.analyze_batch(texts)['raw_score']) == list(first['raw_score'])
+    assert analyzer.analyze_sentiment('Yen slumps')['raw_score'] == first['raw_score'][1]
@@ -0,0 +1,55 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+from benchmark_sentiment import build_corpus
+from forex_ai_bot import EnhancedNewsAnalyzer
+from news_cache import SentimentCache
+from sentiment_model import LinearSentimentModel, ModelNewsAnalyzer
+
+
+@pytest.fixture
+def analyzers(tmp_path):
+    keyword = EnhancedNewsAnalyzer(cache=SentimentCache())
+    corpus = build_corpus(200)
+    path = str(tmp_path / 'model.npz')
+    LinearSentimentModel.train(corpus, EnhancedNewsAnalyzer().analyze_batch(corpus)['sentiment_score'],
+                               n_features=2 ** 12).save(path)
+    return keyword, ModelNewsAnalyzer(path, keyword_analyzer=keyword)
+
+
+def test_same_return_contract_as_keyword_engine(analyzers):
+    keyword, model = analyzers
+    text = 'Dollar surges as Fed signals more hikes'
+    expected, result = keyword.analyze_sentiment(text), model.analyze_sentiment(text)
+    assert result.keys() == expected.keys()
+    assert {k: type(v) for k, v in result.items()} == {k: type(v) for k, v in expected.items()}
+    assert result['affected_currencies'] == ['USD']
+
+
+def test_results_go_through_shared_cache(analyzers):
+    keyword, model = analyzers
+    text = 'Euro slumps after ECB decision'
+    keyword_result = keyword.analyze_sentiment(text)
+    first = model.analyze_sentiment(text)
+    hits = keyword.cache.hits
+    assert model.analyze_sentiment(text) == first
+    assert keyword.cache.hits == hits + 1
+    # Keyword result di cache yang sama tidak tertukar
+    assert keyword.analyze_sentiment(text) == keyword_result
+
+
+def test_batch_matches_single_and_skips_cached(analyzers):
+    keyword, model = analyzers
+    texts = ['Yen tumbles', 'Sterling rallies on BOE', 'Yen tumbles']
+    single = model.analyze_sentiment(texts[0])
+    predicted = []
+    predict = model.model.predict
+    model.model.predict = lambda batch: predicted.append(list(batch)) or predict(batch)
+
+    batch = asyncio.run(model.analyze_batch_async(texts))
+    assert predicted == [['Sterling rallies on BOE']]
+    assert batch['raw_score'][0].item() == single['raw_score']
+    assert batch['raw_score'].dtype == np.int64
+    assert list(batch['signal']) == [model.analyze_sentiment(t)['signal'] for t in texts]
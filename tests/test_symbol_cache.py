@@ -0,0 +1,32 @@
+from types import SimpleNamespace
+
+from symbol_cache import SymbolSpec
+
+MODULE = SimpleNamespace(TRADE_ACTION_DEAL=1, ORDER_TIME_GTC=0, ORDER_FILLING_FOK=0,
+                         ORDER_FILLING_IOC=1, ORDER_FILLING_RETURN=2)
+
+
+def spec(volume_min=0.01, volume_max=100.0, volume_step=0.01):
+    info = SimpleNamespace(name='EURUSD', digits=5, point=0.00001, volume_min=volume_min,
+                           volume_max=volume_max, volume_step=volume_step, trade_stops_level=0,
+                           filling_mode=2, visible=True)
+    return SymbolSpec(info, MODULE)
+
+
+def test_normalize_volume_rounds_down_to_step():
+    assert spec().normalize_volume(0.017) == 0.01
+    assert spec(volume_min=0.1, volume_step=0.1).normalize_volume(0.35) == 0.3
+
+
+def test_normalize_volume_keeps_exact_minimum():
+    assert spec(volume_min=0.1, volume_step=0.1).normalize_volume(0.1) == 0.1
+
+
+def test_normalize_volume_rejects_below_broker_minimum():
+    # 0.01 lot tidak boleh dinaikkan ke 0.1 (10x risk)
+    assert spec(volume_min=0.1, volume_step=0.1).normalize_volume(0.01) is None
+    assert spec(volume_min=0.1, volume_step=0.01).normalize_volume(0.05) is None
+
+
+def test_normalize_volume_clamps_to_maximum():
+    assert spec(volume_max=50.0).normalize_volume(75.0) == 50.0
@@ -0,0 +1,131 @@
+import asyncio
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from telethon.tl.types import InputPeerChannel, PeerChannel
+
+from forex_ai_bot import TelegramNewsScaper
+
+
+class FakeClient:
+    """iter_messages dengan semantics Telethon (default newest first, reverse = oldest first dari min_id)"""
+
+    def __init__(self, history):
+        self.history = history
+        self.connected = True
+        self.requests = []
+
+    def is_connected(self):
+        return self.connected
+
+    async def iter_messages(self, channel, limit=None, min_id=0, reverse=False):
+        self.requests.append((channel, limit, min_id, reverse))
+        messages = [m for m in self.history.get(channel, []) if m.id > min_id]
+        messages.sort(key=lambda m: m.id, reverse=not reverse)
+        for message in messages[:limit]:
+            yield message
+
+    async def get_input_entity(self, channel):
+        return InputPeerChannel(channel_id=sorted(self.history).index(channel) + 1, access_hash=0)
+
+    async def __call__(self, request):
+        # GetPeerDialogsRequest: top message per peer
+        self.requests.append(('dialogs', len(request.peers)))
+        names = sorted(self.history)
+        dialogs = []
+        for item in request.peers:
+            history = self.history[names[item.peer.channel_id - 1]]
+            dialogs.append(SimpleNamespace(peer=PeerChannel(item.peer.channel_id),
+                                           top_message=max(m.id for m in history)))
+        return SimpleNamespace(dialogs=dialogs)
+
+
+def message(i, text=None):
+    return SimpleNamespace(id=i, text=f"post {i}" if text is None else text,
+                           date=datetime(2024, 1, 2, tzinfo=timezone.utc), views=0)
+
+
+@pytest.fixture
+def scraper(monkeypatch):
+    monkeypatch.setenv('TELEGRAM_CHANNELS', 'marketfeed')
+    monkeypatch.setenv('TELEGRAM_CATCHUP_LIMIT', '10')
+    monkeypatch.setenv('TELEGRAM_CATCHUP_MAX_PAGES', '3')
+    scraper = TelegramNewsScaper()
+    scraper.client = FakeClient({'marketfeed': [message(i) for i in range(1, 101)]})
+    return scraper
+
+
+def test_first_run_takes_latest_five(scraper):
+    messages = asyncio.run(scraper.catch_up())
+    assert [m['id'] for m in messages] == [100, 99, 98, 97, 96]
+    assert scraper.catch_up_ids['marketfeed'] == 100
+
+
+def test_gap_is_paged_forward_from_cursor(scraper):
+    scraper.catch_up_ids['marketfeed'] = 75
+    messages = asyncio.run(scraper.catch_up())
+    assert [m['id'] for m in messages] == list(range(76, 101))
+    assert all(request[3] for request in scraper.client.requests)
+    assert scraper.catch_up_ids['marketfeed'] == 100
+
+
+def test_long_backlog_is_not_dropped(scraper, capsys):
+    scraper.catch_up_ids['marketfeed'] = 40
+    first = asyncio.run(scraper.catch_up())
+    # 3 pages x 10: cursor hanya maju sampai id terakhir yang diterima
+    assert [m['id'] for m in first] == list(range(41, 71))
+    assert scraper.catch_up_ids['marketfeed'] == 70
+    assert 'backlog exceeds 30 messages' in capsys.readouterr().out
+    assert scraper._last_catch_up == 0.0
+
+    second = asyncio.run(scraper.catch_up())
+    assert [m['id'] for m in second] == list(range(71, 101))
+
+
+def test_cursor_passes_non_text_messages(scraper):
+    scraper.client.history['marketfeed'].append(message(101, text=''))
+    scraper.catch_up_ids['marketfeed'] = 100
+    assert asyncio.run(scraper.catch_up()) == []
+    assert scraper.catch_up_ids['marketfeed'] == 101
+
+
+def test_streamed_messages_are_skipped(scraper):
+    scraper.catch_up_ids['marketfeed'] = 95
+    scraper._streamed_ids['marketfeed'] = {97, 98}
+    messages = asyncio.run(scraper.catch_up())
+    assert [m['id'] for m in messages] == [96, 99, 100]
+    assert scraper._streamed_ids['marketfeed'] == set()
+
+
+def test_short_drop_between_polls_triggers_catch_up(scraper, capsys):
+    scraper.streaming = True
+    scraper.queue = asyncio.Queue()
+    scraper.catch_up_ids['marketfeed'] = 100
+    scraper.last_message_ids['marketfeed'] = 100
+    scraper._last_catch_up = float('inf')
+
+    # Tidak ada gap: hanya satu dialogs request, tanpa catch-up
+    assert asyncio.run(scraper.get_new_messages_from_all_channels()) == []
+    assert scraper.client.requests == [('dialogs', 1)]
+
+    # Posts 101-103 terlewat (push hilang), client sudah connected lagi saat poll
+    scraper.client.history['marketfeed'] += [message(i) for i in (101, 102, 103)]
+    messages = asyncio.run(scraper.get_new_messages_from_all_channels())
+    assert [m['id'] for m in messages] == [101, 102, 103]
+    assert 'missed updates on @marketfeed' in capsys.readouterr().out
+    assert scraper.catch_up_ids['marketfeed'] == 103
+
+
+def test_gap_check_is_batched(monkeypatch):
+    channels = [f'ch{i:03d}' for i in range(250)]
+    monkeypatch.setenv('TELEGRAM_CHANNELS', ','.join(channels))
+    monkeypatch.setenv('TELEGRAM_GAP_BATCH', '100')
+    scraper = TelegramNewsScaper()
+    scraper.client = FakeClient({channel: [message(1)] for channel in channels})
+    scraper.last_message_ids = {channel: 1 for channel in channels}
+    scraper.client.history['ch007'].append(message(2))
+
+    assert asyncio.run(scraper.detect_gaps()) == ['ch007']
+    assert scraper.client.requests == [('dialogs', 100), ('dialogs', 100), ('dialogs', 50)]
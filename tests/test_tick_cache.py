@@ -0,0 +1,74 @@
+import asyncio
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from mt5_gateway import MT5Gateway
+from tick_cache import TICK_DTYPE, TickCache, TickRing
+
+
+def ticks(start, n):
+    out = np.zeros(n, dtype=TICK_DTYPE)
+    out['time_msc'] = np.arange(start, start + n)
+    out['bid'] = 1.1 + out['time_msc'] * 1e-5
+    out['ask'] = out['bid'] + 2e-5
+    return out
+
+
+def test_ring_wraparound_keeps_latest_contiguous():
+    ring = TickRing(capacity=5)
+    ring.extend(ticks(0, 3))
+    ring.extend(ticks(3, 4))
+
+    window = ring.window()
+    assert list(window['time_msc']) == [2, 3, 4, 5, 6]
+    assert list(ring.window(2)['time_msc']) == [5, 6]
+    assert ring.latest()['time_msc'] == 6 and ring.last_time_msc == 6
+    assert ring.count == 5 and ring.total == 7
+    with pytest.raises(ValueError):
+        window['bid'][0] = 0.0
+
+
+def test_ring_batch_larger_than_capacity():
+    ring = TickRing(capacity=4)
+    ring.extend(ticks(0, 2))
+    ring.extend(ticks(2, 10))
+    assert list(ring.window()['time_msc']) == [8, 9, 10, 11]
+    assert ring.total == 12
+
+
+def test_ring_many_wraps_matches_tail():
+    ring = TickRing(capacity=7)
+    stream = ticks(0, 100)
+    for i in range(0, 100, 3):
+        ring.extend(stream[i:i + 3])
+    assert np.array_equal(ring.window(), stream[-7:])
+
+
+@pytest.fixture
+def fake_mt5():
+    calls = []
+
+    def copy_ticks_from(symbol, since, count, flags):
+        calls.append(symbol)
+        return ticks(1000, 3)
+
+    return SimpleNamespace(
+        COPY_TICKS_INFO=1, calls=calls, copy_ticks_from=copy_ticks_from,
+        symbol_info_tick=lambda symbol: SimpleNamespace(time=1, time_msc=1000, bid=1.1, ask=1.1002, flags=0)
+    )
+
+
+def test_poll_is_split_into_background_batches(fake_mt5):
+    gateway = MT5Gateway(fake_mt5)
+    cache = TickCache(gateway, capacity=16, batch_size=2)
+    cache.set_symbols(['EURUSD', 'GBPUSD', 'USDJPY', 'AUDUSD', 'USDCAD'])
+
+    added = asyncio.run(cache.poll())
+    gateway.close()
+
+    assert added == 15
+    assert gateway.stats()['functions']['collect_ticks']['calls'] == 3
+    assert cache.latest('USDCAD').time_msc == 1002
+    assert cache.is_fresh(5)
@@ -0,0 +1,246 @@
+"""
+Tick Cache
+Background tick collector dengan fixed-size NumPy ring buffer per symbol
+"""
+
+import asyncio
+import time
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+
+from mt5_gateway import PRIORITY_BACKGROUND
+
+
+TICK_DTYPE = np.dtype([('time_msc', 'i8'), ('bid', 'f8'), ('ask', 'f8'), ('flags', 'u4')])
+
+
+class Quote:
+    """Latest bid/ask satu symbol (atribut sama dengan mt5.symbol_info_tick: bid, ask, time_msc, flags)"""
+
+    __slots__ = ('symbol', 'time_msc', 'bid', 'ask', 'flags')
+
+    def __init__(self, symbol: str, time_msc: int, bid: float, ask: float, flags: int = 0):
+        self.symbol = symbol
+        self.time_msc = time_msc
+        self.bid = bid
+        self.ask = ask
+        self.flags = flags
+
+    @property
+    def spread(self) -> float:
+        return self.ask - self.bid
+
+    @property
+    def mid(self) -> float:
+        return (self.ask + self.bid) / 2
+
+    def __repr__(self) -> str:
+        return f"Quote({self.symbol!r}, bid={self.bid}, ask={self.ask}, time_msc={self.time_msc})"
+
+
+class TickRing:
+    """
+    Fixed-size ring buffer untuk ticks.
+
+    Storage 2x capacity dan setiap tick ditulis di dua posisi (i dan
+    i + capacity), jadi N ticks terakhir selalu satu slice contiguous:
+    window() return read-only view tanpa copy, latest() O(1).
+    """
+
+    __slots__ = ('capacity', '_buf', '_pos', 'count', 'total')
+
+    def __init__(self, capacity: int = 4096):
+        self.capacity = capacity
+        self._buf = np.zeros(2 * capacity, dtype=TICK_DTYPE)
+        self._pos = 0
+        self.count = 0
+        self.total = 0
+
+    def extend(self, ticks: np.ndarray):
+        """Append ticks (structured array dengan fields time_msc, bid, ask, flags)"""
+        n = len(ticks)
+        if n == 0:
+            return
+        if n > self.capacity:
+            ticks = ticks[-self.capacity:]
+            self.total += n - self.capacity
+            n = self.capacity
+
+        idx = (self._pos + np.arange(n)) % self.capacity
+        for field in TICK_DTYPE.names:
+            values = ticks[field]
+            column = self._buf[field]
+            column[idx] = values
+            column[idx + self.capacity] = values
+
+        self._pos = (self._pos + n) % self.capacity
+        self.count = min(self.count + n, self.capacity)
+        self.total += n
+
+    @property
+    def nbytes(self) -> int:
+        return self._buf.nbytes
+
+    @property
+    def last_time_msc(self) -> int:
+        return int(self._buf['time_msc'][self._pos + self.capacity - 1]) if self.count else 0
+
+    def latest(self) -> Optional[np.void]:
+        if not self.count:
+            return None
+        return self._buf[self._pos + self.capacity - 1]
+
+    def window(self, n: Optional[int] = None) -> np.ndarray:
+        """N ticks terakhir (oldest first), read-only view"""
+        n = self.count if n is None else min(n, self.count)
+        end = self._pos + self.capacity
+        view = self._buf[end - n:end]
+        view.flags.writeable = False
+        return view
+
+
+class TickCache:
+    """
+    Ring buffer per symbol, diisi oleh background task.
+
+    Setiap poll_interval semua symbols di-collect: copy_ticks_from sejak
+    tick terakhir (fallback symbol_info_tick), batch_size symbols per
+    MT5Gateway queue item dengan PRIORITY_BACKGROUND, jadi order request
+    hanya menunggu paling lama satu batch. Reads (latest, window, spread,
+    volatility) hanya membaca memory, tanpa terminal round-trip.
+    """
+
+    def __init__(self, gateway, capacity: int = 4096, poll_interval: float = 0.25,
+                 warmup_seconds: int = 60, batch_size: int = 8):
+        """
+        Initialize cache
+
+        Args:
+            gateway: MT5Gateway
+            capacity: Ticks per symbol
+            poll_interval: Detik antar collect
+            warmup_seconds: History yang di-load saat symbol pertama kali di-poll
+            batch_size: Symbols per gateway queue item
+        """
+        self.gateway = gateway
+        self.capacity = capacity
+        self.poll_interval = poll_interval
+        self.warmup_seconds = warmup_seconds
+        self.batch_size = max(1, batch_size)
+        self.rings: Dict[str, TickRing] = {}
+
+        self.running = False
+        self.last_poll = 0.0
+        self.polls = 0
+        self.errors = 0
+        self.poll_seconds = 0.0
+
+    def set_symbols(self, symbols: Iterable[str]):
+        """Universe yang di-collect (ring lama untuk symbol yang tetap dipertahankan)"""
+        self.rings = {symbol: self.rings.get(symbol) or TickRing(self.capacity) for symbol in symbols}
+
+    def collect_ticks(self, module, cursors: Dict[str, int]) -> Dict[str, np.ndarray]:
+        """Jalan di gateway thread: ticks baru per symbol (time_msc > cursor)"""
+        flags = getattr(module, 'COPY_TICKS_INFO', 1)
+        result = {}
+        for symbol, cursor in cursors.items():
+            if cursor:
+                since = cursor // 1000
+            else:
+                tick = module.symbol_info_tick(symbol)
+                if tick is None:
+                    continue
+                since = tick.time - self.warmup_seconds
+
+            ticks = module.copy_ticks_from(symbol, since, self.capacity, flags)
+            if ticks is None or len(ticks) == 0:
+                # Tanpa tick history (e.g. symbol baru di-select): cukup latest tick
+                tick = module.symbol_info_tick(symbol)
+                if tick is None or tick.time_msc <= cursor:
+                    continue
+                ticks = np.array([(tick.time_msc, tick.bid, tick.ask, tick.flags)], dtype=TICK_DTYPE)
+            else:
+                ticks = ticks[ticks['time_msc'] > cursor]
+
+            if len(ticks):
+                packed = np.empty(len(ticks), dtype=TICK_DTYPE)
+                for field in TICK_DTYPE.names:
+                    packed[field] = ticks[field]
+                result[symbol] = packed
+        return result
+
+    async def poll(self) -> int:
+        """Satu collect untuk semua symbols, return jumlah ticks baru"""
+        cursors = [(symbol, ring.last_time_msc) for symbol, ring in self.rings.items()]
+        started = time.perf_counter()
+        added = 0
+        for i in range(0, len(cursors), self.batch_size):
+            batches = await self.gateway.run(
+                self.collect_ticks, dict(cursors[i:i + self.batch_size]), priority=PRIORITY_BACKGROUND
+            )
+            for symbol, ticks in batches.items():
+                ring = self.rings.get(symbol)
+                if ring is not None:
+                    ring.extend(ticks)
+                    added += len(ticks)
+        self.poll_seconds += time.perf_counter() - started
+        self.polls += 1
+        self.last_poll = time.monotonic()
+        return added
+
+    async def run(self):
+        """Collector loop (jalankan sebagai asyncio task)"""
+        self.running = True
+        try:
+            while self.running:
+                started = time.monotonic()
+                try:
+                    await self.poll()
+                except Exception as e:
+                    self.errors += 1
+                    print(f"⚠️ Tick collector error: {e}")
+                await asyncio.sleep(max(0.0, self.poll_interval - (time.monotonic() - started)))
+        finally:
+            self.running = False
+
+    def stop(self):
+        self.running = False
+
+    def is_fresh(self, max_age: float) -> bool:
+        """Collector poll sukses dalam max_age detik terakhir"""
+        return self.last_poll > 0 and time.monotonic() - self.last_poll <= max_age
+
+    def latest(self, symbol: str) -> Optional[Quote]:
+        ring = self.rings.get(symbol)
+        tick = ring.latest() if ring is not None else None
+        if tick is None:
+            return None
+        return Quote(symbol, int(tick['time_msc']), float(tick['bid']), float(tick['ask']), int(tick['flags']))
+
+    def window(self, symbol: str, n: Optional[int] = None) -> np.ndarray:
+        """N ticks terakhir sebagai read-only structured view (time_msc, bid, ask, flags)"""
+        ring = self.rings.get(symbol)
+        return ring.window(n) if ring is not None else np.empty(0, dtype=TICK_DTYPE)
+
+    def spread(self, symbol: str) -> Optional[float]:
+        quote = self.latest(symbol)
+        return quote.spread if quote is not None else None
+
+    def volatility(self, symbol: str, n: int = 300) -> Optional[float]:
+        """Std dev log returns mid price di N ticks terakhir"""
+        ticks = self.window(symbol, n)
+        if len(ticks) < 3:
+            return None
+        mid = (ticks['bid'] + ticks['ask']) * 0.5
+        return float(np.std(np.diff(np.log(mid))))
+
+    def stats(self) -> Dict:
+        return {
+            'symbols': len(self.rings),
+            'ticks': sum(ring.total for ring in self.rings.values()),
+            'polls': self.polls,
+            'errors': self.errors,
+            'avg_poll_ms': round(self.poll_seconds / self.polls * 1000, 3) if self.polls else 0.0,
+            'memory_bytes': sum(ring.nbytes for ring in self.rings.values())
+        }